@@ -35,11 +35,19 @@ class Trig:
 
 
 class Loggamma:
-    params = [('gamma', 'lgamma', 'loggamma'), ('SciPy', 'Spycial')]
+    params = [
+        ('gamma', 'lgamma', 'loggamma', 'loggamma_small'),
+        ('SciPy', 'Spycial'),
+    ]
     param_names = ['Function', 'Library']
 
     def setup(self, name, library):
-        x = np.linspace(-1000, 1000, 100)
+        if name == 'loggamma_small':
+            # The region |Re(z)|, |Im(z)| <= 7 that the large grid
+            # below steps over
+            x = np.linspace(-7, 7, 100)
+        else:
+            x = np.linspace(-1000, 1000, 100)
         if name == 'gamma':
             self.x = x
             if library == 'SciPy':
@@ -85,6 +93,105 @@ class Erf:
         self.f(self.x)
 
 
+def _log_ndtr_masked(x):
+    # Python-level composition that switches to the asymptotic
+    # expansion where ndtr underflows.
+    res = np.empty_like(x)
+    small = x < -20
+    res[~small] = np.log(scipy_sc.ndtr(x[~small]))
+    xs = x[small]
+    res[small] = -0.5*xs**2 - np.log(-xs) - 0.5*np.log(2*np.pi)
+    return res
+
+
+class LogErf:
+    params = [('log_erfc', 'log_ndtr'), ('composed', 'SciPy', 'Spycial')]
+    param_names = ['Function', 'Implementation']
+
+    def setup(self, name, implementation):
+        self.x = np.linspace(-40, 40, 1000)
+        if implementation == 'Spycial':
+            self.f = getattr(sc, name)
+        elif name == 'log_erfc':
+            # SciPy has no log_erfc
+            self.f = lambda x: np.log(scipy_sc.erfc(x))
+        elif implementation == 'composed':
+            self.f = _log_ndtr_masked
+        else:
+            self.f = scipy_sc.log_ndtr
+
+    def time_log_erf(self, name, implementation):
+        self.f(self.x)
+
+
+class Ndtr:
+    params = [
+        ('ndtr', 'ndtri'),
+        ('float32', 'float64'),
+        ('composed', 'SciPy', 'Spycial', 'Spycial parallel'),
+    ]
+    param_names = ['Function', 'Type', 'Implementation']
+
+    def setup(self, name, typ, implementation):
+        if name == 'ndtr':
+            x = np.linspace(-10, 10, 1000000)
+            composed = lambda x: 0.5*sc.erfc(-x/np.sqrt(2))
+        else:
+            x = np.linspace(0, 1, 1000000)
+            composed = lambda p: np.sqrt(2)*sc.erfinv(2*p - 1)
+        self.x = x.astype(typ)
+        if implementation == 'composed':
+            self.f = composed
+        elif implementation == 'SciPy':
+            self.f = getattr(scipy_sc, name)
+        elif implementation == 'Spycial':
+            self.f = getattr(sc, name)
+        else:
+            self.f = getattr(sc, name + '_parallel')
+
+    def time_ndtr(self, name, typ, implementation):
+        self.f(self.x)
+
+
+class ErfDiff:
+    params = [('erf_diff', 'ndtr_diff'), ('composed', 'Spycial')]
+    param_names = ['Function', 'Implementation']
+
+    def setup(self, name, implementation):
+        rng = np.random.RandomState(1234)
+        self.a = rng.uniform(-10, 10, 100000)
+        self.b = self.a + rng.exponential(1.0, 100000)
+        if implementation == 'Spycial':
+            self.f = getattr(sc, name)
+        elif name == 'erf_diff':
+            self.f = lambda a, b: sc.erf(b) - sc.erf(a)
+        else:
+            self.f = lambda a, b: sc.ndtr(b) - sc.ndtr(a)
+
+    def time_erf_diff(self, name, implementation):
+        self.f(self.a, self.b)
+
+
+class ComplexErf:
+    params = [('wofz', 'erf', 'erfc', 'voigt_profile'), ('SciPy', 'Spycial')]
+    param_names = ['Function', 'Library']
+
+    def setup(self, name, library):
+        x = np.linspace(-10, 10, 100)
+        x, y = np.meshgrid(x, x)
+        if name == 'voigt_profile':
+            self.args = (x.ravel(), 1.0, np.abs(y.ravel()))
+        else:
+            self.args = ((x + 1j*y).ravel(),)
+        if library == 'SciPy':
+            self.f = getattr(scipy_sc, name)
+        else:
+            self.f = getattr(sc, name)
+
+    def time_complex_erf(self, name, library):
+        self.f(*self.args)
+
+
 class Erfinv:
     params = [('erfinv',), ('SciPy', 'Spycial')]
     param_names = ['Function', 'Library']
@@ -137,6 +244,34 @@ class ExponentialIntegrals:
         self.f(self.x)
 
 
+class ScaledFunctions:
+    params = [('erfcx', 'e1x', 'eix'), ('composed', 'SciPy', 'Spycial')]
+    param_names = ['Function', 'Implementation']
+
+    def setup(self, name, implementation):
+        if name == 'erfcx':
+            self.x = np.linspace(-25, 25, 1000)
+            composed = lambda x: np.exp(x*x)*sc.erfc(x)
+            scipy_f = scipy_sc.erfcx
+        elif name == 'e1x':
+            self.x = np.linspace(1e-8, 700, 1000)
+            composed = lambda x: np.exp(x)*sc.e1(x)
+            scipy_f = lambda x: np.exp(x)*scipy_sc.exp1(x)
+        else:
+            self.x = np.linspace(-700, 700, 1000)
+            composed = lambda x: np.exp(-x)*sc.ei(x)
+            scipy_f = lambda x: np.exp(-x)*scipy_sc.expi(x)
+        if implementation == 'composed':
+            self.f = composed
+        elif implementation == 'SciPy':
+            self.f = scipy_f
+        else:
+            self.f = getattr(sc, name)
+
+    def time_scaled_functions(self, name, implementation):
+        self.f(self.x)
+
+
 class GeneralizedExponentialIntegral:
     params = [
         (
@@ -181,3 +316,268 @@ class GeneralizedExponentialIntegral:
 
     def time_generalized_exponential_integral(self, name, library):
         self.f(*self.args)
+
+
+class DirichletExpectation:
+    params = [('composed', 'fused')]
+    param_names = ['Implementation']
+
+    def setup(self, implementation):
+        rng = np.random.RandomState(1234)
+        self.alpha = rng.gamma(1.0, size=(1000, 100))
+
+    def time_dirichlet_expectation(self, implementation):
+        if implementation == 'composed':
+            alpha = self.alpha
+            sc.digamma(alpha) - sc.digamma(alpha.sum(axis=-1))[:, None]
+        else:
+            sc.dirichlet_expectation(self.alpha)
+
+
+def _digamma_inv_newton(y):
+    # Python-level Newton iteration using SciPy for comparison.
+    x = np.where(y >= -2.22, np.exp(y) + 0.5, -1 / (y - scipy_sc.digamma(1)))
+    for _ in range(5):
+        x = x - (scipy_sc.digamma(x) - y) / scipy_sc.polygamma(1, x)
+    return x
+
+
+class DigammaInv:
+    params = [('digamma_inv',), ('SciPy', 'Spycial')]
+    param_names = ['Function', 'Library']
+
+    def setup(self, name, library):
+        self.x = np.linspace(-50, 50, 1000)
+        if library == 'SciPy':
+            self.f = _digamma_inv_newton
+        else:
+            self.f = sc.digamma_inv
+
+    def time_digamma_inv(self, name, library):
+        self.f(self.x)
+
+
+class Polygamma:
+    params = [('hurwitz_zeta', 'polygamma'), ('SciPy', 'Spycial')]
+    param_names = ['Function', 'Library']
+
+    def setup(self, name, library):
+        x = np.linspace(0.1, 100, 100)
+        if name == 'hurwitz_zeta':
+            s = np.linspace(1.5, 20, 20)
+            self.args = np.meshgrid(s, x)
+            if library == 'SciPy':
+                self.f = scipy_sc.zeta
+            else:
+                self.f = sc.hurwitz_zeta
+        else:
+            if library == 'SciPy':
+                self.f = scipy_sc.polygamma
+                dtype = np.int64
+            else:
+                self.f = sc.polygamma
+                dtype = np.uint64
+            n = np.arange(2, 20, dtype=dtype)
+            self.args = np.meshgrid(n, x)
+
+    def time_polygamma(self, name, library):
+        self.f(*self.args)
+
+
+class ZetaCriticalLine:
+    params = [('per-point', 'batch')]
+    param_names = ['Implementation']
+
+    def setup(self, implementation):
+        self.t = np.linspace(1e6, 1e6 + 100, 2000)
+
+    def time_zeta_critical_line(self, implementation):
+        if implementation == 'per-point':
+            sc.zeta(0.5 + 1j*self.t)
+        else:
+            sc.zeta_critical_line(self.t)
+
+
+class GammaProgression:
+    params = [('gamma', 'lgamma'), ('per-point', 'progression')]
+    param_names = ['Function', 'Implementation']
+
+    def setup(self, name, implementation):
+        self.x0 = np.linspace(0.1, 10, 1000)
+        self.n = 100
+        self.x = self.x0[:, None] + np.arange(self.n)
+        if implementation == 'per-point':
+            self.f = lambda: getattr(sc, name)(self.x)
+        else:
+            progression = getattr(sc, f'{name}_progression')
+            self.f = lambda: progression(self.x0, self.n)
+
+    def time_gamma_progression(self, name, implementation):
+        self.f()
+
+
+class Poch:
+    params = [('poch', 'gamma_ratio'), ('composed', 'SciPy', 'Spycial')]
+    param_names = ['Function', 'Implementation']
+
+    def setup(self, name, implementation):
+        a = np.linspace(0.1, 150, 1000)
+        x = np.linspace(-0.05, 20, 100)
+        self.args = np.meshgrid(a, x)
+        if name == 'poch':
+            if implementation == 'composed':
+                self.f = lambda a, x: sc.gamma(a + x)/sc.gamma(a)
+            elif implementation == 'SciPy':
+                self.f = scipy_sc.poch
+            else:
+                self.f = sc.poch
+        else:
+            self.args[1] += self.args[0]
+            if implementation == 'composed':
+                self.f = lambda a, b: sc.gamma(a)/sc.gamma(b)
+            elif implementation == 'SciPy':
+                self.f = lambda a, b: scipy_sc.gamma(a)/scipy_sc.gamma(b)
+            else:
+                self.f = sc.gamma_ratio
+
+    def time_poch(self, name, implementation):
+        self.f(*self.args)
+
+
+class Beta:
+    params = [('beta', 'lbeta', 'lbinom'), ('composed', 'SciPy', 'Spycial')]
+    param_names = ['Function', 'Implementation']
+
+    def setup(self, name, implementation):
+        a = np.logspace(-2, 8, 1000)
+        b = np.logspace(-2, 3, 100)
+        self.args = np.meshgrid(a, b)
+        if implementation == 'composed':
+            self.f = {
+                'beta': lambda a, b: np.exp(
+                    sc.lgamma(a) + sc.lgamma(b) - sc.lgamma(a + b)
+                ),
+                'lbeta': lambda a, b: (
+                    sc.lgamma(a) + sc.lgamma(b) - sc.lgamma(a + b)
+                ),
+                'lbinom': lambda n, k: (
+                    sc.lgamma(n + 1) - sc.lgamma(k + 1)
+                    - sc.lgamma(n - k + 1)
+                ),
+            }[name]
+        elif implementation == 'SciPy':
+            self.f = {
+                'beta': scipy_sc.beta,
+                'lbeta': scipy_sc.betaln,
+                'lbinom': lambda n, k: np.log(scipy_sc.binom(n, k)),
+            }[name]
+        else:
+            self.f = getattr(sc, name)
+
+    def time_beta(self, name, implementation):
+        self.f(*self.args)
+
+
+class LgammaSum:
+    params = [('lgamma_sum', 'lgamma_diff_sum'), ('composed', 'fused')]
+    param_names = ['Function', 'Implementation']
+
+    def setup(self, name, implementation):
+        rng = np.random.RandomState(1234)
+        self.x = rng.gamma(2.0, 50.0, size=(1000, 10000))
+        self.a = rng.gamma(1.0, size=1000)
+
+    def time_lgamma_sum(self, name, implementation):
+        x, a = self.x, self.a
+        if name == 'lgamma_sum':
+            if implementation == 'composed':
+                sc.lgamma(x).sum(axis=1)
+            else:
+                sc.lgamma_sum(x)
+        else:
+            if implementation == 'composed':
+                (sc.lgamma(x + a[:, None]) - sc.lgamma(x)).sum(axis=1)
+            else:
+                sc.lgamma_diff_sum(x, a)
+
+
+class LgammaDiff:
+    params = [('composed', 'SciPy', 'Spycial')]
+    param_names = ['Implementation']
+
+    def setup(self, implementation):
+        rng = np.random.RandomState(1234)
+        self.x = rng.gamma(2.0, 50.0, size=100000)
+        self.a = rng.gamma(1.0, size=100000)
+        if implementation == 'composed':
+            self.f = lambda x, a: sc.lgamma(x + a) - sc.lgamma(x)
+        elif implementation == 'SciPy':
+            self.f = lambda x, a: (
+                scipy_sc.gammaln(x + a) - scipy_sc.gammaln(x)
+            )
+        else:
+            self.f = sc.lgamma_diff
+
+    def time_lgamma_diff(self, implementation):
+        self.f(self.x, self.a)
+
+
+class Multigammaln:
+    params = [('loop', 'SciPy', 'Spycial')]
+    param_names = ['Implementation']
+
+    def setup(self, implementation):
+        self.d = 50
+        self.a = np.linspace(0.5*self.d, 100, 10000)
+
+    def time_multigammaln(self, implementation):
+        a, d = self.a, self.d
+        if implementation == 'loop':
+            res = 0.25*d*(d - 1)*np.log(np.pi)
+            for j in range(d):
+                res = res + sc.lgamma(a - 0.5*j)
+        elif implementation == 'SciPy':
+            # SciPy's multigammaln only accepts scalar d
+            scipy_sc.multigammaln(a, d)
+        else:
+            sc.multigammaln(a, d)
+
+
+class ComplexGamma:
+    params = [('gamma', 'rgamma'), ('composed', 'SciPy', 'Spycial')]
+    param_names = ['Function', 'Implementation']
+
+    def setup(self, name, implementation):
+        x = np.linspace(-7, 7, 300)
+        x, y = np.meshgrid(x, x)
+        self.z = x + 1j*y
+        sign = 1 if name == 'gamma' else -1
+        if implementation == 'composed':
+            self.f = lambda z: np.exp(sign*sc.loggamma(z))
+        elif implementation == 'SciPy':
+            self.f = getattr(scipy_sc, name)
+        else:
+            self.f = getattr(sc, name)
+
+    def time_complex_gamma(self, name, implementation):
+        self.f(self.z)
+
+
+class Digamma:
+    params = [('real', 'complex'), ('SciPy', 'Spycial')]
+    param_names = ['Type', 'Library']
+
+    def setup(self, typ, library):
+        x = np.linspace(-1000, 1000, 100)
+        if typ == 'real':
+            self.x = x
+        else:
+            x, y = np.meshgrid(x, x)
+            self.x = x + 1j*y
+        if library == 'SciPy':
+            self.f = scipy_sc.digamma
+        else:
+            self.f = sc.digamma
+
+    def time_digamma(self, typ, library):
+        self.f(self.x)
@@ -0,0 +1,27 @@
+"""Compute the Taylor coefficients of digamma around its positive root.
+
+The coefficients are
+
+    psi^(n)(x0)/n! = (-1)^(n + 1) zeta(n + 1, x0)
+
+for n = 24, 23, ..., 1, where x0 is the positive root of digamma.
+They are printed in the order expected by the polynomial evaluation
+routines.
+
+"""
+import mpmath
+
+
+def taylor_coefficients(N):
+    x0 = mpmath.findroot(mpmath.digamma, 1.46)
+    return [(-1)**(n + 1) * mpmath.zeta(n + 1, x0) for n in range(N, 0, -1)]
+
+
+def main():
+    with mpmath.workdps(50):
+        for value in taylor_coefficients(24):
+            mpmath.nprint(value, 20)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,36 @@
+"""Compute the positive nodes and weights of Gauss-Legendre quadrature.
+
+The rules are on [-1, 1] with N = 6, 12, 20, and 26 points. The
+nodes are the roots of the Legendre polynomial P_N, refined from
+NumPy's values with Newton's method, and the weights are
+
+    2/((1 - x**2) P_N'(x)**2).
+
+"""
+import mpmath
+import numpy as np
+
+
+def derivative(n, x):
+    return n*(x*mpmath.legendre(n, x) - mpmath.legendre(n - 1, x))/(x**2 - 1)
+
+
+def gauss_legendre(n):
+    nodes, _ = np.polynomial.legendre.leggauss(n)
+    nodes = [mpmath.findroot(lambda x: mpmath.legendre(n, x), x0)
+             for x0 in nodes[nodes > 0]]
+    weights = [2/((1 - x**2)*derivative(n, x)**2) for x in nodes]
+    return nodes, weights
+
+
+def main():
+    with mpmath.workdps(50):
+        for n in [6, 12, 20, 26]:
+            nodes, weights = gauss_legendre(n)
+            print(f'N = {n}')
+            for x, w in zip(nodes, weights):
+                print(mpmath.nstr(x, 25), mpmath.nstr(w, 25))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,24 @@
+"""Compute B[2j]/(2j)! for j = 1, ..., 12.
+
+The values are the coefficients of the Euler-Maclaurin tail used to
+evaluate the Hurwitz zeta function.
+
+"""
+import mpmath
+
+
+def euler_maclaurin_coefficients(N):
+    values = []
+    for j in range(1, N + 1):
+        values.append(mpmath.bernoulli(2 * j) / mpmath.factorial(2 * j))
+    return values
+
+
+def main():
+    with mpmath.workdps(50):
+        for value in euler_maclaurin_coefficients(12):
+            mpmath.nprint(value, 20)
+
+
+if __name__ == '__main__':
+    main()
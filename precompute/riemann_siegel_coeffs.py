@@ -0,0 +1,80 @@
+"""Compute the coefficients of the Riemann-Siegel remainder terms.
+
+The terms C_0, ..., C_4 are written in terms of derivatives of
+
+    Ψ(p) = cos(2π(p² - p - 1/16))/cos(2πp);
+
+see e.g. Edwards, "Riemann's Zeta Function", section 7.4. We expand
+Ψ in a Taylor series around p = 1/2 and assemble the C_k from the
+differentiated series. Even terms are even in x = p - 1/2 and odd
+terms are odd, so C_k is printed as a polynomial in y = x² (odd
+terms still need to be multiplied by x) in the reversed order
+expected by `_devalpoly`.
+
+"""
+import mpmath
+
+DEGREE = 100
+TOL = 1e-19
+
+
+def derivative(coeffs, k):
+    for _ in range(k):
+        coeffs = [i * coeffs[i] for i in range(1, len(coeffs))]
+    return coeffs
+
+
+def combine(terms):
+    n = max(len(coeffs) for _, coeffs in terms)
+    result = [mpmath.mpf(0)] * n
+    for weight, coeffs in terms:
+        for i, c in enumerate(coeffs):
+            result[i] += weight * c
+    return result
+
+
+def remainder_coefficients():
+    pi = mpmath.pi
+
+    def psi(p):
+        return mpmath.cos(2*pi*(p*p - p - mpmath.mpf(1)/16))/mpmath.cos(2*pi*p)
+
+    taylor = mpmath.taylor(psi, mpmath.mpf(1)/2, DEGREE)
+
+    def d(k):
+        return derivative(taylor, k)
+
+    return [
+        d(0),
+        combine([(-1/(96*pi**2), d(3))]),
+        combine([(1/(64*pi**2), d(2)), (1/(18432*pi**4), d(6))]),
+        combine([
+            (-1/(64*pi**2), d(1)),
+            (-1/(3840*pi**4), d(5)),
+            (-1/(5308416*pi**6), d(9)),
+        ]),
+        combine([
+            (1/(128*pi**2), d(0)),
+            (19/(24576*pi**4), d(4)),
+            (11/(5898240*pi**6), d(8)),
+            (1/(2038431744*pi**8), d(12)),
+        ]),
+    ]
+
+
+def main():
+    with mpmath.workdps(60):
+        for k, coeffs in enumerate(remainder_coefficients()):
+            parity = k % 2
+            # |x| <= 1/2, so drop terms that can't contribute
+            last = max(
+                i for i, c in enumerate(coeffs)
+                if abs(c) * mpmath.mpf(0.5)**i > TOL
+            )
+            print('C{}:'.format(k))
+            for i in range(last - (last - parity) % 2, -1, -2):
+                mpmath.nprint(coeffs[i], 20)
+
+
+if __name__ == '__main__':
+    main()
@@ -9,9 +9,28 @@ Gamma and related functions
    :toctree: generated
 
    gamma
+   rgamma
    lgamma
    loggamma
+   gamma_progression
+   lgamma_progression
+   lgamma_diff
+   multigammaln
+   lgamma_sum
+   lgamma_diff_sum
+   poch
+   gamma_ratio
+   beta
+   lbeta
+   lbinom
    digamma
+   trigamma
+   polygamma
+   digamma_inv
+   gamma_inv
+   lgamma_inv
+   dirichlet_expectation
+   dirichlet_expectation_exp
 
 Trigonometric functions
 -----------------------
@@ -30,8 +49,21 @@ Error function and related functions
 
    erf
    erfc
+   erfcx
+   erf_diff
+   log_erfc
+   ndtr
+   ndtr_parallel
+   ndtr_diff
+   log_ndtr
    erfinv
    erfcinv
+   ndtri
+   ndtri_parallel
+   wofz
+   voigt_profile
+   owens_t
+   bvn_cdf
 
 Exponential integral and related functions
 ------------------------------------------
@@ -40,16 +72,20 @@ Exponential integral and related functions
    :toctree: generated
 
    e1
+   e1x
    ei
+   eix
    en
 
-Riemann zeta function
----------------------
+Zeta functions
+--------------
 
 .. autosummary::
    :toctree: generated
 
    zeta
+   zeta_critical_line
+   hurwitz_zeta
 
 """
 # Hack to avoid trapping floating point errors in ufuncs
@@ -58,12 +94,43 @@ seterr(all='ignore')
 del seterr
 
 from .trig import sinpi, cospi
-from .gamma import gamma
-from .lgamma import lgamma, loggamma
-from .digamma import digamma
-from .erf import erf, erfc
-from .erfinv import erfinv, erfcinv
-from .zeta import zeta
-from .ei import ei
-from .e1 import e1
+from .gamma import gamma, rgamma, gamma_progression
+from .lgamma import (
+    lgamma,
+    loggamma,
+    lgamma_progression,
+    lgamma_diff,
+    multigammaln,
+    lgamma_sum,
+    lgamma_diff_sum,
+)
+from .digamma import (
+    digamma,
+    trigamma,
+    polygamma,
+    digamma_inv,
+    dirichlet_expectation,
+    dirichlet_expectation_exp,
+)
+from .poch import poch, gamma_ratio
+from .beta import beta, lbeta, lbinom
+from .gammainv import gamma_inv, lgamma_inv
+from .erf import (
+    erf,
+    erfc,
+    erfcx,
+    erf_diff,
+    log_erfc,
+    ndtr,
+    ndtr_parallel,
+    ndtr_diff,
+    log_ndtr,
+    wofz,
+    voigt_profile,
+)
+from .erfinv import erfinv, erfcinv, ndtri, ndtri_parallel
+from .bvn import owens_t, bvn_cdf
+from .zeta import zeta, zeta_critical_line, hurwitz_zeta
+from .ei import ei, eix
+from .e1 import e1, e1x
 from .en import en
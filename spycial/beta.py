@@ -0,0 +1,227 @@
+"""The Beta function and related functions.
+
+For positive arguments the three Gamma functions are combined into a
+single Lanczos approximation following Boost's `beta_imp`. Boost is:
+
+Copyright John Maddock 2006.
+
+Use, modification and distribution are subject to the
+Boost Software License, Version 1.0. (See accompanying file
+LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+
+"""
+from numba import njit, vectorize
+import numpy as np
+
+from . import settings
+from .constants import _e, _ε
+from .gamma import _dgamma
+from .lgamma import _lgamma, _lgamma_positive
+from .poch import _gamma_ratio_impl
+from .lanczos import _lanczos_g, _lanczos_sum_expg_scaled
+
+
+@njit('float64(float64, float64)', cache=settings.CACHE)
+def _beta_positive(a, b):
+    """Compute B(a, b) for a >= b > 0."""
+    c = a + b
+    if c < _ε:
+        return c/a/b
+    elif c == a and b < _ε:
+        return 1.0/b
+    elif b == 1.0:
+        return 1.0/a
+
+    # B(a, b) = S(a)S(b)/S(c) (agh/cgh)**(a - 1/2) (bgh/cgh)**b sqrt(e/bgh)
+    # where S is the scaled Lanczos sum. The two powers are combined
+    # into a single exponential with log(agh/cgh) = log1p(-b/cgh);
+    # raising the rounded ratios to large powers separately loses
+    # several digits.
+    bgh = b + _lanczos_g - 0.5
+    cgh = c + _lanczos_g - 0.5
+    res = (_lanczos_sum_expg_scaled(a)
+           *(_lanczos_sum_expg_scaled(b)/_lanczos_sum_expg_scaled(c)))
+    res *= np.exp((a - 0.5)*np.log1p(-b/cgh) + b*np.log(bgh/cgh))
+    res *= np.sqrt(_e/bgh)
+    return res
+
+
+@njit('float64(float64, float64)', cache=settings.CACHE)
+def _lbeta_positive(a, b):
+    """Compute log(B(a, b)) for a >= b > 0."""
+    c = a + b
+    if c < _ε:
+        return np.log(c) - np.log(a) - np.log(b)
+    elif c == a and b < _ε:
+        return -np.log(b)
+    elif b == 1.0:
+        return -np.log(a)
+
+    elif c < 4.0:
+        # lgamma uses rational approximations here that are accurate
+        # near its zeros at 1 and 2, where the Lanczos form below only
+        # has absolute accuracy.
+        return _lgamma_positive(a) + _lgamma_positive(b) - _lgamma_positive(c)
+
+    # The logarithm of the expression in `_beta_positive`
+    bgh = b + _lanczos_g - 0.5
+    cgh = c + _lanczos_g - 0.5
+    res = np.log(_lanczos_sum_expg_scaled(a)
+                 *(_lanczos_sum_expg_scaled(b)/_lanczos_sum_expg_scaled(c)))
+    res += (a - 0.5)*np.log1p(-b/cgh)
+    res += b*np.log(bgh/cgh)
+    res += 0.5*(1.0 - np.log(bgh))
+    return res
+
+
+@njit('float64(float64, float64)', cache=settings.CACHE)
+def _beta(a, b):
+    if np.isnan(a) or np.isnan(b):
+        return np.nan
+    elif a > 0.0 and b > 0.0:
+        if a < b:
+            a, b = b, a
+        if a == np.inf:
+            return 0.0
+        return _beta_positive(a, b)
+
+    # B(a, b) = Γ(a)Γ(b)/Γ(a + b); pair the finite Gamma function
+    # with a ratio so that the poles cancel where they should.
+    c = a + b
+    apole = a <= 0.0 and a == np.floor(a)
+    bpole = b <= 0.0 and b == np.floor(b)
+    cpole = c <= 0.0 and c == np.floor(c)
+    if (apole or bpole) and not cpole or apole and bpole:
+        return np.inf
+    elif apole:
+        return _dgamma(b)*_gamma_ratio_impl(a, c, -b)
+    else:
+        return _dgamma(a)*_gamma_ratio_impl(b, c, -a)
+
+
+@njit('float64(float64, float64)', cache=settings.CACHE)
+def _lbeta(a, b):
+    if np.isnan(a) or np.isnan(b):
+        return np.nan
+    elif a > 0.0 and b > 0.0:
+        if a < b:
+            a, b = b, a
+        if a == np.inf:
+            return -np.inf
+        return _lbeta_positive(a, b)
+
+    c = a + b
+    apole = a <= 0.0 and a == np.floor(a)
+    bpole = b <= 0.0 and b == np.floor(b)
+    cpole = c <= 0.0 and c == np.floor(c)
+    if (apole or bpole) and not cpole or apole and bpole:
+        return np.inf
+    elif apole:
+        return _lgamma(b) + np.log(np.abs(_gamma_ratio_impl(a, c, -b)))
+    elif bpole:
+        return _lgamma(a) + np.log(np.abs(_gamma_ratio_impl(b, c, -a)))
+    return _lgamma(a) + _lgamma(b) - _lgamma(c)
+
+
+@njit('float64(float64, float64)', cache=settings.CACHE)
+def _lbinom(n, k):
+    if k == 0.0 and not np.isnan(n):
+        return 0.0
+    return -np.log1p(n) - _lbeta(n - k + 1.0, k + 1.0)
+
+
+@vectorize(['float64(float64, float64)'], nopython=True, cache=settings.CACHE)
+def beta(a, b):
+    r"""The Beta function.
+
+    Defined as
+
+    .. math::
+
+        B(a, b) = \frac{\Gamma(a)\Gamma(b)}{\Gamma(a + b)}.
+
+    Parameters
+    ----------
+    a : array-like
+        Points on the real line
+    b : array-like
+        Points on the real line
+    out : ndarray, optional
+        Output array for the values of `beta` at `a` and `b`
+
+    Returns
+    -------
+    ndarray
+        Values of `beta` at `a` and `b`
+
+    See Also
+    --------
+    lbeta: Logarithm of the absolute value of the Beta function
+
+    """
+    return _beta(a, b)
+
+
+@vectorize(['float64(float64, float64)'], nopython=True, cache=settings.CACHE)
+def lbeta(a, b):
+    r"""Logarithm of the absolute value of the Beta function.
+
+    For positive arguments this is computed directly rather than as
+    ``lgamma(a) + lgamma(b) - lgamma(a + b)``, which suffers from
+    cancellation when `a` or `b` is large.
+
+    Parameters
+    ----------
+    a : array-like
+        Points on the real line
+    b : array-like
+        Points on the real line
+    out : ndarray, optional
+        Output array for the values of `lbeta` at `a` and `b`
+
+    Returns
+    -------
+    ndarray
+        Values of `lbeta` at `a` and `b`
+
+    See Also
+    --------
+    beta: The Beta function
+
+    """
+    return _lbeta(a, b)
+
+
+@vectorize(['float64(float64, float64)'], nopython=True, cache=settings.CACHE)
+def lbinom(n, k):
+    r"""Logarithm of the binomial coefficient.
+
+    Computes
+
+    .. math::
+
+        \log\binom{n}{k} = -\log(n + 1) - \log(B(n - k + 1, k + 1))
+
+    for real :math:`n > -1` and :math:`k`. The result is the logarithm
+    of the absolute value when the binomial coefficient is negative.
+
+    Parameters
+    ----------
+    n : array-like
+        Points on the real line
+    k : array-like
+        Points on the real line
+    out : ndarray, optional
+        Output array for the values of `lbinom` at `n` and `k`
+
+    Returns
+    -------
+    ndarray
+        Values of `lbinom` at `n` and `k`
+
+    See Also
+    --------
+    lbeta: Logarithm of the absolute value of the Beta function
+
+    """
+    return _lbinom(n, k)
@@ -0,0 +1,470 @@
+"""Owen's T function and the bivariate normal distribution.
+
+Owen's T function uses the six methods of [1], selected by region as
+in Boost, which is:
+
+Copyright Benjamin Sobotta 2012
+
+Use, modification and distribution are subject to the
+Boost Software License, Version 1.0. (See accompanying file
+LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+
+The bivariate normal distribution uses the Drezner-Wesolowsky
+integral with the quadrature rules and the expansion for |ρ| near 1
+of [2].
+
+References
+----------
+[1] Patefield and Tandy, "Fast and accurate calculation of Owen's T
+    function", Journal of Statistical Software, 2000.
+
+[2] Genz, "Numerical computation of rectangular bivariate and
+    trivariate normal and t probabilities", Statistics and
+    Computing, 2004.
+
+"""
+from numba import njit, vectorize
+import numpy as np
+
+from . import settings
+from .constants import _π, _sqrt2, _sqrtπ, _sqrt1_2
+from .erf import _erf_erfc, _ndtr
+
+# Upper bounds of the ranges of h and a used to select a method
+OWENS_T_HRANGE = np.array([
+    0.02, 0.06, 0.09, 0.125, 0.26, 0.4, 0.6, 1.6, 1.7, 2.33, 2.4,
+    3.36, 3.4, 4.8
+])
+OWENS_T_ARANGE = np.array([0.025, 0.09, 0.15, 0.36, 0.5, 0.9, 0.99999])
+# Code of the method to use for each range of a (rows) and h
+# (columns)
+OWENS_T_SELECT = np.array([
+    [0, 0, 1, 12, 12, 12, 12, 12, 12, 12, 12, 15, 15, 15, 8],
+    [0, 1, 1, 2, 2, 4, 4, 13, 13, 14, 14, 15, 15, 15, 8],
+    [1, 1, 2, 2, 2, 4, 4, 14, 14, 14, 14, 15, 15, 15, 9],
+    [1, 1, 2, 4, 4, 4, 4, 6, 6, 15, 15, 15, 15, 15, 9],
+    [1, 2, 2, 4, 4, 5, 5, 7, 7, 16, 16, 16, 11, 11, 10],
+    [1, 2, 4, 4, 4, 5, 5, 7, 7, 16, 16, 16, 11, 11, 11],
+    [1, 2, 3, 3, 5, 5, 7, 7, 16, 16, 16, 16, 16, 11, 11],
+    [1, 2, 3, 3, 5, 5, 17, 17, 17, 17, 16, 16, 16, 11, 11],
+])
+# Method and order of the series for each code
+OWENS_T_METHOD = np.array([
+    1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 3, 4, 4, 4, 4, 5, 6
+])
+OWENS_T_ORDER = np.array([
+    2, 3, 4, 5, 7, 10, 12, 18, 10, 20, 30, 0, 4, 7, 8, 20, 0, 0
+])
+# For h below this, T(h, a) with a > 1 is computed from Φ(h) - 1/2
+# rather than Φ(-h)
+OWENS_T_SMALLH = 0.67
+# Coefficients of the minimax approximation of 1/(1 + x**2) on
+# [-1, 1] in even powers of x, lowest first; see [1]
+OWENS_T_T3_COEFFS = np.array([
+    0.99999999999999987510, -0.99999999999988796462,
+    0.99999999998290743652, -0.99999999896282500134,
+    0.99999996660459362918, -0.99999933986272476760,
+    0.99999125611136965852, -0.99991777624463387686,
+    0.99942835555870132569, -0.99697311720723000295,
+    0.98751448037275303682, -0.95915857980572882813,
+    0.89246305511006708555, -0.76893425990463999675,
+    0.58893528468484693250, -0.38380345160440256652,
+    0.20317601701045299653, -0.82813631607004984866e-01,
+    0.24167984735759576523e-01, -0.44676566663971825242e-02,
+    0.39141169402373836468e-03
+])
+# Positive nodes and weights of Gauss-Legendre quadrature on [-1, 1]
+# with 26 points
+OWENS_T_T5_NODES = np.array([
+    0.05923009342931320709371858, 0.1768588203568901839690577,
+    0.2920048394859568951428354, 0.4030517551234863064810774,
+    0.5084407148245057176957031, 0.6066922930176180632319787,
+    0.6964272604199572648638139, 0.7763859488206788561929672,
+    0.8454459427884980187975071, 0.9026378619843070742176656,
+    0.9471590666617142501359153, 0.9783854459564709911005804,
+    0.9958857011456169290032170
+])
+OWENS_T_T5_WEIGHTS = np.array([
+    0.1183214152792622765163711, 0.1166604434852965820446625,
+    0.1133618165463196665494407, 0.1084718405285765906565794,
+    0.1020591610944254232384141, 0.09421380035591414846366488,
+    0.08504589431348523921044777, 0.07468414976565974588707580,
+    0.06327404632957483553945369, 0.05097582529714781199831990,
+    0.03796238329436276395030314, 0.02441785109263190878961583,
+    0.01055137261734300715565119
+])
+# Use the expansion of [2] for |ρ| above this
+BVN_RHO_EXPANSION = 0.925
+# Use 6, 12, or 20 point Gauss-Legendre quadrature for |ρ| below
+# these and above
+BVN_RHO_6_POINTS = 0.3
+BVN_RHO_12_POINTS = 0.75
+# Positive nodes and weights of Gauss-Legendre quadrature on [-1, 1]
+BVN_NODES_6 = np.array([
+    0.2386191860831969086305017, 0.6612093864662645136613996,
+    0.9324695142031520278123016
+])
+BVN_WEIGHTS_6 = np.array([
+    0.4679139345726910473898703, 0.3607615730481386075698335,
+    0.1713244923791703450402961
+])
+BVN_NODES_12 = np.array([
+    0.1252334085114689154724414, 0.3678314989981801937526915,
+    0.5873179542866174472967024, 0.7699026741943046870368938,
+    0.9041172563704748566784659, 0.9815606342467192506905491
+])
+BVN_WEIGHTS_12 = np.array([
+    0.2491470458134027850005624, 0.2334925365383548087608499,
+    0.2031674267230659217490645, 0.1600783285433462263346525,
+    0.1069393259953184309602547, 0.04717533638651182719461596
+])
+BVN_NODES_20 = np.array([
+    0.07652652113349733375464041, 0.2277858511416450780804962,
+    0.3737060887154195606725482, 0.5108670019508270980043641,
+    0.6360536807265150254528367, 0.7463319064601507926143051,
+    0.8391169718222188233945291, 0.9122344282513259058677524,
+    0.9639719272779137912676661, 0.9931285991850949247861224
+])
+BVN_WEIGHTS_20 = np.array([
+    0.1527533871307258506980843, 0.1491729864726037467878287,
+    0.1420961093183820513292983, 0.1316886384491766268984945,
+    0.1181945319615184173123774, 0.1019301198172404350367501,
+    0.08327674157670474872475814, 0.06267204833410906356950654,
+    0.04060142980038694133103995, 0.01761400713915211831186196
+])
+# Drop the second term of the expansion of [2] for h*k below this,
+# where it is negligible and exp(-h*k/2) starts to overflow
+BVN_EXPANSION_MINHK = -100.0
+
+
+@njit('float64(float64)', cache=settings.CACHE)
+def _owens_t_znorm1(x):
+    """Compute Φ(x) - 1/2."""
+    return 0.5*_erf_erfc(x*_sqrt1_2, False)
+
+
+@njit('float64(float64, float64, int64)', cache=settings.CACHE)
+def _owens_t1(h, a, m):
+    """Series in h of [1]."""
+    hs = -0.5*h*h
+    dhs = np.exp(hs)
+    aa = a*a
+    j = 1
+    jj = 1.0
+    aj = a/(2.0*_π)
+    dj = np.expm1(hs)
+    gj = hs*dhs
+    res = np.arctan(a)/(2.0*_π)
+    while True:
+        res += dj*aj/jj
+        if m <= j:
+            break
+        j += 1
+        jj += 2.0
+        aj *= aa
+        dj = gj - dj
+        gj *= hs/j
+    return res
+
+
+@njit('float64(float64, float64, int64, float64)', cache=settings.CACHE)
+def _owens_t2(h, a, m, ah):
+    """Series in a of [1]."""
+    maxii = 2*m + 1
+    hs = h*h
+    aa = -a*a
+    y = 1.0/hs
+    ii = 1
+    res = 0.0
+    vi = a*np.exp(-0.5*ah*ah)/(_sqrt2*_sqrtπ)
+    z = _owens_t_znorm1(ah)/h
+    while True:
+        res += z
+        if maxii <= ii:
+            break
+        z = y*(vi - ii*z)
+        vi *= aa
+        ii += 2
+    return res*np.exp(-0.5*hs)/(_sqrt2*_sqrtπ)
+
+
+@njit('float64(float64, float64, float64)', cache=settings.CACHE)
+def _owens_t3(h, a, ah):
+    """Series of [1] with a minimax approximation of the integrand."""
+    hs = h*h
+    aa = a*a
+    y = 1.0/hs
+    ii = 1
+    vi = a*np.exp(-0.5*ah*ah)/(_sqrt2*_sqrtπ)
+    zi = _owens_t_znorm1(ah)/h
+    res = 0.0
+    for i in range(OWENS_T_T3_COEFFS.shape[0]):
+        res += zi*OWENS_T_T3_COEFFS[i]
+        zi = y*(ii*zi - vi)
+        vi *= aa
+        ii += 2
+    return res*np.exp(-0.5*hs)/(_sqrt2*_sqrtπ)
+
+
+@njit('float64(float64, float64, int64)', cache=settings.CACHE)
+def _owens_t4(h, a, m):
+    """Series in a for h and a near 1 of [1]."""
+    maxii = 2*m + 1
+    hs = h*h
+    aa = -a*a
+    ii = 1
+    ai = a*np.exp(-0.5*hs*(1.0 - aa))/(2.0*_π)
+    yi = 1.0
+    res = 0.0
+    while True:
+        res += ai*yi
+        if maxii <= ii:
+            break
+        ii += 2
+        yi = (1.0 - hs*yi)/ii
+        ai *= aa
+    return res
+
+
+@njit('float64(float64, float64)', cache=settings.CACHE)
+def _owens_t5(h, a):
+    """Gauss-Legendre quadrature of the defining integral."""
+    aa = a*a
+    hs = -0.5*h*h
+    res = 0.0
+    for i in range(OWENS_T_T5_NODES.shape[0]):
+        r = 1.0 + aa*OWENS_T_T5_NODES[i]**2
+        res += OWENS_T_T5_WEIGHTS[i]*np.exp(hs*r)/r
+    return a*res/(2.0*_π)
+
+
+@njit('float64(float64, float64)', cache=settings.CACHE)
+def _owens_t6(h, a):
+    """Expansion around a = 1 of [1]."""
+    qh = _ndtr(-h)
+    y = 1.0 - a
+    r = np.arctan2(y, 1.0 + a)
+    res = 0.5*qh*(1.0 - qh)
+    if r != 0.0:
+        res -= r*np.exp(-0.5*y*h*h/r)/(2.0*_π)
+    return res
+
+
+@njit('float64(float64, float64, float64)', cache=settings.CACHE)
+def _owens_t_dispatch(h, a, ah):
+    """Compute T(h, a) for h >= 0 and 0 <= a <= 1 given ah = a*h."""
+    if h == 0.0:
+        return np.arctan(a)/(2.0*_π)
+    elif a == 0.0 or h == np.inf:
+        return 0.0
+    elif a == 1.0:
+        return 0.5*_ndtr(h)*_ndtr(-h)
+
+    ihint = OWENS_T_HRANGE.shape[0]
+    for i in range(OWENS_T_HRANGE.shape[0]):
+        if h <= OWENS_T_HRANGE[i]:
+            ihint = i
+            break
+    iaint = OWENS_T_ARANGE.shape[0]
+    for i in range(OWENS_T_ARANGE.shape[0]):
+        if a <= OWENS_T_ARANGE[i]:
+            iaint = i
+            break
+    code = OWENS_T_SELECT[iaint, ihint]
+    method = OWENS_T_METHOD[code]
+    m = OWENS_T_ORDER[code]
+    if method == 1:
+        return _owens_t1(h, a, m)
+    elif method == 2:
+        return _owens_t2(h, a, m, ah)
+    elif method == 3:
+        return _owens_t3(h, a, ah)
+    elif method == 4:
+        return _owens_t4(h, a, m)
+    elif method == 5:
+        return _owens_t5(h, a)
+    return _owens_t6(h, a)
+
+
+@njit('float64(float64, float64)', cache=settings.CACHE)
+def _owens_t(h, a):
+    if np.isnan(h) or np.isnan(a):
+        return np.nan
+
+    # T(-h, a) = T(h, a) and T(h, -a) = -T(h, a)
+    h = abs(h)
+    aa = abs(a)
+    if aa == np.inf:
+        res = 0.5*_ndtr(-h)
+    elif aa <= 1.0:
+        res = _owens_t_dispatch(h, aa, aa*h)
+    else:
+        # T(h, a) = (Φ(h) + Φ(ah))/2 - Φ(h)Φ(ah) - T(ah, 1/a) - 1/2
+        # for a > 1
+        ah = aa*h
+        if h <= OWENS_T_SMALLH:
+            res = 0.25 - _owens_t_znorm1(h)*_owens_t_znorm1(ah)
+        else:
+            qh = _ndtr(-h)
+            qah = _ndtr(-ah)
+            res = 0.5*(qh + qah) - qh*qah
+        res -= _owens_t_dispatch(ah, 1.0/aa, h)
+    return -res if a < 0.0 else res
+
+
+@njit('float64(float64, float64, float64)', cache=settings.CACHE)
+def _bvn_upper(h, k, r):
+    """Compute P(X > h, Y > k) for finite h and k; see [2]."""
+    if abs(r) < BVN_RHO_6_POINTS:
+        nodes = BVN_NODES_6
+        weights = BVN_WEIGHTS_6
+    elif abs(r) < BVN_RHO_12_POINTS:
+        nodes = BVN_NODES_12
+        weights = BVN_WEIGHTS_12
+    else:
+        nodes = BVN_NODES_20
+        weights = BVN_WEIGHTS_20
+
+    hk = h*k
+    res = 0.0
+    if abs(r) < BVN_RHO_EXPANSION:
+        # Integrate the derivative with respect to ρ from 0, where
+        # the probability is Φ(-h)Φ(-k), after substituting
+        # ρ = sin(θ)
+        hs = 0.5*(h*h + k*k)
+        asr = np.arcsin(r)
+        for i in range(nodes.shape[0]):
+            for sign in (-1.0, 1.0):
+                sn = np.sin(0.5*asr*(1.0 + sign*nodes[i]))
+                res += weights[i]*np.exp((sn*hk - hs)/(1.0 - sn*sn))
+        return res*asr/(4.0*_π) + _ndtr(-h)*_ndtr(-k)
+
+    # Integrate from |ρ| = 1, subtracting the first terms of an
+    # expansion of the integrand to remove its singularity there
+    if r < 0.0:
+        k = -k
+        hk = -hk
+    if abs(r) < 1.0:
+        aa = (1.0 - r)*(1.0 + r)
+        a = np.sqrt(aa)
+        bs = (h - k)**2
+        c = (4.0 - hk)/8.0
+        d = (12.0 - hk)/16.0
+        res = (a*np.exp(-0.5*(bs/aa + hk))
+               * (1.0 - c*(bs - aa)*(1.0 - d*bs/5.0)/3.0
+                  + c*d*aa*aa/5.0))
+        if hk > BVN_EXPANSION_MINHK:
+            b = np.sqrt(bs)
+            res -= (np.exp(-0.5*hk)*_sqrt2*_sqrtπ*_ndtr(-b/a)*b
+                    * (1.0 - c*bs*(1.0 - d*bs/5.0)/3.0))
+        a *= 0.5
+        for i in range(nodes.shape[0]):
+            for sign in (-1.0, 1.0):
+                xs = (a*(1.0 + sign*nodes[i]))**2
+                rs = np.sqrt(1.0 - xs)
+                asr = -0.5*(bs/xs + hk)
+                res += a*weights[i]*(
+                    np.exp(asr - 0.5*hk*xs/(1.0 + rs)**2)/rs
+                    - np.exp(asr)*(1.0 + c*xs*(1.0 + d*xs))
+                )
+        res = -res/(2.0*_π)
+
+    if r > 0.0:
+        return res + _ndtr(-max(h, k))
+    res = -res
+    if k > h:
+        if h < 0.0:
+            res += _ndtr(k) - _ndtr(h)
+        else:
+            res += _ndtr(-h) - _ndtr(-k)
+    return res
+
+
+@njit('float64(float64, float64, float64)', cache=settings.CACHE)
+def _bvn_cdf(x, y, rho):
+    if np.isnan(x) or np.isnan(y) or np.isnan(rho):
+        return np.nan
+    elif abs(rho) > 1.0:
+        return np.nan
+    elif x == -np.inf or y == -np.inf:
+        return 0.0
+    elif x == np.inf:
+        return _ndtr(y)
+    elif y == np.inf:
+        return _ndtr(x)
+    # P(X <= x, Y <= y) = P(X > -x, Y > -y) by symmetry
+    return _bvn_upper(-x, -y, rho)
+
+
+@vectorize(['float64(float64, float64)'], nopython=True, cache=settings.CACHE)
+def owens_t(h, a):
+    r"""Owen's T function.
+
+    Defined as
+
+    .. math::
+
+        T(h, a) = \frac{1}{2\pi}
+        \int_0^a \frac{e^{-h^2(1 + x^2)/2}}{1 + x^2} dx.
+
+    It gives the probability of the event :math:`X > h` and
+    :math:`0 < Y < aX` for independent standard normal random
+    variables :math:`X` and :math:`Y`.
+
+    Parameters
+    ----------
+    h : array-like
+        Points on the real line
+    a : array-like
+        Points on the real line
+    out : ndarray, optional
+        Output array for the values of `owens_t` at `h` and `a`
+
+    Returns
+    -------
+    ndarray
+        Values of `owens_t` at `h` and `a`
+
+    See Also
+    --------
+    bvn_cdf: Bivariate normal distribution function
+
+    """
+    return _owens_t(h, a)
+
+
+@vectorize(
+    ['float64(float64, float64, float64)'],
+    nopython=True,
+    cache=settings.CACHE,
+)
+def bvn_cdf(x, y, rho):
+    r"""Bivariate normal distribution function.
+
+    Computes :math:`P(X \le x, Y \le y)` for standard normal random
+    variables :math:`X` and :math:`Y` with correlation `rho`.
+
+    Parameters
+    ----------
+    x : array-like
+        Points on the real line
+    y : array-like
+        Points on the real line
+    rho : array-like
+        Correlation coefficients in [-1, 1]
+    out : ndarray, optional
+        Output array for the values of `bvn_cdf` at `x`, `y`, and
+        `rho`
+
+    Returns
+    -------
+    ndarray
+        Values of `bvn_cdf` at `x`, `y`, and `rho`
+
+    See Also
+    --------
+    ndtr: Normal distribution function
+    owens_t: Owen's T function
+
+    """
+    return _bvn_cdf(x, y, rho)
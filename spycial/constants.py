@@ -6,6 +6,7 @@ _π = 3.141592653589793238462643
 _2π = 6.283185307179586476925284
 _2πj = 6.283185307179586476925284j
 _logπ = 1.144729885849400174143426
+_sqrtπ = 1.772453850905516027298167  # √π
 _log2π_2 = 0.91893853320467274178  # log(2π)/2
 sqrt_2_π = 0.79788456080286535588  # √(2/π)
 _2πe = 17.07946844534713413093
@@ -14,6 +15,10 @@ _2πe = 17.07946844534713413093
 
 _e = 2.718281828459045235360288
 
+_log2 = 0.6931471805599453094172321
+_sqrt2 = 1.414213562373095048801689  # √2
+_sqrt1_2 = 0.7071067811865475244008444  # √(1/2)
+
 # Numbers related to the Euler-Mascheroni constant
 
 _γ = 0.5772156649015328655494272
@@ -12,12 +12,17 @@ Boost Software License, Version 1.0. (See accompanying file
 LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
 
 """
-from numba import njit, vectorize
+import numba
+from numba import njit, generated_jit, vectorize, guvectorize
 import numpy as np
 
 from . import settings
-from .constants import _π
-from .evalpoly import _devalpoly
+from .constants import _π, _γ, _ε, _MAXEXP
+from .evalpoly import _devalpoly, _cevalpoly
+from .trig import _dsinpi, _dcospi, _csinpi, _ccospi
+from .gamma import _dgamma
+from .lgamma import _lgamma
+from .zeta import _hurwitz_zeta
 
 # Harmonic numbers minus the Euler-Mascheroni constant
 HARMONIC = np.array([
@@ -43,6 +48,62 @@ ASYMP = np.array([
     8.33333333333333333333E-2
 ])
 
+# B[2k] for k = 9, 8, ..., 1, where B[2k] is the (2k)th Bernoulli
+# number. Used in the asymptotic series for trigamma.
+TRIGAMMA_ASYMP = np.array([
+    54.97117794486215538847118,
+    -7.092156862745098039215686,
+    1.166666666666666666666667,
+    -0.2531135531135531135531136,
+    7.575757575757575757575758E-2,
+    -3.333333333333333333333333E-2,
+    2.380952380952380952380952E-2,
+    -3.333333333333333333333333E-2,
+    0.1666666666666666666666667
+])
+
+# Taylor coefficients psi^(n)(x0)/n! for n = 24, 23, ..., 1 around the
+# positive root x0 of digamma; see
+# precompute/digamma_root_taylor_coeffs.py.
+ROOT_TAYLOR = np.array([
+    -0.000075691795821950659192,
+    0.00011063372768747410904,
+    -0.00016170622091974803449,
+    0.00023635601564027052792,
+    -0.00034546802510630769956,
+    0.00050495326583460203518,
+    -0.00073807093899600512957,
+    0.0010788252019162965807,
+    -0.0015769367714301972593,
+    0.0023051263267349278369,
+    -0.0033698016554393280828,
+    0.0049267813957298534464,
+    -0.007204534386356868241,
+    0.010538791616612175388,
+    -0.015424765904948959139,
+    0.02259764823221810466,
+    -0.033161126474847359292,
+    0.048804288164143107225,
+    -0.072199561256454710926,
+    0.10782405069126236576,
+    -0.1639427054424065275,
+    0.25849976095565101062,
+    -0.44276316898359210609,
+    0.96767224544762117043
+])
+# Use the Taylor series within this distance of the positive root
+ROOT_RADIUS = 0.25
+# Shift complex arguments until their modulus is at least this before
+# using the asymptotic series
+CASYMP_MIN = 10.0
+# Beyond this imaginary part cot(πz) is ∓i to double precision
+COT_MAXIMAG = 20.0
+
+# The positive root of digamma split into three parts
+ROOT1 = 1569415565.0/1073741824.0
+ROOT2 = (381566830.0/1073741824.0)/1073741824.0
+ROOT3 = 0.9016312093258695918615325266959189453125e-19
+
 RAT_NUM = np.array([
     -0.0020713321167745952,
     -0.045251321448739056,
@@ -79,20 +140,16 @@ def _digamma_rational(x):
 
     """
     Y = np.float32(0.99558162689208984)
-    root1 = 1569415565.0/1073741824.0
-    root2 = (381566830.0/1073741824.0)/1073741824.0
-    root3 = 0.9016312093258695918615325266959189453125e-19
-
-    g = x - root1
-    g -= root2
-    g -= root3
+    g = x - ROOT1
+    g -= ROOT2
+    g -= ROOT3
     r = _devalpoly(RAT_NUM, x - 1.0)/_devalpoly(RAT_DENOM, x - 1.0)
 
     return g*Y + g*r
 
 
 @njit('float64(float64)', cache=settings.CACHE)
-def _digamma(x):
+def _ddigamma(x):
     res = 0.0
 
     if np.isnan(x) or x == np.inf:
@@ -138,21 +195,400 @@ def _digamma(x):
     return res
 
 
-@vectorize(['float64(float64)'], nopython=True, cache=settings.CACHE)
-def digamma(x):
+@njit('complex128(complex128)', cache=settings.CACHE)
+def _cdigamma(z):
+    """Compute digamma for complex arguments.
+
+    Uses a Taylor series around the positive root, reflection into
+    the right half-plane, the recurrence relation to move away from
+    the origin and then the asymptotic series, as in `_cloggamma`.
+
+    """
+    if np.isnan(z.real) or np.isnan(z.imag):
+        return np.complex(np.nan, np.nan)
+    elif z.imag == 0.0:
+        x = _ddigamma(z.real)
+        if np.isnan(x):
+            return np.complex(np.nan, np.nan)
+        return np.complex(x, 0.0)
+
+    h = z - ROOT1
+    h -= ROOT2
+    h -= ROOT3
+    if abs(h) < ROOT_RADIUS:
+        return h*_cevalpoly(ROOT_TAYLOR, h)
+
+    res = np.complex(0.0, 0.0)
+    if z.real < 0.5:
+        # Reflection formula ψ(z) = ψ(1 - z) - πcot(πz)
+        if abs(z.imag) < COT_MAXIMAG:
+            res -= _π*_ccospi(z)/_csinpi(z)
+        else:
+            res -= np.complex(0.0, -np.copysign(_π, z.imag))
+        z = 1.0 - z
+
+    while abs(z) < CASYMP_MIN:
+        res -= 1.0/z
+        z += 1.0
+
+    w = 1.0/(z*z)
+    res += np.log(z) - 0.5/z - w*_cevalpoly(ASYMP, w)
+    return res
+
+
+@generated_jit(nopython=True, cache=settings.CACHE)
+def _digamma(a):
+    if a == numba.types.float64:
+        return lambda a: _ddigamma(a)
+    elif a == numba.types.complex128:
+        return lambda a: _cdigamma(a)
+
+
+@njit('float64(float64)', cache=settings.CACHE)
+def _trigamma(x):
+    """Compute the trigamma function ψ'(x).
+
+    Negative arguments are handled with the reflection formula
+
+    ψ'(1 - x) + ψ'(x) = π²/sin²(πx),
+
+    and positive arguments are shifted up to x ≥ 10 with the
+    recurrence ψ'(x) = ψ'(x + 1) + 1/x² before using the asymptotic
+    series (DLMF 5.15.8).
+
+    """
+    res = 0.0
+
+    if np.isnan(x) or x == np.inf:
+        return 1.0/x
+    elif x == -np.inf:
+        return np.nan
+    elif x == 0.0:
+        # Double pole where ψ' tends to +∞ from both sides
+        return np.inf
+    elif x < 0.0:
+        if x == np.floor(x):
+            return np.nan
+        s = _dsinpi(x)
+        res = _π*_π/(s*s)
+        return res - _trigamma(1.0 - x)
+
+    while x < 10.0:
+        res += 1.0/x/x
+        x += 1.0
+
+    if x < 1.0e17:
+        rx = 1.0/x
+        z = rx*rx
+        res += rx + 0.5*z + rx*z*_devalpoly(TRIGAMMA_ASYMP, z)
+    else:
+        res += 1.0/x
+    return res
+
+
+@njit('float64(uint64, float64)', cache=settings.CACHE)
+def _cot_derivative(n, x):
+    """Compute the nth derivative of cot(θ) at θ = πx.
+
+    The derivative is a polynomial in c = cot(θ): starting from
+    P_0(c) = c we have P_{k + 1}(c) = -(1 + c²)P_k'(c).
+
+    """
+    coeffs = np.zeros(n + 2)
+    coeffs[1] = 1.0
+    for k in range(n):
+        # Differentiate in place, then multiply by -(1 + c²). P_k has
+        # degree k + 1 and P_{k + 1} has degree k + 2.
+        for j in range(k + 1):
+            coeffs[j] = (j + 1)*coeffs[j + 1]
+        coeffs[k + 1] = 0.0
+        for j in range(k + 2, 1, -1):
+            coeffs[j] = -(coeffs[j] + coeffs[j - 2])
+        coeffs[1] = -coeffs[1]
+        coeffs[0] = -coeffs[0]
+
+    c = _dcospi(x)/_dsinpi(x)
+    res = coeffs[n + 1]
+    for j in range(n, -1, -1):
+        res = res*c + coeffs[j]
+    return res
+
+
+@njit('float64(uint64, float64)', cache=settings.CACHE)
+def _polygamma(n, x):
+    if n == 0:
+        return _ddigamma(x)
+    elif n == 1:
+        return _trigamma(x)
+    elif np.isnan(x):
+        return x
+    elif x == np.inf:
+        return 0.0
+    elif x == -np.inf:
+        return np.nan
+    elif x == 0.0:
+        # Pole of order n + 1
+        if n % 2 == 1:
+            return np.inf
+        return np.copysign(np.inf, -x)
+    elif x < 0.0:
+        if x == np.floor(x):
+            return np.nan
+        # Reflection formula (DLMF 5.15.6)
+        res = -_π**(n + 1)*_cot_derivative(n, x)
+        if n % 2 == 0:
+            return res + _polygamma(n, 1.0 - x)
+        else:
+            return res - _polygamma(n, 1.0 - x)
+
+    # DLMF 25.11.12; the Hurwitz zeta function takes care of moving x
+    # up to where the asymptotic expansion is valid.
+    sign = 1.0 if n % 2 == 1 else -1.0
+    fac = _dgamma(n + 1.0)
+    z = _hurwitz_zeta(n + 1.0, x)
+    if fac == np.inf and z != np.inf:
+        if z == 0.0:
+            return sign*0.0
+        return sign*np.exp(_lgamma(n + 1.0) + np.log(z))
+    return sign*fac*z
+
+
+@njit('float64(float64)', cache=settings.CACHE)
+def _digamma_inv(y):
+    """Invert digamma on the principal branch x > 0.
+
+    The initial guess is from [1] and is then refined with Newton's
+    method.
+
+    References
+    ----------
+    [1] Minka, "Estimating a Dirichlet distribution", 2000.
+
+    """
+    if np.isnan(y):
+        return y
+    elif y > _MAXEXP:
+        # For large x, ψ(x) ~ log(x), so the result overflows
+        return np.inf
+    elif y == -np.inf:
+        return 0.0
+
+    if y >= -2.22:
+        x = np.exp(y) + 0.5
+    else:
+        x = -1.0/(y + _γ)
+
+    for _ in range(20):
+        dx = (_ddigamma(x) - y)/_trigamma(x)
+        x -= dx
+        if abs(dx) <= _ε*abs(x):
+            break
+    return x
+
+
+@vectorize(
+    ['float64(float64)', 'complex128(complex128)'],
+    nopython=True,
+    cache=settings.CACHE,
+)
+def digamma(z):
     """Digamma function.
 
     Parameters
     ----------
+    z : array-like
+        Points on the real line or complex plane
+    out : ndarray, optional
+        Output array for the values of `digamma` at `z`
+
+    Returns
+    -------
+    ndarray
+        Values of `digamma` at `z`
+
+    """
+    return _digamma(z)
+
+
+@vectorize(['float64(float64)'], nopython=True, cache=settings.CACHE)
+def trigamma(x):
+    r"""Trigamma function :math:`\psi'(x)`.
+
+    Parameters
+    ----------
+    x : array-like
+        Points on the real line
+    out : ndarray, optional
+        Output array for the values of `trigamma` at `x`
+
+    Returns
+    -------
+    ndarray
+        Values of `trigamma` at `x`
+
+    See Also
+    --------
+    digamma: The antiderivative of `trigamma`
+
+    """
+    return _trigamma(x)
+
+
+@vectorize(['float64(float64)'], nopython=True, cache=settings.CACHE)
+def digamma_inv(y):
+    r"""Inverse of the digamma function.
+
+    Digamma is strictly increasing on the positive real axis, so it
+    has an inverse mapping the real line to :math:`(0, \infty)`; this
+    is the branch computed here.
+
+    Parameters
+    ----------
+    y : array-like
+        Points on the real line
+    out : ndarray, optional
+        Output array for the values of `digamma_inv` at `y`
+
+    Returns
+    -------
+    ndarray
+        Values of `digamma_inv` at `y`
+
+    """
+    return _digamma_inv(y)
+
+
+
+@vectorize(['float64(uint64, float64)'], nopython=True, cache=settings.CACHE)
+def polygamma(n, x):
+    r"""Polygamma function :math:`\psi^{(n)}(x)`.
+
+    The polygamma function is the nth derivative of the digamma
+    function. For :math:`x > 0` it is computed from the Hurwitz zeta
+    function using [1]_
+
+    .. math::
+
+        \psi^{(n)}(x) = (-1)^{n + 1} n! \zeta(n + 1, x),
+
+    and for :math:`x < 0` the reflection formula is used.
+
+    Parameters
+    ----------
+    n : array-like
+        Non-negative integers
     x : array-like
         Points on the real line
     out : ndarray, optional
-        Output array for the values of `digamma` at `x`
+        Output array for the values of `polygamma` at `n` and `x`
 
     Returns
     -------
     ndarray
-        Values of `digamma` at `x`
+        Values of `polygamma` at `n` and `x`
+
+    See Also
+    --------
+    digamma: Special case of `polygamma` for :math:`n = 0`
+    trigamma: Special case of `polygamma` for :math:`n = 1`
+    hurwitz_zeta: Hurwitz zeta function
+
+    References
+    ----------
+    .. [1] Digital Library of Mathematical Functions, 25.11.12
+           https://dlmf.nist.gov/25.11#E12
+
+    """
+    return _polygamma(n, x)
+
+@guvectorize(
+    ['void(float64[:], float64[:])'],
+    '(k)->(k)',
+    nopython=True,
+    target='parallel',
+    cache=settings.CACHE,
+)
+def dirichlet_expectation(alpha, out):
+    r"""Expected value of the logarithm of a Dirichlet random variable.
+
+    For :math:`\theta \sim \mathrm{Dir}(\alpha)` this is
+
+    .. math::
+
+        E[\log(\theta_i)] = \psi(\alpha_i) - \psi(\sum_j \alpha_j).
+
+    The sum is taken over the last axis and the result is computed
+    row by row in a single pass, so no temporary arrays are created.
+
+    Parameters
+    ----------
+    alpha : array-like
+        Concentration parameters; the last axis indexes the
+        components of the distribution
+    out : ndarray, optional
+        Output array for the values of `dirichlet_expectation` at
+        `alpha`
+
+    Returns
+    -------
+    ndarray
+        Values of `dirichlet_expectation` at `alpha`
+
+    See Also
+    --------
+    dirichlet_expectation_exp: Also return the exponential
+
+    """
+    total = 0.0
+    for i in range(alpha.shape[0]):
+        total += alpha[i]
+    psi_total = _ddigamma(total)
+    for i in range(alpha.shape[0]):
+        out[i] = _ddigamma(alpha[i]) - psi_total
+
+
+@guvectorize(
+    ['void(float64[:], float64[:], float64[:])'],
+    '(k)->(k),(k)',
+    nopython=True,
+    target='parallel',
+    cache=settings.CACHE,
+)
+def dirichlet_expectation_exp(alpha, out, exp_out):
+    r"""Compute `dirichlet_expectation` and its exponential together.
+
+    Variational inference for Dirichlet models usually needs both
+    :math:`E[\log(\theta_i)]` and :math:`\exp(E[\log(\theta_i)])`;
+    this computes both in the same pass.
+
+    Parameters
+    ----------
+    alpha : array-like
+        Concentration parameters; the last axis indexes the
+        components of the distribution
+    out : ndarray, optional
+        Output array for the values of `dirichlet_expectation` at
+        `alpha`
+    exp_out : ndarray, optional
+        Output array for the exponential of `dirichlet_expectation`
+        at `alpha`
+
+    Returns
+    -------
+    tuple of ndarray
+        Values of `dirichlet_expectation` at `alpha` and their
+        exponentials
+
+    See Also
+    --------
+    dirichlet_expectation: Only compute the expectation
 
     """
-    return _digamma(x)
+    total = 0.0
+    for i in range(alpha.shape[0]):
+        total += alpha[i]
+    psi_total = _ddigamma(total)
+    for i in range(alpha.shape[0]):
+        res = _ddigamma(alpha[i]) - psi_total
+        out[i] = res
+        exp_out[i] = np.exp(res)
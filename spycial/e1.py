@@ -61,6 +61,26 @@ Q_GT1 = np.array([
 ])
 
 
+@njit('float64(float64)', cache=settings.CACHE)
+def _e1_small(x):
+    """Compute E1 for 0 < x <= 1."""
+    Y = np.float32(0.66373538970947265625)
+    result = _devalpoly(P_LT1, x) / _devalpoly(Q_LT1, x)
+    result += x - np.log(x) - Y
+    return result
+
+
+@njit('float64(float64)', cache=settings.CACHE)
+def _e1x_rational(recip):
+    """Compute x*exp(x)*E1(x) for x > 1 given recip = 1/x.
+
+    The approximation tends to 1 as x goes to infinity, so it is
+    accurate for all x > 1.
+
+    """
+    return 1 + _devalpoly(P_GT1, recip) / _devalpoly(Q_GT1, recip)
+
+
 @njit('float64(float64)', cache=settings.CACHE)
 def _e1(x):
     if x < 0:
@@ -68,19 +88,27 @@ def _e1(x):
     elif x == 0:
         return np.inf
     elif x <= 1:
-        Y = np.float32(0.66373538970947265625)
-        result = _devalpoly(P_LT1, x) / _devalpoly(Q_LT1, x)
-        result += x - np.log(x) - Y
-        return result
+        return _e1_small(x)
     elif x < -MINEXP:
         recip = 1 / x
-        result = 1 + _devalpoly(P_GT1, recip) / _devalpoly(Q_GT1, recip)
-        result *= np.exp(-x) * recip
-        return result
+        return _e1x_rational(recip) * (np.exp(-x) * recip)
     else:
         return 0
 
 
+@njit('float64(float64)', cache=settings.CACHE)
+def _e1x(x):
+    if x < 0:
+        return np.nan
+    elif x == 0:
+        return np.inf
+    elif x <= 1:
+        return np.exp(x) * _e1_small(x)
+    else:
+        recip = 1 / x
+        return _e1x_rational(recip) * recip
+
+
 @vectorize(['float64(float64)'], nopython=True, cache=settings.CACHE)
 def e1(x):
     r"""Exponential integral :math:`E_1(x)`.
@@ -106,6 +134,7 @@ def e1(x):
 
     See Also
     --------
+    e1x: Scaled exponential integral :math:`e^x E_1(x)`
     ei: Exponential integral :math:`Ei`
     en: Generalization of :math:`E_1`
 
@@ -116,3 +145,31 @@ def e1(x):
 
     """
     return _e1(x)
+
+
+@vectorize(['float64(float64)'], nopython=True, cache=settings.CACHE)
+def e1x(x):
+    r"""Scaled exponential integral :math:`e^x E_1(x)`.
+
+    It is computed without forming either factor, so it doesn't
+    underflow for large `x`, where it behaves like :math:`1/x`.
+
+    Parameters
+    ----------
+    x: array-like
+        Points on the real line
+    out: ndarray, optional
+        Output array for the values of `e1x` at `x`
+
+    Returns
+    -------
+    ndarray
+        Values of `e1x` at `x`
+
+    See Also
+    --------
+    e1: Exponential integral :math:`E_1`
+    eix: Scaled exponential integral :math:`e^{-x} Ei(x)`
+
+    """
+    return _e1x(x)
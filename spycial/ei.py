@@ -12,7 +12,7 @@ import numpy as np
 from . import settings
 from .constants import _MAXEXP
 from .evalpoly import _devalpoly
-from .e1 import _e1
+from .e1 import _e1, _e1x
 
 P6 = np.array([
     0.2777056254402008721e-6,
@@ -130,61 +130,80 @@ EXP40 = 2.3538526683701998541e17
 
 
 @njit('float64(float64)', cache=settings.CACHE)
-def _ei(x):
-    if x < 0:
-        return -_e1(-x)
-    elif x == 0:
-        return -np.inf
+def _ei_small(x):
+    """Compute Ei for 0 < x <= 6."""
+    r1 = 0.37250741078136662132
+    r2 = 0.13140183414386028201e-16
+    r = 0.37250741078136663446
+    t = (x / 3) - 1
+    result = _devalpoly(P6, t) / _devalpoly(Q6, t)
+    t = (x - r1) - r2
+    result *= t
+    if abs(t) < 0.1:
+        result += np.log1p(t / r)
+    else:
+        result += np.log(x / r)
+    return result
 
-    if x <= 6:
-        r1 = 0.37250741078136662132
-        r2 = 0.13140183414386028201e-16
-        r = 0.37250741078136663446
-        t = (x / 3) - 1
-        result = _devalpoly(P6, t) / _devalpoly(Q6, t)
-        t = (x - r1) - r2
-        result *= t
-        if abs(t) < 0.1:
-            result += np.log1p(t / r)
-        else:
-            result += np.log(x / r)
-        return result
-    elif x <= 10:
+
+@njit('float64(float64)', cache=settings.CACHE)
+def _eix_rational(x):
+    """Compute x*exp(-x)*(Ei(x) - x) for x > 6.
+
+    The last approximation is in 1/x and tends to 1 as x goes to
+    infinity, so it is accurate for all x > 40.
+
+    """
+    if x <= 10:
         Y = np.float32(1.158985137939453125)
         t = x / 2 - 4
         result = Y + _devalpoly(P10, t) / _devalpoly(Q10, t)
-        result *= np.exp(x) / x
-        result += x
-        return result
     elif x <= 20:
         Y = np.float32(1.0869731903076171875)
         t = x / 5 - 3
         result = Y + _devalpoly(P20, t) / _devalpoly(Q20, t)
-        result *= np.exp(x) / x
-        result += x
-        return result
     elif x <= 40:
         Y = np.float32(1.03937530517578125)
         t = x / 10 - 3
         result = Y + _devalpoly(P40, t) / _devalpoly(Q40, t)
-        result *= np.exp(x) / x
-        result += x
-        return result
     else:
         Y = np.float32(1.013065338134765625)
         t = 1 / x
         result = Y + _devalpoly(P_GT40, t) / _devalpoly(Q_GT40, t)
-        if x < 41:
-            result *= np.exp(x) / x
+    return result
+
+
+@njit('float64(float64)', cache=settings.CACHE)
+def _ei(x):
+    if x < 0:
+        return -_e1(-x)
+    elif x == 0:
+        return -np.inf
+    elif x <= 6:
+        return _ei_small(x)
+    elif x < 41:
+        return _eix_rational(x) * (np.exp(x) / x) + x
+    else:
+        # Avoid premature overflow if we can
+        t = x - 40
+        if t > _MAXEXP:
+            return np.inf
         else:
-            # Avoid premature overflow if we can
-            t = x - 40
-            if t > _MAXEXP:
-                return np.inf
-            else:
-                result *= (np.exp(x - 40) / x) * EXP40
-        result += x
-        return result
+            return _eix_rational(x) * ((np.exp(t) / x) * EXP40) + x
+
+
+@njit('float64(float64)', cache=settings.CACHE)
+def _eix(x):
+    if x < 0:
+        return -_e1x(-x)
+    elif x == 0:
+        return -np.inf
+    elif x <= 6:
+        return np.exp(-x) * _ei_small(x)
+    elif x == np.inf:
+        return 0.0
+    else:
+        return _eix_rational(x) / x + x * np.exp(-x)
 
 
 @vectorize(['float64(float64)'], nopython=True, cache=settings.CACHE)
@@ -226,6 +245,7 @@ def ei(x):
     See Also
     --------
     e1: Exponential integral :math:`E_1`
+    eix: Scaled exponential integral :math:`e^{-x} Ei(x)`
 
     References
     ----------
@@ -235,3 +255,31 @@ def ei(x):
 
     """
     return _ei(x)
+
+
+@vectorize(['float64(float64)'], nopython=True, cache=settings.CACHE)
+def eix(x):
+    r"""Scaled exponential integral :math:`e^{-x} Ei(x)`.
+
+    It is computed without forming either factor, so it doesn't
+    overflow for large `x`, where it behaves like :math:`1/x`.
+
+    Parameters
+    ----------
+    x: array-like
+        Points on the real line
+    out: ndarray, optional
+        Output array for the values of `eix` at `x`
+
+    Returns
+    -------
+    ndarray
+        Values of `eix` at `x`
+
+    See Also
+    --------
+    ei: Exponential integral :math:`Ei`
+    e1x: Scaled exponential integral :math:`e^x E_1(x)`
+
+    """
+    return _eix(x)
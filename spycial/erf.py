@@ -1,16 +1,89 @@
-"""Code adapted from Boost, which is:
+"""The real error functions are adapted from Boost, which is:
 
 (C) Copyright John Maddock 2006.
 Use, modification and distribution are subject to the
 Boost Software License, Version 1.0. (See accompanying file
 LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
 
+The Faddeeva function, which gives the complex error functions, uses
+the continued fraction of [1] away from the origin and the series of
+[2] near it, with the number of continued fraction terms from [3].
+
+References
+----------
+[1] Poppe and Wijers, "More Efficient Computation of the Complex
+    Error Function", ACM TOMS, 1990.
+
+[2] Zaghloul and Ali, "Algorithm 916: Computing the Faddeyeva and
+    Voigt Functions", ACM TOMS, 2011.
+
+[3] Johnson, "Faddeeva Package",
+    http://ab-initio.mit.edu/Faddeeva
+
 """
-from numba import njit, vectorize
+import numba
+from numba import njit, generated_jit, vectorize
 import numpy as np
 
 from . import settings
-from .evalpoly import _devalpoly
+from .constants import (
+    _π, _sqrtπ, _log2, _sqrt2, _sqrt1_2, _ε, _MAXEXP, MINEXP,
+)
+from .evalpoly import _devalpoly, _cevalpoly
+
+# exp(x**2) overflows for |x| larger than this
+SQRT_MAXEXP = np.sqrt(_MAXEXP)
+# For x below this erfc(x) rounds to 2
+ERFCX_NEGLIGIBLE = -6.0
+# For x above this Φ(-x) underflows, so ndtr(-x) is 0 and
+# log_ndtr(x) rounds to -0
+LOG_NDTR_ZERO = 40.0
+# Use the asymptotic series for erfcx above this; it is where erfc
+# underflows and the last rational approximation stops being fitted
+ERFCX_ASYMP = 28.0
+# Coefficients (-1)**k (2k - 1)!!/2**k, k = 7, ..., 0, of the
+# asymptotic series of sqrt(π)*x*erfcx(x) in 1/x**2
+# erf_diff and ndtr_diff integrate exp(-c*t**2) over [a, a + h] with
+# Gauss-Legendre quadrature, where c is 1 and 1/2 respectively, when
+# c*|a + h/2|*h and c*h**2 are below these. The error bound of the
+# 6-point rule is then below 1e-16 relative.
+DIFF_QUADRATURE_SLOPE = 0.4
+DIFF_QUADRATURE_WIDTH = 0.09
+# Nodes and weights of 6-point Gauss-Legendre quadrature on [-1, 1]
+GAUSS_LEGENDRE_NODES = np.array([
+    -0.9324695142031520278123016, -0.6612093864662645136613996,
+    -0.2386191860831969086305017, 0.2386191860831969086305017,
+    0.6612093864662645136613996, 0.9324695142031520278123016
+])
+GAUSS_LEGENDRE_WEIGHTS = np.array([
+    0.1713244923791703450402961, 0.3607615730481386075698335,
+    0.4679139345726910473898703, 0.4679139345726910473898703,
+    0.3607615730481386075698335, 0.1713244923791703450402961
+])
+# Parameter of the series of Zaghloul and Ali, π/sqrt(-log(ε/2))
+W_SERIES_A = 0.518321480430085929872
+# exp(-(n*a)**2) for n = 1, 2, ..., past where it underflows
+W_SERIES_EXP = np.exp(-(W_SERIES_A*np.arange(1, 53))**2)
+# Below this sum5 - sum4 in the series cancels unless the terms are
+# formed with expm1
+W_SERIES_EXPM1 = 0.1
+# Use the continued fraction for Im(z) or |Re(z)| above these
+W_CF_MINY = 7.0
+W_CF_MINX = 7.0
+# Add exp(-z**2) to the continued fraction for Im(z) below this
+W_CF_EXP_MAXY = 1.0
+# Use w(z) ~ i/(sqrt(π)z) for |x| + |y| above this, where the error
+# in the real part is below ε
+W_CF_ONE_TERM = 1e8
+# Use the Taylor series of erf for |z| below this
+CERF_TAYLOR_RADIUS = 0.08
+# Taylor coefficients of sqrt(π)/2*erf(z)/z in z**2, highest first
+CERF_TAYLOR = np.array([
+    -1/1320, 1/216, -1/42, 1/10, -1/3, 1.0
+])
+ERFCX_ASYMP_COEFFS = np.array([
+    -135135/128, 10395/64, -945/32, 105/16, -15/8, 3/4, -1/2, 1.0
+])
 
 P1 = np.array([
     -0.000322780120964605683831,
@@ -104,6 +177,59 @@ Q5 = np.array([
 ])
 
 
+@njit('float64(float64)', cache=settings.CACHE)
+def _erfcx_rational(x):
+    """Compute x*exp(x**2)*erfc(x) for x >= 0.5.
+
+    The last approximation is only accurate for x < ERFCX_ASYMP.
+
+    """
+    if x < 1.5:
+        # Maximum deviation found: 3.702e-17
+        # Expected error term: 3.702e-17
+        # Maximum relative change in control points: 2.845e-04
+        # Max error found at double precision: 4.841816e-17
+        Y = np.float32(0.405935764312744140625)
+        res = Y + _devalpoly(P2, x - 0.5)/_devalpoly(Q2, x - 0.5)
+    elif x < 2.5:
+        # Maximum deviation found: 3.909e-18
+        # Expected error term: 3.909e-18
+        # Maximum relative change in control points: 9.886e-05
+        # Max error found at double precision: 6.599585e-18
+        Y = np.float32(0.50672817230224609375)
+        res = Y + _devalpoly(P3, x - 1.5)/_devalpoly(Q3, x - 1.5)
+    elif x < 4.5:
+        # Maximum deviation found: 1.512e-17
+        # Expected error term: 1.512e-17
+        # Maximum relative change in control points: 2.222e-04
+        # Max error found at double precision: 2.062515e-17
+        Y = np.float32(0.5405750274658203125)
+        res = Y + _devalpoly(P4, x - 3.5)/_devalpoly(Q4, x - 3.5)
+    else:
+        # Maximum deviation found: 2.860e-17
+        # Expected error term: 2.859e-17
+        # Maximum relative change in control points: 1.357e-05
+        # Max error found at double precision: 2.997958e-17
+        Y = np.float32(0.5579090118408203125)
+        res = Y + _devalpoly(P5, 1.0/x)/_devalpoly(Q5, 1.0/x)
+    return res
+
+
+@njit('float64(float64)', cache=settings.CACHE)
+def _erf_small(x):
+    """Compute erf for 0 <= x < 0.5."""
+    if x < 1e-10:
+        # Single term of the Taylor series
+        return 1.128379167095512573896159*x
+    # - Maximum deviation found: 1.561e-17
+    # - Expected error term: 1.561e-17
+    # - Maximum relative change in control points: 1.155e-04
+    # - Max error found at double precision: 2.961182e-17
+    Y = np.float32(1.044948577880859375)
+    xx = x*x
+    return x*(Y + _devalpoly(P1, xx)/_devalpoly(Q1, xx))
+
+
 @njit('float64(float64, bool_)', cache=settings.CACHE)
 def _erf_erfc(x, invert):
     """Compute erf if invert is False and erfc if invert is True."""
@@ -117,56 +243,14 @@ def _erf_erfc(x, invert):
 
     if x < 0.5:
         # We're going to calculate erf
-        if x < 1e-10:
-            # Single term of the Taylor series
-            res = 1.128379167095512573896159*x
-        else:
-            # - Maximum deviation found: 1.561e-17
-            # - Expected error term: 1.561e-17
-            # - Maximum relative change in control points: 1.155e-04
-            # - Max error found at double precision: 2.961182e-17
-            Y = np.float32(1.044948577880859375)
-            xx = x*x
-            res = x*(Y + _devalpoly(P1, xx)/_devalpoly(Q1, xx))
+        res = _erf_small(x)
     elif (invert and x < 28) or (not invert and x < 5.8):
         # We'll be calculating erfc:
         invert = not invert
-
-        if x < 1.5:
-            # Maximum deviation found: 3.702e-17
-            # Expected error term: 3.702e-17
-            # Maximum relative change in control points: 2.845e-04
-            # Max error found at double precision: 4.841816e-17
-            Y = np.float32(0.405935764312744140625)
-            res = Y + _devalpoly(P2, x - 0.5)/_devalpoly(Q2, x - 0.5)
-            res *= np.exp(-x*x)/x
-        elif x < 2.5:
-            # Maximum deviation found: 3.909e-18
-            # Expected error term: 3.909e-18
-            # Maximum relative change in control points: 9.886e-05
-            # Max error found at double precision: 6.599585e-18
-            Y = np.float32(0.50672817230224609375)
-            res = Y + _devalpoly(P3, x - 1.5)/_devalpoly(Q3, x - 1.5)
-            res *= np.exp(-x*x)/x
-        elif x < 4.5:
-            # Maximum deviation found: 1.512e-17
-            # Expected error term: 1.512e-17
-            # Maximum relative change in control points: 2.222e-04
-            # Max error found at double precision: 2.062515e-17
-            Y = np.float32(0.5405750274658203125)
-            res = Y + _devalpoly(P4, x - 3.5)/_devalpoly(Q4, x - 3.5)
-            res *= np.exp(-x*x)/x
-        else:
-            # Maximum deviation found: 2.860e-17
-            # Expected error term: 2.859e-17
-            # Maximum relative change in control points: 1.357e-05
-            # Max error found at double precision: 2.997958e-17
-            Y = np.float32(0.5579090118408203125)
-            res = Y + _devalpoly(P5, 1.0/x)/_devalpoly(Q5, 1.0/x)
-            res *= np.exp(-x*x)/x
+        res = _erfcx_rational(x)*(np.exp(-x*x)/x)
     else:
         # Any value of x larger than 28 will underflow to zero
-        result = 0.0
+        res = 0.0
         invert = not invert
 
     if invert:
@@ -175,50 +259,715 @@ def _erf_erfc(x, invert):
 
 
 @njit('float64(float64)', cache=settings.CACHE)
-def _erf(x):
+def _derf(x):
     return _erf_erfc(x, False)
 
 
 @njit('float64(float64)', cache=settings.CACHE)
-def _erfc(x):
+def _derfc(x):
     return _erf_erfc(x, True)
 
 
-@vectorize(['float64(float64)'], nopython=True, cache=settings.CACHE)
-def erf(x):
+@njit('float64(float64, float64)', cache=settings.CACHE)
+def _expx2(x, c):
+    """Compute exp(c*x**2) for finite |x| < 64 and c = ±1 or ±1/2
+    without the error from rounding x**2.
+
+    Split x = xh + xl where xh has at most 26 bits, so c*xh**2 is
+    exact, and expand exp(c*xl*(x + xh)) in a short Taylor series.
+
+    """
+    xh = np.floor(x*1048576.0)/1048576.0
+    d = c*(x - xh)*(x + xh)
+    return np.exp(c*xh*xh)*(1.0 + d*(1.0 + d*(0.5 + d/6.0)))
+
+
+@njit('float64(float64)', cache=settings.CACHE)
+def _erfcx(x):
+    if np.isnan(x):
+        return x
+    elif x < 0:
+        # erfc(-x) = 2 - erfc(x); exp(x**2) overflows first
+        if x < -SQRT_MAXEXP:
+            return np.inf
+        elif x < ERFCX_NEGLIGIBLE:
+            # erfcx(-x) is less than half an ulp of 2exp(x**2)
+            return 2.0*_expx2(x, 1.0)
+        return 2.0*_expx2(x, 1.0) - _erfcx(-x)
+    elif x < 0.5:
+        return np.exp(x*x)*(1.0 - _erf_small(x))
+    elif x < ERFCX_ASYMP:
+        return _erfcx_rational(x)/x
+    # Asymptotic series; see DLMF 7.12.1
+    t = 1.0/(x*x)
+    return _devalpoly(ERFCX_ASYMP_COEFFS, t)/(_sqrtπ*x)
+
+
+@njit('float64(float64)', cache=settings.CACHE)
+def _log_erfc(x):
+    if x < -0.5:
+        return np.log(_derfc(x))
+    elif x < 0.5:
+        return np.log1p(-_erf_small(abs(x))*np.sign(x))
+    # log(erfc(x)) = log(erfcx(x)) - x**2; this covers both the
+    # rational approximations and the asymptotic series of `erfcx`
+    return np.log(_erfcx(x)) - x*x
+
+
+@njit('float64(float64)', cache=settings.CACHE)
+def _ndtr(x):
+    # Φ(x) = erfc(-x/√2)/2; see `_log_ndtr` for the lower tail
+    t = -x*_sqrt1_2
+    if np.isnan(x):
+        return x
+    elif t >= 0.5:
+        if x < -LOG_NDTR_ZERO:
+            return 0.0
+        return 0.5*_erfcx(t)*_expx2(x, -0.5)
+    elif t > -0.5:
+        return 0.5 - 0.5*_erf_small(abs(t))*np.sign(t)
+    return 1.0 - 0.5*_erf_erfc(-t, True)
+
+
+@njit('float64(float64)', cache=settings.CACHE)
+def _log_ndtr(x):
+    # Φ(x) = erfc(-x/√2)/2 = erfcx(-x/√2)exp(-x**2/2)/2. Use x**2/2
+    # rather than (x/√2)**2 so the error in rounding x/√2 isn't
+    # amplified.
+    t = -x*_sqrt1_2
+    if np.isnan(x):
+        return x
+    elif t >= 0.5:
+        return np.log(_erfcx(t)) - 0.5*x*x - _log2
+    elif t > -0.5:
+        return np.log1p(-_erf_small(abs(t))*np.sign(t)) - _log2
+    elif x > LOG_NDTR_ZERO:
+        return -0.0
+    return np.log1p(-0.5*_erfcx(-t)*_expx2(x, -0.5))
+
+
+@njit('float64(float64, float64, float64)', cache=settings.CACHE)
+def _gauss_integral(a, h, c):
+    """Compute the integral of exp(-c*t**2) from a to a + h for c = 1
+    or 1/2 when c*t**2 varies little over the interval.
+
+    The integrand is written as exp(-c*a**2)*exp(-c*v*(2a + v)) with
+    v = t - a, so the error from rounding t**2 isn't amplified.
+
+    """
+    if c*a*a > -MINEXP:
+        return 0.0
+    res = 0.0
+    for i in range(GAUSS_LEGENDRE_NODES.shape[0]):
+        v = 0.5*h*(1.0 + GAUSS_LEGENDRE_NODES[i])
+        res += GAUSS_LEGENDRE_WEIGHTS[i]*np.exp(-c*v*(2.0*a + v))
+    return 0.5*h*_expx2(a, -c)*res
+
+
+@njit('boolean(float64, float64, float64)', cache=settings.CACHE)
+def _use_quadrature(a, h, c):
+    """Check whether `_gauss_integral` is accurate on [a, a + h]."""
+    return (c*abs(a + 0.5*h)*h <= DIFF_QUADRATURE_SLOPE
+            and c*h*h <= DIFF_QUADRATURE_WIDTH)
+
+
+@njit('float64(float64)', cache=settings.CACHE)
+def _erfc_tail(x):
+    """Compute erfc for x >= 0 with exp(-x**2) computed from an exact
+    split of x."""
+    if x < 0.5:
+        return _erf_erfc(x, True)
+    elif x > ERFCX_ASYMP:
+        return 0.0
+    return _erfcx(x)*_expx2(x, -1.0)
+
+
+@njit('float64(float64, float64)', cache=settings.CACHE)
+def _erf_diff(a, b):
+    if np.isnan(a) or np.isnan(b):
+        return np.nan
+    elif a == b:
+        return 0.0
+    elif a > b:
+        return -_erf_diff(b, a)
+    elif _use_quadrature(a, b - a, 1.0):
+        # The endpoints are close; subtracting would cancel
+        return 2.0/_sqrtπ*_gauss_integral(a, b - a, 1.0)
+    elif a >= 0.0:
+        # Both in the upper tail; the quadrature conditions failing
+        # means erfc(b) is at most about erfc(a)/2
+        return _erfc_tail(a) - _erfc_tail(b)
+    elif b <= 0.0:
+        return _erfc_tail(-b) - _erfc_tail(-a)
+    return _erf_erfc(b, False) + _erf_erfc(-a, False)
+
+
+@njit('float64(float64, float64)', cache=settings.CACHE)
+def _ndtr_diff(a, b):
+    if np.isnan(a) or np.isnan(b):
+        return np.nan
+    elif a == b:
+        return 0.0
+    elif a > b:
+        return -_ndtr_diff(b, a)
+    elif _use_quadrature(a, b - a, 0.5):
+        return _sqrt1_2/_sqrtπ*_gauss_integral(a, b - a, 0.5)
+    elif a >= 0.0:
+        # Use the lower tail of ndtr, which has full relative accuracy
+        return _ndtr(-a) - _ndtr(-b)
+    return _ndtr(b) - _ndtr(a)
+
+
+@njit('complex128(float64, float64)', cache=settings.CACHE)
+def _cwofz_cf(x, y):
+    """Continued fraction for w(x + iy) with y >= 0; see [1]."""
+    isqrtπ = 1.0/_sqrtπ
+    ax = abs(x)
+    if ax + y > W_CF_ONE_TERM:
+        # w(z) ~ i/(sqrt(π)z); scale to avoid overflow in |z|**2
+        if ax > y:
+            r = y/x
+            d = isqrtπ/(x + r*y)
+            return np.complex(d*r, d)
+        r = x/y
+        d = isqrtπ/(r*x + y)
+        return np.complex(d, d*r)
+
+    # The number of terms is the fit of [3] to the estimate of [1],
+    # which avoids computing |z|
+    nu = np.floor(3.9 + 11.398/(0.08254*ax + 0.1421*y + 0.2023))
+    # Evaluate r <- z - k/r backwards in real arithmetic
+    wr = x
+    wi = y
+    k = 0.5*(nu - 1.0)
+    while k > 0.4:
+        d = k/(wr*wr + wi*wi)
+        wr = x - wr*d
+        wi = y + wi*d
+        k -= 0.5
+    # w(z) = i/(sqrt(π)r)
+    d = isqrtπ/(wr*wr + wi*wi)
+    return np.complex(d*wi, d*wr)
+
+
+@njit('float64(float64, float64)', cache=settings.CACHE)
+def _sinc(x, sinx):
+    """Compute sin(x)/x given sin(x)."""
+    if abs(x) < 1e-4:
+        return 1.0 - x*x/6.0
+    return sinx/x
+
+
+@njit('complex128(float64, float64)', cache=settings.CACHE)
+def _cwofz_series(x, y):
+    """Series of [2] for w(x + iy) with y >= 0 and |x| <= W_CF_MINX."""
+    a = W_SERIES_A
+    c = 2.0*a/_π
+    xs = x
+    x = abs(x)
+    yy = y*y
+    expx2 = _expx2(x, -1.0)
+    sum1 = 0.0
+    sum23 = 0.0
+    sum45 = 0.0
+    if x < W_SERIES_EXPM1:
+        # The sums of [2] with the factors exp(±2anx) are formed from
+        # u = exp(2anx) - 1 and v = 1 - exp(-2anx) so that the
+        # difference sum5 - sum4 doesn't cancel.
+        u1 = np.expm1(2.0*a*x)
+        v1 = -np.expm1(-2.0*a*x)
+        u = 0.0
+        v = 0.0
+        for n in range(1, W_SERIES_EXP.shape[0] + 1):
+            coef = W_SERIES_EXP[n - 1]*expx2/(a*a*n*n + yy)
+            u += u1*(1.0 + u)
+            v += v1*(1.0 - v)
+            sum1 += coef
+            sum23 += coef*(2.0 + u - v)
+            term45 = coef*a*n*(u + v)
+            sum45 += term45
+            if coef*(1.0 + u) < _ε*sum23 and term45 <= _ε*sum45:
+                break
+    else:
+        exp2ax = np.exp(2.0*a*x)
+        expm2ax = 1.0/exp2ax
+        prod2ax = 1.0
+        prodm2ax = 1.0
+        sum4 = 0.0
+        sum5 = 0.0
+        for n in range(1, W_SERIES_EXP.shape[0] + 1):
+            coef = W_SERIES_EXP[n - 1]*expx2/(a*a*n*n + yy)
+            prod2ax *= exp2ax
+            prodm2ax *= expm2ax
+            sum1 += coef
+            sum23 += coef*(prod2ax + prodm2ax)
+            sum4 += coef*prodm2ax*a*n
+            term5 = coef*prod2ax*a*n
+            sum5 += term5
+            # sum5 has the slowest decay
+            if term5 < _ε*sum5:
+                break
+        sum45 = sum5 - sum4
+
+    xy = x*y
+    sinxy = np.sin(xy)
+    cosxy = np.cos(xy)
+    sin2xy = 2.0*sinxy*cosxy
+    cos2xy = (cosxy - sinxy)*(cosxy + sinxy)
+    coef1 = expx2*_erfcx(y) - c*y*sum1
+    coef2 = c*x*expx2
+    re = coef1*cos2xy + coef2*sinxy*_sinc(xy, sinxy) + 0.5*c*y*sum23
+    im = coef2*_sinc(2.0*xy, sin2xy) - coef1*sin2xy + 0.5*c*sum45
+    return np.complex(re, np.copysign(1.0, xs)*im)
+
+
+@njit('complex128(complex128)', cache=settings.CACHE)
+def _cwofz(z):
+    x = z.real
+    y = z.imag
+    if np.isnan(x) or np.isnan(y):
+        return np.complex(np.nan, np.nan)
+    elif y < 0.0:
+        # w(z) = 2exp(-z**2) - w(-z)
+        return 2.0*np.exp(-z*z) - _cwofz(-z)
+
+    ax = abs(x)
+    if y <= W_CF_MINY and ax <= W_CF_MINX:
+        return _cwofz_series(x, y)
+    w = _cwofz_cf(x, y)
+    if y < W_CF_EXP_MAXY and ax < ERFCX_ASYMP:
+        # The truncated continued fraction misses exp(-z**2), which
+        # dominates the real part close to the real axis
+        e = _expx2(x, -1.0)
+        if e*x*x > _ε*y:
+            e *= np.exp(y*y)
+            w += np.complex(e*np.cos(2.0*x*y), -e*np.sin(2.0*x*y))
+    return w
+
+
+@njit('complex128(complex128)', cache=settings.CACHE)
+def _cerfc(z):
+    if np.isnan(z.real) or np.isnan(z.imag):
+        return np.complex(np.nan, np.nan)
+    elif z.imag == 0.0:
+        return np.complex(_derfc(z.real), -z.imag)
+    elif z.real < 0.0:
+        return 2.0 - _cerfc(-z)
+    # erfc(z) = exp(-z**2)w(iz)
+    return np.exp(-z*z)*_cwofz(1j*z)
+
+
+@njit('complex128(complex128)', cache=settings.CACHE)
+def _cerf(z):
+    x = z.real
+    y = z.imag
+    if np.isnan(x) or np.isnan(y):
+        return np.complex(np.nan, np.nan)
+    elif y == 0.0:
+        return np.complex(_derf(x), y)
+    elif abs(z) < CERF_TAYLOR_RADIUS:
+        return 2.0/_sqrtπ*z*_cevalpoly(CERF_TAYLOR, z*z)
+    elif x == 0.0:
+        # erf(iy) = i*exp(y**2)*Im(w(y))
+        if abs(y) > SQRT_MAXEXP:
+            return np.complex(x, np.copysign(np.inf, y))
+        return np.complex(x, _expx2(y, 1.0)*_cwofz(y).imag)
+    elif x < 0.0:
+        return -_cerf(-z)
+    return 1.0 - _cerfc(z)
+
+
+@generated_jit(nopython=True, cache=settings.CACHE)
+def _erf(a):
+    if a == numba.types.float64:
+        return lambda a: _derf(a)
+    elif a == numba.types.complex128:
+        return lambda a: _cerf(a)
+
+
+@generated_jit(nopython=True, cache=settings.CACHE)
+def _erfc(a):
+    if a == numba.types.float64:
+        return lambda a: _derfc(a)
+    elif a == numba.types.complex128:
+        return lambda a: _cerfc(a)
+
+
+@njit('float64(float64, float64, float64)', cache=settings.CACHE)
+def _voigt_profile(x, sigma, gamma):
+    if np.isnan(x) or np.isnan(sigma) or np.isnan(gamma):
+        return np.nan
+    elif sigma < 0.0 or gamma < 0.0:
+        return np.nan
+    elif sigma == 0.0:
+        if gamma == 0.0:
+            return np.inf if x == 0.0 else 0.0
+        # Cauchy distribution
+        return gamma/(_π*(x*x + gamma*gamma))
+    elif gamma == 0.0:
+        # Normal distribution
+        return _expx2(x/sigma, -0.5)/(sigma*_sqrt2*_sqrtπ)
+    z = np.complex(x, gamma)/(sigma*_sqrt2)
+    return _cwofz(z).real/(sigma*_sqrt2*_sqrtπ)
+
+
+@vectorize(
+    ['float64(float64)', 'complex128(complex128)'],
+    nopython=True,
+    cache=settings.CACHE,
+)
+def erf(z):
     """Error function.
 
+    Parameters
+    ----------
+    z : array-like
+        Points on the real line or complex plane
+    out : ndarray, optional
+        Output array for the values of `erf` at `z`
+
+    Returns
+    -------
+    ndarray
+        Values of `erf` at `z`
+
+    See Also
+    --------
+    wofz: Faddeeva function
+
+    """
+    return _erf(z)
+
+
+@vectorize(
+    ['float64(float64)', 'complex128(complex128)'],
+    nopython=True,
+    cache=settings.CACHE,
+)
+def erfc(z):
+    """Complementary error function.
+
+    Parameters
+    ----------
+    z : array-like
+        Points on the real line or complex plane
+    out : ndarray, optional
+        Output array for the values of `erfc` at `z`
+
+    Returns
+    -------
+    ndarray
+        Values of `erfc` at `z`
+
+    See Also
+    --------
+    erfcx: Scaled complementary error function
+    wofz: Faddeeva function
+
+    """
+    return _erfc(z)
+
+
+@vectorize(['float64(float64)'], nopython=True, cache=settings.CACHE)
+def erfcx(x):
+    r"""Scaled complementary error function.
+
+    Defined as
+
+    .. math::
+
+        \mathrm{erfcx}(x) = e^{x^2}\mathrm{erfc}(x).
+
+    It is computed without forming either factor, so it doesn't
+    underflow for large positive `x`, where it behaves like
+    :math:`1/(\sqrt{\pi}x)`.
+
     Parameters
     ----------
     x : array-like
         Points on the real line
     out : ndarray, optional
-        Output array for the values of `erf` at `x`
+        Output array for the values of `erfcx` at `x`
 
     Returns
     -------
     ndarray
-        Values of `erf` at `x`
+        Values of `erfcx` at `x`
+
+    See Also
+    --------
+    erfc: Complementary error function
 
     """
-    return _erf(x)
+    return _erfcx(x)
 
 
 @vectorize(['float64(float64)'], nopython=True, cache=settings.CACHE)
-def erfc(x):
-    """Complementary error function.
+def log_erfc(x):
+    r"""Logarithm of the complementary error function.
+
+    Computed without forming :math:`\mathrm{erfc}(x)`, so the result
+    is finite for large positive `x`, where :math:`\mathrm{erfc}(x)`
+    underflows.
+
+    Parameters
+    ----------
+    x : array-like
+        Points on the real line
+    out : ndarray, optional
+        Output array for the values of `log_erfc` at `x`
+
+    Returns
+    -------
+    ndarray
+        Values of `log_erfc` at `x`
+
+    See Also
+    --------
+    erfc: Complementary error function
+    log_ndtr: Logarithm of the standard normal CDF
+
+    """
+    return _log_erfc(x)
+
+
+@vectorize(
+    ['float32(float32)', 'float64(float64)'],
+    nopython=True,
+    cache=settings.CACHE,
+)
+def ndtr(x):
+    r"""Standard normal cumulative distribution function.
+
+    Defined as
+
+    .. math::
+
+        \Phi(x) = \frac{1}{2}\mathrm{erfc}\left(-\frac{x}{\sqrt{2}}\right).
+
+    The lower tail is computed from :math:`x^2/2` directly, so it keeps
+    full relative accuracy until it underflows.
+
+    Parameters
+    ----------
+    x : array-like
+        Points on the real line
+    out : ndarray, optional
+        Output array for the values of `ndtr` at `x`
+
+    Returns
+    -------
+    ndarray
+        Values of `ndtr` at `x`
+
+    See Also
+    --------
+    ndtr_parallel: Multithreaded version of `ndtr`
+    log_ndtr: Logarithm of the standard normal CDF
+    ndtri: Inverse of `ndtr`
+
+    """
+    return _ndtr(x)
+
+
+@vectorize(
+    ['float32(float32)', 'float64(float64)'],
+    nopython=True,
+    target='parallel',
+    cache=settings.CACHE,
+)
+def ndtr_parallel(x):
+    """Multithreaded version of `ndtr` for large arrays.
+
+    Parameters
+    ----------
+    x : array-like
+        Points on the real line
+    out : ndarray, optional
+        Output array for the values of `ndtr` at `x`
+
+    Returns
+    -------
+    ndarray
+        Values of `ndtr` at `x`
+
+    See Also
+    --------
+    ndtr: Standard normal cumulative distribution function
+
+    """
+    return _ndtr(x)
+
+
+@vectorize(['float64(float64)'], nopython=True, cache=settings.CACHE)
+def log_ndtr(x):
+    r"""Logarithm of the standard normal cumulative distribution
+    function.
+
+    Defined as
+
+    .. math::
+
+        \log(\Phi(x)) = \log\left(
+            \frac{1}{2}\mathrm{erfc}\left(-\frac{x}{\sqrt{2}}\right)
+        \right).
+
+    The result is finite for large negative `x`, where :math:`\Phi(x)`
+    underflows, and accurate for large positive `x`, where it is close
+    to zero.
+
+    Parameters
+    ----------
+    x : array-like
+        Points on the real line
+    out : ndarray, optional
+        Output array for the values of `log_ndtr` at `x`
+
+    Returns
+    -------
+    ndarray
+        Values of `log_ndtr` at `x`
+
+    See Also
+    --------
+    log_erfc: Logarithm of the complementary error function
+
+    """
+    return _log_ndtr(x)
+
+
+@vectorize(['float64(float64, float64)'], nopython=True, cache=settings.CACHE)
+def erf_diff(a, b):
+    r"""Difference of error functions.
+
+    Computes :math:`\mathrm{erf}(b) - \mathrm{erf}(a)` in a single
+    pass without the cancellation of subtracting the two values when
+    `a` and `b` are close or lie in the same tail.
+
+    Parameters
+    ----------
+    a : array-like
+        Points on the real line
+    b : array-like
+        Points on the real line
+    out : ndarray, optional
+        Output array for the values of `erf_diff` at `a` and `b`
+
+    Returns
+    -------
+    ndarray
+        Values of `erf_diff` at `a` and `b`
+
+    See Also
+    --------
+    ndtr_diff: Difference of standard normal CDFs
+
+    """
+    return _erf_diff(a, b)
+
+
+@vectorize(['float64(float64, float64)'], nopython=True, cache=settings.CACHE)
+def ndtr_diff(a, b):
+    r"""Difference of standard normal cumulative distribution functions.
+
+    Computes :math:`\Phi(b) - \Phi(a)`, the probability that a
+    standard normal random variable lies in :math:`[a, b]`, without the
+    cancellation of subtracting the two values when `a` and `b` are
+    close or lie in the same tail.
+
+    Parameters
+    ----------
+    a : array-like
+        Points on the real line
+    b : array-like
+        Points on the real line
+    out : ndarray, optional
+        Output array for the values of `ndtr_diff` at `a` and `b`
+
+    Returns
+    -------
+    ndarray
+        Values of `ndtr_diff` at `a` and `b`
+
+    See Also
+    --------
+    erf_diff: Difference of error functions
+    ndtr: Standard normal cumulative distribution function
+
+    """
+    return _ndtr_diff(a, b)
+
+
+@vectorize(['complex128(complex128)'], nopython=True, cache=settings.CACHE)
+def wofz(z):
+    r"""Faddeeva function.
+
+    Defined as
+
+    .. math::
+
+        w(z) = e^{-z^2}\mathrm{erfc}(-iz).
+
+    Parameters
+    ----------
+    z : array-like
+        Points in the complex plane
+    out : ndarray, optional
+        Output array for the values of `wofz` at `z`
+
+    Returns
+    -------
+    ndarray
+        Values of `wofz` at `z`
+
+    See Also
+    --------
+    erfc: Complementary error function
+    voigt_profile: Voigt profile
+
+    """
+    return _cwofz(z)
+
+
+@vectorize(
+    ['float64(float64, float64, float64)'],
+    nopython=True,
+    cache=settings.CACHE,
+)
+def voigt_profile(x, sigma, gamma):
+    r"""Voigt profile.
+
+    The convolution of a normal distribution with standard deviation
+    `sigma` and a Cauchy distribution with half-width at half-maximum
+    `gamma`. It is
+
+    .. math::
+
+        V(x; \sigma, \gamma)
+        = \frac{\mathrm{Re}(w(z))}{\sigma\sqrt{2\pi}},
+        \quad z = \frac{x + i\gamma}{\sigma\sqrt{2}},
+
+    where :math:`w` is the Faddeeva function.
 
     Parameters
     ----------
     x : array-like
         Points on the real line
+    sigma : array-like
+        Standard deviation of the normal distribution
+    gamma : array-like
+        Half-width at half-maximum of the Cauchy distribution
     out : ndarray, optional
-        Output array for the values of `erfc` at `x`
+        Output array for the values of `voigt_profile`
 
     Returns
     -------
     ndarray
-        Values of `erf` at `x`
+        Values of `voigt_profile` at `x`
+
+    See Also
+    --------
+    wofz: Faddeeva function
 
     """
-    return _erfc(x)
+    return _voigt_profile(x, sigma, gamma)
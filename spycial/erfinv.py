@@ -10,6 +10,7 @@ from numba import njit, vectorize
 import numpy as np
 
 from . import settings
+from .constants import _sqrt2
 from .evalpoly import _devalpoly
 
 P_ONE_HALF = np.array([
@@ -244,6 +245,28 @@ def _erfcinv(x):
     return s * _erf_erfc_inv(p, q)
 
 
+@njit('float64(float64)', cache=settings.CACHE)
+def _ndtri(p):
+    # Φ^{-1}(p) = -√2 erfcinv(2p). Pass erf and erfc of the result
+    # to `_erf_erfc_inv` separately; 2p and 2(1 - p) are exact, so
+    # nothing is lost to cancellation in 1 - 2p for small p.
+    if np.isnan(p):
+        return p
+    elif p < 0 or p > 1:
+        return np.nan
+    elif p == 0:
+        return -np.inf
+    elif p == 1:
+        return np.inf
+    elif p == 0.5:
+        return 0.0
+    elif p < 0.5:
+        return -_sqrt2 * _erf_erfc_inv(1 - 2 * p, 2 * p)
+    else:
+        q = 1 - p
+        return _sqrt2 * _erf_erfc_inv(1 - 2 * q, 2 * q)
+
+
 @vectorize(['float64(float64)'], nopython=True, cache=settings.CACHE)
 def erfinv(x):
     """Inverse error function.
@@ -282,3 +305,62 @@ def erfcinv(x):
 
     """
     return _erfcinv(x)
+
+
+@vectorize(
+    ['float32(float32)', 'float64(float64)'],
+    nopython=True,
+    cache=settings.CACHE,
+)
+def ndtri(p):
+    """Inverse of the standard normal cumulative distribution function.
+
+    Parameters
+    ----------
+    p : array-like
+        Probabilities in [0, 1]
+    out : ndarray, optional
+        Output array for the values of `ndtri` at `p`
+
+    Returns
+    -------
+    ndarray
+        Values of `ndtri` at `p`
+
+    See Also
+    --------
+    ndtri_parallel: Multithreaded version of `ndtri`
+    ndtr: Standard normal cumulative distribution function
+
+    """
+    return _ndtri(p)
+
+
+@vectorize(
+    ['float32(float32)', 'float64(float64)'],
+    nopython=True,
+    target='parallel',
+    cache=settings.CACHE,
+)
+def ndtri_parallel(p):
+    """Multithreaded version of `ndtri` for large arrays.
+
+    Parameters
+    ----------
+    p : array-like
+        Probabilities in [0, 1]
+    out : ndarray, optional
+        Output array for the values of `ndtri` at `p`
+
+    Returns
+    -------
+    ndarray
+        Values of `ndtri` at `p`
+
+    See Also
+    --------
+    ndtri: Inverse of the standard normal cumulative distribution
+        function
+
+    """
+    return _ndtri(p)
@@ -10,13 +10,26 @@ Boost Software License, Version 1.0. (See accompanying file
 LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
 
 """
-from numba import njit, vectorize
+import numba
+from numba import njit, generated_jit, vectorize
+from numba.types import float64, int64, void, Array
 import numpy as np
 
 from . import settings
 from .constants import _π, _root_ε, _γ, _MAXEXP
-from .trig import _dsinpi
-from .lanczos import _lanczos_g, _lanczos_sum
+from .trig import _dsinpi, _csinpi
+from .evalpoly import _cevalpoly
+from .lanczos import (
+    _lanczos_g,
+    _lanczos_num,
+    _lanczos_denom,
+    _lanczos_sum,
+)
+from .lgamma import SMALLX, SMALLY, _lgamma, _cloggamma
+
+# Number of steps of the recurrence between re-evaluating Gamma in
+# `gamma_progression`
+PROGRESSION_RESEED = 16
 
 FACTORIALS = np.array([
     1.0,
@@ -40,7 +53,7 @@ def _dgamma(x):
         if x == np.floor(x):
             return np.nan
         if x <= -20.0:
-            return _π/(_dgamma(-x)*_dsinpi(x)*x);
+            return -_π/(_dgamma(-x)*_dsinpi(x)*x)
 
         while x < 0:
             res /= x;
@@ -67,21 +80,223 @@ def _dgamma(x):
     return res
 
 
-@vectorize(['float64(float64)'], nopython=True, cache=settings.CACHE)
-def gamma(x):
+@njit('complex128(complex128, boolean)', cache=settings.CACHE)
+def _cgamma_lanczos(z, reciprocal):
+    """Compute Γ(z), or 1/Γ(z), with the Lanczos approximation.
+
+    Only accurate for Re(z) >= 1/2.
+
+    """
+    zgh = z + _lanczos_g - 0.5
+    num = _cevalpoly(_lanczos_num, z)
+    denom = _cevalpoly(_lanczos_denom, z)
+    w = (z - 0.5)*np.log(zgh) - zgh
+    if reciprocal:
+        return denom/num*np.exp(-w)
+    return num/denom*np.exp(w)
+
+
+@njit('boolean(complex128)', cache=settings.CACHE)
+def _cis_pole(z):
+    return z.imag == 0.0 and z.real <= 0.0 and z.real == np.floor(z.real)
+
+
+@njit('complex128(complex128)', cache=settings.CACHE)
+def _cgamma(z):
+    if np.isnan(z.real) or np.isnan(z.imag) or _cis_pole(z):
+        return np.complex(np.nan, np.nan)
+    elif z.imag == 0.0:
+        return np.complex(_dgamma(z.real), 0.0)
+    elif z.real > SMALLX or abs(z.imag) > SMALLY:
+        # `loggamma` uses the Stirling series here, which is faster
+        # than the Lanczos approximation
+        return np.exp(_cloggamma(z))
+    elif z.real >= 0.5:
+        return _cgamma_lanczos(z, False)
+    # Reflection formula
+    return _π*_cgamma_lanczos(1.0 - z, True)/_csinpi(z)
+
+
+@njit('float64(float64)', cache=settings.CACHE)
+def _drgamma(x):
+    if np.isnan(x):
+        return x
+    elif x == np.inf:
+        return 0.0
+    elif x == -np.inf:
+        return np.nan
+    elif x <= 0.0 and x == np.floor(x):
+        return 0.0
+    elif abs(x) < _root_ε:
+        return x/(1.0 - _γ*x)
+    elif x > -20.0:
+        res = _dgamma(x)
+        if np.isfinite(res):
+            # Gamma has no zeros, so there is no division by zero
+            return 1.0/res
+        # The result is subnormal
+        return np.exp(-_lgamma(x))
+
+    # Reflection formula; Γ(1 - x) can overflow even though the
+    # result doesn't
+    sinpix = _dsinpi(x)
+    res = _dgamma(1.0 - x)
+    if np.isfinite(res):
+        return sinpix*res/_π
+    return np.copysign(np.exp(_lgamma(1.0 - x) + np.log(abs(sinpix/_π))),
+                       sinpix)
+
+
+@njit('complex128(complex128)', cache=settings.CACHE)
+def _crgamma(z):
+    if np.isnan(z.real) or np.isnan(z.imag):
+        return np.complex(np.nan, np.nan)
+    elif _cis_pole(z):
+        return np.complex(0.0, 0.0)
+    elif z.imag == 0.0:
+        return np.complex(_drgamma(z.real), 0.0)
+    elif z.real > SMALLX or abs(z.imag) > SMALLY:
+        return np.exp(-_cloggamma(z))
+    elif z.real >= 0.5:
+        return _cgamma_lanczos(z, True)
+    # Reflection formula
+    return _csinpi(z)*_cgamma_lanczos(1.0 - z, False)/_π
+
+
+@generated_jit(nopython=True, cache=settings.CACHE)
+def _gamma(a):
+    if a == numba.types.float64:
+        return lambda a: _dgamma(a)
+    elif a == numba.types.complex128:
+        return lambda a: _cgamma(a)
+
+
+@generated_jit(nopython=True, cache=settings.CACHE)
+def _rgamma(a):
+    if a == numba.types.float64:
+        return lambda a: _drgamma(a)
+    elif a == numba.types.complex128:
+        return lambda a: _crgamma(a)
+
+
+@vectorize(
+    ['float64(float64)', 'complex128(complex128)'],
+    nopython=True,
+    cache=settings.CACHE,
+)
+def gamma(z):
     """The Gamma function
 
     Parameters
     ----------
-    x : array-like
-        Points on the real line.
+    z : array-like
+        Points on the real line or complex plane
+    out : ndarray, optional
+        Output array for the values of `gamma` at `z`
+
+    Returns
+    -------
+    ndarray
+        Values of `gamma` at `z`
+
+    See Also
+    --------
+    rgamma: Reciprocal of the Gamma function
+
+    """
+    return _gamma(z)
+
+
+@vectorize(
+    ['float64(float64)', 'complex128(complex128)'],
+    nopython=True,
+    cache=settings.CACHE,
+)
+def rgamma(z):
+    r"""Reciprocal of the Gamma function.
+
+    The function :math:`1/\Gamma(z)` is entire; it is zero at the
+    poles of Gamma and is computed without overflowing where Gamma
+    underflows.
+
+    Parameters
+    ----------
+    z : array-like
+        Points on the real line or complex plane
     out : ndarray, optional
-        Output array for the values of `gamma` at `x`
+        Output array for the values of `rgamma` at `z`
 
     Returns
     -------
     ndarray
-        Values of `gamma` at `x`
+        Values of `rgamma` at `z`
+
+    See Also
+    --------
+    gamma: The Gamma function
+
+    """
+    return _rgamma(z)
+
+
+@njit(void(Array(float64, 1, "C", readonly=True), int64, float64[:, :]),
+      cache=settings.CACHE)
+def _gamma_progression(x0, h, out):
+    n = out.shape[1]
+    for i in range(x0.shape[0]):
+        res = np.nan
+        xprev = x0[i]
+        for k in range(n):
+            x = x0[i] + k*h
+            if k % PROGRESSION_RESEED == 0 or not np.isfinite(res) or res == 0:
+                res = _dgamma(x)
+            else:
+                # Γ(x) = x'(x' + 1)...(x' + h - 1)Γ(x') with x' = x - h.
+                # Use the previous point instead of x - h to avoid
+                # cancellation.
+                fac = 1.0
+                for j in range(h):
+                    fac *= xprev + j
+                res *= fac
+            out[i, k] = res
+            xprev = x
+
+
+def gamma_progression(x0, n, h=1):
+    r"""Gamma function on an arithmetic progression.
+
+    Computes :math:`\Gamma(x_0 + kh)` for :math:`k = 0, 1, \ldots, n
+    - 1` using the recurrence :math:`\Gamma(x + 1) = x\Gamma(x)`,
+    which is much cheaper than evaluating `gamma` at every point. To
+    bound the accumulated rounding error the Gamma function is
+    evaluated directly every 16 points.
+
+    Parameters
+    ----------
+    x0 : array-like
+        Starting points on the real line
+    n : int
+        Number of points in each progression
+    h : int, optional
+        Positive integer step of the progression
+
+    Returns
+    -------
+    ndarray
+        Array of shape ``np.shape(x0) + (n,)`` containing the values
+        of `gamma` on the progressions
+
+    See Also
+    --------
+    gamma: The Gamma function
+    lgamma_progression: Log-Gamma on an arithmetic progression
 
     """
-    return _dgamma(x)
+    if h != int(h) or h < 1:
+        raise ValueError('h must be a positive integer')
+    x0 = np.asarray(x0, dtype=np.float64)
+    out = np.empty(x0.shape + (n,))
+    _gamma_progression(
+        np.ascontiguousarray(x0.ravel()), int(h), out.reshape(-1, n),
+    )
+    return out
@@ -0,0 +1,168 @@
+"""Inverses of the Gamma and log-Gamma functions.
+
+Both functions are inverted on the branch to the right of the minimum
+of Gamma on the positive real axis, where they are strictly
+increasing. An initial guess is computed from Stirling's
+approximation and then refined with Halley's method.
+
+References
+----------
+[1] Corless et al., "On the Lambert W function",
+    Advances in Computational Mathematics, 1996.
+
+"""
+from numba import njit, vectorize
+import numpy as np
+
+from . import settings
+from .constants import _e, _ε, _log2π_2
+from .lgamma import _lgamma
+from .digamma import _ddigamma, _trigamma
+
+# Location of the minimum of Gamma on the positive real axis
+XMIN = 1.461632144968362341262659542325721328468
+# Gamma, log-Gamma and trigamma at XMIN
+GAMMA_MIN = 0.885603194410888700278815900582588733208
+LGAMMA_MIN = -0.1214862905358496080955145571776915821514
+TRIGAMMA_XMIN = 0.9676722454476211704274447617096507404113
+
+
+@njit('float64(float64)', cache=settings.CACHE)
+def _lambertw_approx(t):
+    """Rough approximation of the principal branch of Lambert W.
+
+    Uses the series about the branch point for small `t` and the
+    leading asymptotic terms for large `t` (see [1]), followed by two
+    Newton steps. Only suitable for initial guesses.
+
+    """
+    if t < 1.0:
+        p = np.sqrt(max(2.0*(_e*t + 1.0), 0.0))
+        w = -1.0 + p*(1.0 + p*(-1.0/3.0 + p*11.0/72.0))
+    elif t < 3.0:
+        w = np.log(t)
+    else:
+        logt = np.log(t)
+        w = logt - np.log(logt)
+
+    if w > -1.0:
+        for _ in range(2):
+            ew = np.exp(w)
+            w -= (w*ew - t)/(ew*(w + 1.0))
+    return w
+
+
+@njit('float64(float64)', cache=settings.CACHE)
+def _lgamma_inv(y):
+    if np.isnan(y) or y == np.inf:
+        return y
+    elif y < LGAMMA_MIN:
+        return np.nan
+    elif y == LGAMMA_MIN:
+        return XMIN
+
+    # Quadratic approximation around the minimum
+    xquad = XMIN + np.sqrt(2.0*(y - LGAMMA_MIN)/TRIGAMMA_XMIN)
+    if y < LGAMMA_MIN + 0.1:
+        x = xquad
+    else:
+        # Invert Γ(x) ≈ √(2π)((x - 1/2)/e)**(x - 1/2). Writing
+        # L = log(Γ(x)/√(2π)), we have x - 1/2 = e*exp(W(L/e)); note
+        # that the equivalent form L/W(L/e) is 0/0 at L = 0.
+        L = y - _log2π_2
+        x = 0.5 + _e*np.exp(_lambertw_approx(L/_e))
+        if x <= XMIN:
+            x = xquad
+
+    for _ in range(30):
+        df = _ddigamma(x)
+        if df <= 0.0:
+            # Numerically at the minimum; we know the root is to the
+            # right since y > LGAMMA_MIN.
+            x = xquad
+            continue
+        f = _lgamma(x) - y
+        d2f = _trigamma(x)
+        dx = f/df
+        denom = 1.0 - 0.5*dx*d2f/df
+        if denom > 0.5:
+            # Halley's method
+            dx /= denom
+        xnew = x - dx
+        if xnew <= XMIN:
+            # Don't step past the minimum onto the other branch
+            xnew = 0.5*(x + XMIN)
+        dx = x - xnew
+        x = xnew
+        if abs(dx) <= _ε*x:
+            break
+    return x
+
+
+@njit('float64(float64)', cache=settings.CACHE)
+def _gamma_inv(y):
+    if np.isnan(y) or y == np.inf:
+        return y
+    elif y < GAMMA_MIN:
+        return np.nan
+    return _lgamma_inv(np.log(y))
+
+
+@vectorize(['float64(float64)'], nopython=True, cache=settings.CACHE)
+def gamma_inv(y):
+    r"""Inverse of the Gamma function.
+
+    The Gamma function is strictly increasing on :math:`[x_0,
+    \infty)`, where :math:`x_0 \approx 1.4616` is the location of its
+    minimum on the positive real axis. This is the branch that is
+    inverted, so the result is NaN for :math:`y < \Gamma(x_0) \approx
+    0.8856`.
+
+    Parameters
+    ----------
+    y : array-like
+        Points on the real line
+    out : ndarray, optional
+        Output array for the values of `gamma_inv` at `y`
+
+    Returns
+    -------
+    ndarray
+        Values of `gamma_inv` at `y`
+
+    See Also
+    --------
+    lgamma_inv: Inverse of log-Gamma
+
+    """
+    return _gamma_inv(y)
+
+
+@vectorize(['float64(float64)'], nopython=True, cache=settings.CACHE)
+def lgamma_inv(y):
+    r"""Inverse of the log-Gamma function.
+
+    Inverts `lgamma` on the branch :math:`[x_0, \infty)`, where
+    :math:`x_0 \approx 1.4616` is the location of the minimum of the
+    Gamma function on the positive real axis. The result is NaN for
+    :math:`y < \log(\Gamma(x_0)) \approx -0.1215`. Unlike
+    `gamma_inv`, this does not overflow for large `y`.
+
+    Parameters
+    ----------
+    y : array-like
+        Points on the real line
+    out : ndarray, optional
+        Output array for the values of `lgamma_inv` at `y`
+
+    Returns
+    -------
+    ndarray
+        Values of `lgamma_inv` at `y`
+
+    See Also
+    --------
+    gamma_inv: Inverse of Gamma
+
+    """
+    return _lgamma_inv(y)
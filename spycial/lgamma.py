@@ -17,15 +17,36 @@ References
 
 """
 import numba
-from numba import njit, generated_jit, vectorize
+from numba import njit, generated_jit, vectorize, guvectorize
+from numba.types import float64, int64, void, Array
 import numpy as np
 
 from . import settings
-from .constants import _2π, _2πj, _logπ, _log2π_2, _e
+from .constants import _2π, _logπ, _log2π_2, _e
 from .trig import _csinpi, _dsinpi
 from .evalpoly import _cevalpoly, _devalrational
-from .lanczos import _lanczos_g, _lanczos_sum_expg_scaled
+from .lanczos import (
+    _lanczos_g,
+    _lanczos_sum_expg_scaled,
+    _lanczos_sum_expg_scaled_num,
+    _lanczos_sum_expg_scaled_denom,
+)
+
 
+# Number of steps of the recurrence between re-evaluating lgamma in
+# `lgamma_progression`
+PROGRESSION_RESEED = 16
+# Fold the running product into the logarithm once it gets this
+# large to avoid overflow
+PROGRESSION_RESCALE = 1e280
+# Both points are shifted above this before using the Stirling series
+# in `lgamma_diff`
+LGAMMA_DIFF_XMIN = 10.0
+# Fold the products in `multigammaln` into the logarithm once they get
+# this large. The factors are at most MULTIGAMMALN_MAX_RECURRENCE, so
+# nothing overflows.
+MULTIGAMMALN_RESCALE = 1e100
+MULTIGAMMALN_MAX_RECURRENCE = 1e100
 
 SMALLX = 7
 SMALLY = 7
@@ -195,24 +216,29 @@ def _cloggamma_stirling(z):
 
 
 @njit('complex128(complex128)', cache=settings.CACHE)
-def _cloggamma_recurrence(z):
-    """Backward recurrence relation.
+def _cloggamma_lanczos(z):
+    """Lanczos approximation for log-Gamma with Re(z) >= 0.1.
 
-    See Proposition 2.2 in [1] and the Julia implementation [2].
+    Since Γ(z) = S(z)*(zgh/e)**(z - 1/2), where S is the scaled
+    Lanczos sum and zgh = z + g - 1/2, we have
 
-    """
-    signflips = 0
-    sb = 0
-    shiftprod = z
+    loggamma(z) = log(S(z)) + (z - 1/2)*(log(zgh) - 1).
+
+    For Re(z) > 0 neither logarithm crosses its branch cut, so this
+    is the principal branch. It replaces the backward recurrence of
+    Proposition 2.2 in [1], which needs a complex multiply and sign
+    tracking per step followed by the Stirling series.
 
-    z += 1
-    while z.real <= SMALLX:
-        shiftprod *= z
-        nsb = np.signbit(shiftprod.imag)
-        signflips += 1 if nsb != 0 and sb == 0 else 0
-        sb = nsb
-        z += 1
-    return _cloggamma_stirling(z) - np.log(shiftprod) - signflips*_2πj
+    """
+    shift = np.complex(0.0, 0.0)
+    if z.real < 0.5:
+        # The approximation is only accurate for Re(z) >= 1/2
+        shift = np.log(z)
+        z += 1.0
+    zgh = z + _lanczos_g - 0.5
+    s = (_cevalpoly(_lanczos_sum_expg_scaled_num, z)
+         /_cevalpoly(_lanczos_sum_expg_scaled_denom, z))
+    return np.log(s) + (z - 0.5)*(np.log(zgh) - 1.0) - shift
 
 
 @njit('complex128(complex128)', cache=settings.CACHE)
@@ -250,11 +276,12 @@ def _cloggamma(z):
         tmp = np.copysign(_2π, z.imag)*np.floor(0.5*z.real + 0.25)
         return (np.complex(_logπ, tmp) - np.log(_csinpi(z))
                 - _cloggamma(1 - z))
-    elif np.signbit(z.imag) == 0:
-        # z.imag >= 0 but is not -0.0
-        return _cloggamma_recurrence(z)
-    else:
-        return _cloggamma_recurrence(z.conjugate()).conjugate()
+    elif abs(z) > SMALLY:
+        # The Stirling series is accurate for |z| > SMALLY with
+        # Re(z) >= 0.1; the rectangle above already relies on this
+        # at z = 0.1 + SMALLY*1j
+        return _cloggamma_stirling(z)
+    return _cloggamma_lanczos(z)
 
 
 @njit('float64(float64)', cache=settings.CACHE)
@@ -318,3 +345,370 @@ def loggamma(z):
 
     """
     return _loggamma(z)
+
+
+@njit(void(Array(float64, 1, "C", readonly=True), int64, float64[:, :]),
+      cache=settings.CACHE)
+def _lgamma_progression(x0, h, out):
+    n = out.shape[1]
+    for i in range(x0.shape[0]):
+        res = np.nan
+        xprev = x0[i]
+        for k in range(n):
+            x = x0[i] + k*h
+            if k % PROGRESSION_RESEED == 0 or not np.isfinite(res):
+                res = _lgamma(x)
+            else:
+                # lgamma(x) = log|x'(x' + 1)...(x' + h - 1)| + lgamma(x')
+                # with x' = x - h. Use the previous point instead of
+                # x - h to avoid cancellation.
+                fac = 1.0
+                for j in range(h):
+                    fac *= xprev + j
+                    if abs(fac) > PROGRESSION_RESCALE:
+                        res += np.log(abs(fac))
+                        fac = 1.0
+                res += np.log(abs(fac))
+            out[i, k] = res
+            xprev = x
+
+
+def lgamma_progression(x0, n, h=1):
+    r"""Log-Gamma function on an arithmetic progression.
+
+    Computes :math:`\log|\Gamma(x_0 + kh)|` for :math:`k = 0, 1,
+    \ldots, n - 1` using the recurrence :math:`\Gamma(x + 1) =
+    x\Gamma(x)`. The product of the factors is folded into the
+    logarithm before it can overflow, and `lgamma` is evaluated
+    directly every 16 points to bound the accumulated rounding
+    error.
+
+    Parameters
+    ----------
+    x0 : array-like
+        Starting points on the real line
+    n : int
+        Number of points in each progression
+    h : int, optional
+        Positive integer step of the progression
+
+    Returns
+    -------
+    ndarray
+        Array of shape ``np.shape(x0) + (n,)`` containing the values
+        of `lgamma` on the progressions
+
+    See Also
+    --------
+    lgamma: Logarithm of the absolute value of Gamma
+    gamma_progression: Gamma on an arithmetic progression
+
+    """
+    if h != int(h) or h < 1:
+        raise ValueError('h must be a positive integer')
+    x0 = np.asarray(x0, dtype=np.float64)
+    out = np.empty(x0.shape + (n,))
+    _lgamma_progression(
+        np.ascontiguousarray(x0.ravel()), int(h), out.reshape(-1, n),
+    )
+    return out
+
+
+@njit('float64(float64, float64)', cache=settings.CACHE)
+def _lgamma_diff_stirling(x, a):
+    """Compute lgamma(x + a) - lgamma(x) for x, x + a >= LGAMMA_DIFF_XMIN.
+
+    Subtracting the Stirling series at the two points gives
+
+    (x + a - 1/2)log1p(a/x) + a(log(x) - 1) + S(x + a) - S(x)
+
+    where S is the asymptotic series. Writing u = 1/x and v = 1/(x +
+    a), the differences d[m] = v**m - u**m satisfy d[m + 2] = v**2
+    d[m] + u**m d[2], so the difference of the series is computed
+    without cancellation even when a is small.
+
+    """
+    u = 1.0/x
+    v = 1.0/(x + a)
+    d = -a*u*v
+    d2 = (u + v)*d
+    uu = u*u
+    vv = v*v
+    um = u
+    res = 0.0
+    for i in range(STIRLING_COEFFS.shape[0] - 1, -1, -1):
+        res += STIRLING_COEFFS[i]*d
+        d = vv*d + um*d2
+        um *= uu
+    res += (x + a - 0.5)*np.log1p(a*u) + a*(np.log(x) - 1.0)
+    return res
+
+
+@njit('float64(float64, float64)', cache=settings.CACHE)
+def _lgamma_diff(x, a):
+    y = x + a
+    if not (np.isfinite(x) and np.isfinite(a)) or x <= 0.0 or y <= 0.0:
+        if x <= 0.0 and x == np.floor(x) and y <= 0.0 and y == np.floor(y):
+            # The poles cancel; this is log|(-1)**a (-y)!/(-x)!|
+            return _lgamma(1.0 - x) - _lgamma(1.0 - y)
+        return _lgamma(y) - _lgamma(x)
+    elif a == 0.0:
+        return 0.0
+
+    # Shift both points up with the recurrence
+    #
+    # lgamma(x + a) - lgamma(x) = D(x + n, a) - sum(log((x + a + j)/(x + j)))
+    #
+    # where the sum is over j = 0, ..., n - 1.
+    res = 0.0
+    while x < LGAMMA_DIFF_XMIN or y < LGAMMA_DIFF_XMIN:
+        r = a/x
+        if abs(r) < 0.5:
+            res -= np.log1p(r)
+        else:
+            res -= np.log(y/x)
+        x += 1.0
+        y += 1.0
+    return res + _lgamma_diff_stirling(x, a)
+
+
+@vectorize(['float64(float64, float64)'], nopython=True, cache=settings.CACHE)
+def lgamma_diff(x, a):
+    r"""Difference of the log-Gamma function at two points.
+
+    Computes :math:`\log|\Gamma(x + a)| - \log|\Gamma(x)|`. For
+    positive :math:`x` and :math:`x + a` the difference is evaluated
+    directly from the Stirling series, so it keeps full relative
+    accuracy when :math:`x` is large or :math:`a` is small, where
+    subtracting two values of `lgamma` loses most of the digits.
+
+    Parameters
+    ----------
+    x : array-like
+        Points on the real line
+    a : array-like
+        Shifts on the real line
+    out : ndarray, optional
+        Output array for the values of `lgamma_diff` at `x` and `a`
+
+    Returns
+    -------
+    ndarray
+        Values of `lgamma_diff` at `x` and `a`
+
+    See Also
+    --------
+    lgamma: Logarithm of the absolute value of Gamma
+    poch: The Pochhammer symbol
+
+    """
+    return _lgamma_diff(x, a)
+
+
+@njit('float64(float64, int64)', cache=settings.CACHE)
+def _lgamma_chain_sum(x0, m):
+    """Compute the sum of lgamma(x0 + k) for k = 0, ..., m - 1.
+
+    Requires x0 > 0. With P[k] = x0(x0 + 1)...(x0 + k - 1) the sum is
+
+    m*lgamma(x0) + log(P[1]P[2]...P[m - 1])
+
+    and the product of the products is accumulated directly, only
+    being folded into the logarithm before it can overflow.
+
+    """
+    res = _lgamma(x0)
+    if x0 > MULTIGAMMALN_MAX_RECURRENCE:
+        for k in range(1, m):
+            res += _lgamma(x0 + k)
+        return res
+    elif m == 1:
+        return res
+
+    res *= m
+
+    start = 0
+    if x0 < 1.0:
+        # Keep the factors >= 1 so that the products only grow
+        res += (m - 1)*np.log(x0)
+        start = 1
+    P = 1.0
+    logP = 0.0
+    Q = 1.0
+    logQ = 0.0
+    for i in range(start, m - 1):
+        P *= x0 + i
+        if P > MULTIGAMMALN_RESCALE:
+            logP += np.log(P)
+            P = 1.0
+        Q *= P
+        logQ += logP
+        if Q > MULTIGAMMALN_RESCALE:
+            logQ += np.log(Q)
+            Q = 1.0
+    return res + logQ + np.log(Q)
+
+
+@njit('float64(float64, int64)', cache=settings.CACHE)
+def _multigammaln(a, d):
+    if np.isnan(a) or d < 0:
+        return np.nan
+    elif d == 0:
+        return 0.0
+    elif a <= 0.5*(d - 1):
+        return np.nan
+    elif a == np.inf:
+        return np.inf
+
+    # The terms lgamma(a - j/2) split into two chains with integer
+    # spacing, starting from a and a - 1/2.
+    m0 = (d + 1)//2
+    m1 = d//2
+    res = 0.25*d*(d - 1)*_logπ
+    res += _lgamma_chain_sum(a - (m0 - 1), m0)
+    if m1 > 0:
+        res += _lgamma_chain_sum(a - 0.5 - (m1 - 1), m1)
+    return res
+
+
+@vectorize(['float64(float64, int64)'], nopython=True, cache=settings.CACHE)
+def multigammaln(a, d):
+    r"""Logarithm of the multivariate Gamma function.
+
+    Defined as
+
+    .. math::
+
+        \log(\Gamma_d(a)) = \frac{d(d - 1)}{4}\log(\pi)
+        + \sum_{j = 1}^d \log(\Gamma(a + (1 - j)/2))
+
+    for :math:`a > (d - 1)/2`; the result is NaN otherwise. The terms
+    of the sum are computed with the recurrence for Gamma, so only
+    two evaluations of `lgamma` are needed for any `d`.
+
+    Parameters
+    ----------
+    a : array-like
+        Points on the real line
+    d : array-like
+        Nonnegative integer dimensions
+    out : ndarray, optional
+        Output array for the values of `multigammaln` at `a` and `d`
+
+    Returns
+    -------
+    ndarray
+        Values of `multigammaln` at `a` and `d`
+
+    See Also
+    --------
+    lgamma: Logarithm of the absolute value of Gamma
+
+    """
+    return _multigammaln(a, d)
+
+
+@njit('UniTuple(float64, 2)(float64, float64, float64)', cache=settings.CACHE)
+def _neumaier_add(s, c, v):
+    """Add `v` to the compensated sum `s + c`."""
+    t = s + v
+    if abs(s) >= abs(v):
+        c += (s - t) + v
+    else:
+        c += (v - t) + s
+    return t, c
+
+
+@njit('float64(float64, float64)', cache=settings.CACHE)
+def _neumaier_result(s, c):
+    if np.isfinite(s):
+        return s + c
+    # The compensation is NaN once the sum overflows or hits a pole
+    return s
+
+
+@guvectorize(
+    ['void(float64[:], float64[:])'],
+    '(n)->()',
+    nopython=True,
+    target='parallel',
+    cache=settings.CACHE,
+)
+def lgamma_sum(x, out):
+    r"""Sum of the log-Gamma function over an axis.
+
+    Computes :math:`\sum_i \log|\Gamma(x_i)|` with compensated
+    summation without creating a temporary array for the values of
+    `lgamma`. The reduction is over the last axis by default; pass
+    ``axis`` to reduce over a different one. Separate reductions are
+    computed in parallel.
+
+    Parameters
+    ----------
+    x : array-like
+        Points on the real line
+    out : ndarray, optional
+        Output array for the values of `lgamma_sum` at `x`
+
+    Returns
+    -------
+    ndarray
+        Values of `lgamma_sum` at `x`
+
+    See Also
+    --------
+    lgamma: Logarithm of the absolute value of Gamma
+    lgamma_diff_sum: Sum of differences of log-Gamma over an axis
+
+    """
+    s = 0.0
+    c = 0.0
+    for i in range(x.shape[0]):
+        s, c = _neumaier_add(s, c, _lgamma(x[i]))
+    out[0] = _neumaier_result(s, c)
+
+
+@guvectorize(
+    ['void(float64[:], float64[:], float64[:])'],
+    '(n),()->()',
+    nopython=True,
+    target='parallel',
+    cache=settings.CACHE,
+)
+def lgamma_diff_sum(x, a, out):
+    r"""Sum of differences of the log-Gamma function over an axis.
+
+    Computes :math:`\sum_i \log|\Gamma(x_i + a)| - \log|\Gamma(x_i)|`
+    with compensated summation without creating temporary arrays.
+    The reduction is over the last axis by default; pass ``axis`` to
+    reduce over a different one. The shift `a` is broadcast against
+    the remaining axes, and separate reductions are computed in
+    parallel.
+
+    Parameters
+    ----------
+    x : array-like
+        Points on the real line
+    a : array-like
+        Shifts on the real line
+    out : ndarray, optional
+        Output array for the values of `lgamma_diff_sum` at `x` and
+        `a`
+
+    Returns
+    -------
+    ndarray
+        Values of `lgamma_diff_sum` at `x` and `a`
+
+    See Also
+    --------
+    lgamma: Logarithm of the absolute value of Gamma
+    lgamma_sum: Sum of log-Gamma over an axis
+
+    """
+    a0 = a[0]
+    s = 0.0
+    c = 0.0
+    for i in range(x.shape[0]):
+        s, c = _neumaier_add(s, c, _lgamma_diff(x[i], a0))
+    out[0] = _neumaier_result(s, c)
@@ -0,0 +1,192 @@
+"""Ratios of Gamma functions.
+
+The ratios are computed directly from the Lanczos approximation
+following Boost's `tgamma_delta_ratio` and `tgamma_ratio`, so they
+don't overflow when the individual Gamma functions do.
+
+Boost is:
+
+Copyright John Maddock 2006.
+
+Use, modification and distribution are subject to the
+Boost Software License, Version 1.0. (See accompanying file
+LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+
+"""
+from numba import njit, vectorize
+import numpy as np
+
+from . import settings
+from .constants import _π, _e, _γ, _root_ε
+from .trig import _dsinpi
+from .gamma import _dgamma
+from .lgamma import _lgamma
+from .lanczos import _lanczos_g, _lanczos_sum_expg_scaled
+
+# Largest integer increment for which `poch` uses the product
+# a(a + 1)...(a + x - 1) directly
+POCH_MAX_PRODUCT = 20
+
+
+@njit('float64(float64, float64, float64)', cache=settings.CACHE)
+def _gamma_product(x, y, c):
+    """Compute c*Γ(x)Γ(y) for x, y > 0 without spurious overflow."""
+    res = _dgamma(x)*_dgamma(y)
+    if np.isfinite(res) and res > 0.0:
+        return c*res
+    return np.copysign(np.exp(_lgamma(x) + _lgamma(y) + np.log(abs(c))), c)
+
+
+@njit('float64(float64, float64, float64)', cache=settings.CACHE)
+def _gamma_ratio_positive(x, y, d):
+    """Compute Γ(x)/Γ(y) for x, y > 0 where d = x - y.
+
+    Passing d separately avoids losing accuracy when x is computed as
+    y + d.
+
+    """
+    if d == 0.0:
+        return 1.0
+    elif y < _root_ε:
+        # Γ(y) ~ 1/y - γ
+        scale = y/(1.0 - _γ*y)
+        if x < _root_ε:
+            return (1.0 - _γ*x)/x*scale
+        res = _dgamma(x)
+        if np.isfinite(res):
+            return res*scale
+        return np.exp(_lgamma(x) + np.log(scale))
+    elif x < _root_ε:
+        return (1.0 - _γ*x)/_dgamma(y)/x
+
+    # Γ(z) = S(z)(z + g - 1/2)**(z - 1/2)/e**(z - 1/2) where S is the
+    # scaled Lanczos sum, so
+    #
+    # Γ(x)/Γ(y) = S(x)/S(y) (1 + d/ygh)**(x - 1/2) (ygh/e)**d.
+    #
+    # Since ygh > e the last two factors both grow or both decay with
+    # d, so neither overflows unless the result does.
+    ygh = y + _lanczos_g - 0.5
+    res = _lanczos_sum_expg_scaled(x)/_lanczos_sum_expg_scaled(y)
+    res *= np.exp((x - 0.5)*np.log1p(d/ygh))
+    res *= (ygh/_e)**d
+    return res
+
+
+@njit('float64(float64, float64, float64)', cache=settings.CACHE)
+def _gamma_ratio_impl(x, y, d):
+    """Compute Γ(x)/Γ(y) for real x, y where d = x - y."""
+    if np.isnan(x) or np.isnan(y) or np.isnan(d):
+        return np.nan
+
+    xpole = x <= 0.0 and x == np.floor(x)
+    ypole = y <= 0.0 and y == np.floor(y)
+    if xpole and ypole:
+        # Ratio of the residues: Γ(-m)/Γ(-k) → (-1)**(m - k) k!/m!
+        sign = 1.0 if d % 2.0 == 0.0 else -1.0
+        return sign*_gamma_ratio_positive(1.0 - y, 1.0 - x, d)
+    elif xpole:
+        return np.inf
+    elif ypole:
+        return 0.0
+
+    if x == np.inf:
+        return np.inf if y != np.inf else np.nan
+    elif y == np.inf:
+        return 0.0
+    elif x == -np.inf or y == -np.inf:
+        return np.nan
+
+    if x > 0.0 and y > 0.0:
+        return _gamma_ratio_positive(x, y, d)
+    elif x <= 0.0 and y <= 0.0:
+        # Reflect both: the difference of 1 - y and 1 - x is still d
+        return (_dsinpi(y)/_dsinpi(x)
+                *_gamma_ratio_positive(1.0 - y, 1.0 - x, d))
+    elif x <= 0.0:
+        # Γ(x) = π/(sin(πx)Γ(1 - x))
+        return 1.0/_gamma_product(1.0 - x, y, _dsinpi(x)/_π)
+    else:
+        # 1/Γ(y) = sin(πy)Γ(1 - y)/π
+        return _gamma_product(x, 1.0 - y, _dsinpi(y)/_π)
+
+
+@njit('float64(float64, float64)', cache=settings.CACHE)
+def _poch(a, x):
+    if x == 0.0 and not np.isnan(a):
+        return 1.0
+    elif 0.0 < x <= POCH_MAX_PRODUCT and x == np.floor(x):
+        res = 1.0
+        for k in range(np.intc(x)):
+            res *= a + k
+        return res
+    return _gamma_ratio_impl(a + x, a, x)
+
+
+@njit('float64(float64, float64)', cache=settings.CACHE)
+def _gamma_ratio(a, b):
+    return _gamma_ratio_impl(a, b, a - b)
+
+
+@vectorize(['float64(float64, float64)'], nopython=True, cache=settings.CACHE)
+def poch(a, x):
+    r"""The Pochhammer symbol (rising factorial).
+
+    Defined as
+
+    .. math::
+
+        (a)_x = \frac{\Gamma(a + x)}{\Gamma(a)}.
+
+    The ratio is evaluated directly, so the result is finite whenever
+    it is representable even if :math:`\Gamma(a + x)` overflows.
+
+    Parameters
+    ----------
+    a : array-like
+        Points on the real line
+    x : array-like
+        Points on the real line
+    out : ndarray, optional
+        Output array for the values of `poch` at `a` and `x`
+
+    Returns
+    -------
+    ndarray
+        Values of `poch` at `a` and `x`
+
+    See Also
+    --------
+    gamma_ratio: Ratio of two Gamma functions
+
+    """
+    return _poch(a, x)
+
+
+@vectorize(['float64(float64, float64)'], nopython=True, cache=settings.CACHE)
+def gamma_ratio(a, b):
+    r"""Ratio of two Gamma functions.
+
+    Computes :math:`\Gamma(a)/\Gamma(b)` without forming either Gamma
+    function, so the result is finite whenever it is representable.
+
+    Parameters
+    ----------
+    a : array-like
+        Points on the real line
+    b : array-like
+        Points on the real line
+    out : ndarray, optional
+        Output array for the values of `gamma_ratio` at `a` and `b`
+
+    Returns
+    -------
+    ndarray
+        Values of `gamma_ratio` at `a` and `b`
+
+    See Also
+    --------
+    poch: The Pochhammer symbol
+
+    """
+    return _gamma_ratio(a, b)
@@ -0,0 +1,75 @@
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
+import mpmath
+
+import spycial as sc
+from spycial.test_utilities import Arg, mpmath_allclose
+
+
+def test_beta():
+    mpmath_allclose(sc.beta, mpmath.beta, [Arg(0, 1e12), Arg(0, 1e12)],
+                    2000, 2e-13, dps=40)
+
+
+def test_beta_negative():
+    def mpmath_beta(a, b):
+        try:
+            return mpmath.beta(a, b)
+        except ValueError:
+            return np.inf
+
+    # The error is dominated by the rounding of a + b near the poles
+    a = np.linspace(-30.25, 10.25, 41)
+    b = np.linspace(-20.4, 10.6, 32)[:, None]
+    expected = np.vectorize(lambda a0, b0: float(mpmath_beta(a0, b0)))(a, b)
+    assert_allclose(sc.beta(a, b), expected, atol=0, rtol=1e-12)
+
+
+def test_beta_poles():
+    # Γ(-2)/Γ(-1) is the ratio of the residues
+    assert_allclose(sc.beta(-2.0, 1.0), -0.5, rtol=1e-15)
+    assert_equal(sc.beta(-1.0, 0.5), np.inf)
+    assert_equal(sc.beta(-1.0, -2.0), np.inf)
+
+
+def test_lbeta():
+    mpmath_allclose(sc.lbeta, lambda a, b: mpmath.log(mpmath.beta(a, b)),
+                    [Arg(1e-300, 1e30), Arg(1e-300, 1e30)], 2000, 1e-14,
+                    dps=60)
+
+
+def test_lbeta_large_arguments():
+    # The composition loses all digits here
+    a = np.array([1e15, 1e20, 3e8])
+    b = np.array([2.5, 0.25, 7e7])
+    with mpmath.workdps(60):
+        expected = [float(mpmath.log(mpmath.beta(a0, b0)))
+                    for a0, b0 in zip(a, b)]
+    assert_allclose(sc.lbeta(a, b), expected, atol=0, rtol=1e-14)
+
+
+def test_lbinom():
+    def mpmath_lbinom(n, k):
+        return mpmath.log(abs(mpmath.binomial(n, k)))
+
+    n = np.logspace(-3, 15, 40)
+    k = n*np.linspace(0, 1, 25)[:, None]
+    expected = np.vectorize(
+        lambda n0, k0: float(mpmath_lbinom(mpmath.mpf(n0), mpmath.mpf(k0)))
+    )(n, k)
+    # The result is near zero when n is small
+    assert_allclose(sc.lbinom(n, k), expected, atol=1e-15, rtol=1e-13)
+
+
+def test_lbinom_integers():
+    n = np.arange(0, 60, dtype=np.float64)
+    k = np.arange(0, 60, dtype=np.float64)[:, None]
+    k = np.broadcast_to(k, (60, 60))
+    expected = np.vectorize(
+        lambda n0, k0: np.log(float(mpmath.binomial(n0, k0)))
+        if k0 <= n0 else np.nan
+    )(n, k)
+    mask = k <= n
+    assert_allclose(sc.lbinom(n, k)[mask], expected[mask], atol=1e-15,
+                    rtol=1e-14)
+    assert_equal(sc.lbinom(n, 0.0), 0.0)
@@ -1,9 +1,10 @@
 import numpy as np
-from numpy.testing import assert_equal
+from numpy.testing import assert_equal, assert_allclose
 import mpmath
 
 import spycial as sc
-from spycial.test_utilities import Arg, mpmath_allclose
+from spycial.test_utilities import Arg, ComplexArg, UIntArg, mpmath_allclose
+from spycial.constants import _ε
 
 
 def test_digamma():
@@ -26,3 +27,151 @@ def test_digamma_int():
     with mpmath.workdps(30):
         y = [float(mpmath.digamma(x0)) for x0 in x]
     assert_equal(sc.digamma(x), y)
+
+
+def test_digamma_complex():
+    # Compare the moduli of the errors; the real or imaginary part
+    # alone can be much smaller than the result.
+    z = ComplexArg(complex(-1e3, -1e3), complex(1e3, 1e3)).values(2000)
+    z = z[(z.imag != 0) | (z.real > 0) | (z.real != np.floor(z.real))]
+    expected = np.vectorize(lambda z0: complex(mpmath.digamma(z0)))(z)
+    assert_allclose(sc.digamma(z), expected, atol=0, rtol=1e-13)
+
+
+def test_digamma_complex_root():
+    # Points around the positive zero, where the Taylor series is used
+    x0 = 1.4616321449683623
+    t = np.linspace(0, 2*np.pi, 50, endpoint=False)
+    z = np.concatenate([x0 + r*np.exp(1j*t) for r in [1e-10, 1e-3, 0.2, 0.3]])
+    with mpmath.workdps(40):
+        expected = [complex(mpmath.digamma(mpmath.mpc(z0))) for z0 in z]
+    assert_allclose(sc.digamma(z), expected, atol=0, rtol=5e-15)
+
+
+def test_digamma_complex_real_axis():
+    x = np.array([-2.5, -1.0, 0.5, 1.0, 10.0])
+    assert_equal(sc.digamma(x + 0j), sc.digamma(x) + 0j)
+
+
+def test_dirichlet_expectation():
+    rng = np.random.RandomState(1234)
+    alpha = rng.gamma(1.0, size=(20, 7))
+    expected = sc.digamma(alpha) - sc.digamma(alpha.sum(axis=-1))[:, None]
+    assert_allclose(sc.dirichlet_expectation(alpha), expected,
+                    atol=0, rtol=1e-14)
+
+
+def test_dirichlet_expectation_exp():
+    rng = np.random.RandomState(1234)
+    alpha = rng.gamma(1.0, size=(20, 7))
+    elog, exp_elog = sc.dirichlet_expectation_exp(alpha)
+    assert_equal(elog, sc.dirichlet_expectation(alpha))
+    assert_allclose(exp_elog, np.exp(elog), atol=0, rtol=1e-15)
+
+
+def test_trigamma():
+    def mpmath_trigamma(x):
+        if x == 0:
+            # Double pole
+            return np.inf
+        elif x < 0 and x == np.floor(x):
+            # Hit a pole.
+            return np.nan
+        return mpmath.psi(1, x)
+
+    # Mpmath is very slow for large negative arguments, so limit the
+    # range and spot-check the reflection formula separately.
+    mpmath_allclose(sc.trigamma, mpmath_trigamma, [Arg(-1e5, 1e300)],
+                    1000, 5e-14, dps=40)
+
+
+def test_trigamma_reflection():
+    x = np.array([-1e10 - 0.25, -12345.5, -1e15 - 0.5])
+    with mpmath.workdps(40):
+        y = [
+            float(mpmath.pi**2/mpmath.sinpi(x0)**2 - mpmath.psi(1, 1 - x0))
+            for x0 in x
+        ]
+    assert_allclose(sc.trigamma(x), y, atol=0, rtol=1e-13)
+
+
+def test_trigamma_special_cases():
+    assert sc.trigamma(0.0) == np.inf
+    assert sc.trigamma(-0.0) == np.inf
+    assert np.isnan(sc.trigamma(-1.0))
+    assert sc.trigamma(np.inf) == 0
+    assert np.isnan(sc.trigamma(-np.inf))
+
+
+def test_digamma_inv_special_cases():
+    assert np.isnan(sc.digamma_inv(np.nan))
+    assert sc.digamma_inv(np.inf) == np.inf
+    assert sc.digamma_inv(1000) == np.inf
+    assert sc.digamma_inv(-np.inf) == 0
+
+
+def test_digamma_inv():
+    y = np.array([-1e5, -100.0, -10.0, -1.0, 0.0, 0.5, 1.0, 10.0, 100.0])
+    with mpmath.workdps(40):
+        x = [
+            float(mpmath.findroot(lambda t: mpmath.digamma(t) - y0,
+                                  float(sc.digamma_inv(y0)),
+                                  solver='newton',
+                                  df=lambda t: mpmath.psi(1, t)))
+            for y0 in y
+        ]
+    assert_allclose(sc.digamma_inv(y), x, atol=0, rtol=1e-13)
+
+
+def test_digamma_inv_inverts_digamma():
+    x = np.logspace(-10, 10, 200)
+    assert_allclose(sc.digamma_inv(sc.digamma(x)), x, atol=0, rtol=1e-13)
+    y = np.linspace(-100, 100, 200)
+    # Avoid the relative error blowing up near the root of digamma
+    assert_allclose(sc.digamma(sc.digamma_inv(y)), y, atol=1e-14,
+                    rtol=4e-15)
+
+
+def test_polygamma_special_cases():
+    n = np.uint64(3)
+    assert sc.polygamma(n, 0.0) == np.inf
+    assert sc.polygamma(n, -0.0) == np.inf
+    assert sc.polygamma(np.uint64(2), 0.0) == -np.inf
+    assert sc.polygamma(np.uint64(2), -0.0) == np.inf
+    assert np.isnan(sc.polygamma(n, -2.0))
+    assert np.isnan(sc.polygamma(n, np.nan))
+    assert sc.polygamma(n, np.inf) == 0
+
+
+def test_polygamma_low_orders():
+    x = np.linspace(-10.5, 10.5, 50)
+    assert_equal(sc.polygamma(np.uint64(0), x), sc.digamma(x))
+    assert_equal(sc.polygamma(np.uint64(1), x), sc.trigamma(x))
+
+
+def test_polygamma_positive_x():
+    mpmath_allclose(
+        sc.polygamma,
+        mpmath.psi,
+        [UIntArg(2, 30), Arg(0, 1e5, inclusive_a=False)],
+        400,
+        rtol=8*_ε,
+        dps=60,
+    )
+
+
+def test_polygamma_negative_x():
+    def mpmath_polygamma(n, x):
+        if x == np.floor(x):
+            # Hit a pole.
+            return np.nan
+        return mpmath.psi(n, x)
+
+    mpmath_allclose(
+        sc.polygamma,
+        mpmath_polygamma,
+        [UIntArg(2, 12), Arg(-100, 0, inclusive_b=False)],
+        100,
+        rtol=1e-13,
+        dps=60,
+    )
@@ -36,3 +36,21 @@ def test_between_1_and_underflow():
 def test_immediately_after_underflow():
     x = np.nextafter(-MINEXP, np.inf)
     assert sc.e1(x) == float(mpmath.e1(x))
+
+
+def test_e1x():
+    def mpmath_e1x(x):
+        x = mpmath.mpf(x)
+        return mpmath.exp(x)*mpmath.e1(x)
+
+    mpmath_allclose(sc.e1x, mpmath_e1x, [Arg(0, 1e5, inclusive_a=False)],
+                    500, rtol=4*_ε, dps=40)
+
+
+def test_e1x_special_cases():
+    assert np.isnan(sc.e1x(-1))
+    assert sc.e1x(0) == np.inf
+    assert sc.e1x(np.inf) == 0
+    # e1x(x) ~ 1/x to double precision
+    x = np.logspace(20, 300, 10)
+    assert np.all(sc.e1x(x) == 1/x)
@@ -70,3 +70,20 @@ def test_greater_than_40():
         200,
         rtol=2*_ε,
     )
+
+
+def test_eix():
+    def mpmath_eix(x):
+        x = mpmath.mpf(x)
+        return mpmath.exp(-x)*mpmath.ei(x)
+
+    mpmath_allclose(sc.eix, mpmath_eix, [Arg(-1e5, 1e5)], 1000,
+                    rtol=4*_ε, dps=40)
+
+
+def test_eix_special_cases():
+    assert sc.eix(0) == -np.inf
+    assert sc.eix(np.inf) == 0
+    res = sc.eix(-np.inf)
+    assert res == 0
+    assert np.signbit(res)
@@ -1,5 +1,5 @@
 import numpy as np
-from numpy.testing import assert_equal
+from numpy.testing import assert_equal, assert_allclose
 import mpmath
 
 import spycial as sc
@@ -23,3 +23,229 @@ def test_erfc_large():
     x = np.linspace(100, 300)
     assert_equal(sc.erfc(x), 0.0)
     assert_equal(sc.erfc(-x), 2.0)
+
+
+def test_erfcx():
+    def mpmath_erfcx(x):
+        x = mpmath.mpf(x)
+        return mpmath.exp(x**2)*mpmath.erfc(x)
+
+    mpmath_allclose(sc.erfcx, mpmath_erfcx, [Arg(-26, 1e4)], 2000,
+                    4*np.finfo(float).eps, dps=40)
+
+
+def test_erfcx_large():
+    # erfcx(x) ~ 1/(sqrt(π)x) to double precision
+    x = np.logspace(9, 300, 50)
+    assert_allclose(sc.erfcx(x), 1/(np.sqrt(np.pi)*x), atol=0,
+                    rtol=2*np.finfo(float).eps)
+    assert_equal(sc.erfcx([np.inf, -27, -np.inf]), [0, np.inf, np.inf])
+
+
+def test_log_erfc():
+    def mpmath_log_erfc(x):
+        x = mpmath.mpf(x)
+        if abs(x) < 0.5:
+            return mpmath.log1p(-mpmath.erf(x))
+        return mpmath.log(mpmath.erfc(x))
+
+    mpmath_allclose(sc.log_erfc, mpmath_log_erfc, [Arg(-1e100, 1e6)],
+                    2000, 4*np.finfo(float).eps, dps=40)
+
+
+def test_log_erfc_large():
+    # log(erfc(x)) ~ -x**2 to double precision
+    x = np.logspace(10, 150, 50)
+    assert_allclose(sc.log_erfc(x), -x**2, atol=0,
+                    rtol=np.finfo(float).eps)
+    assert_equal(sc.log_erfc([np.inf, -np.inf]), [-np.inf, np.log(2)])
+
+
+def test_log_ndtr():
+    def mpmath_log_ndtr(x):
+        x = mpmath.mpf(x)
+        if x > -1:
+            return mpmath.log1p(-mpmath.ncdf(-x))
+        return mpmath.log(mpmath.ncdf(x))
+
+    mpmath_allclose(sc.log_ndtr, mpmath_log_ndtr, [Arg(-1e100, 37)],
+                    2000, 4*np.finfo(float).eps, dps=40)
+
+
+def test_log_ndtr_special_cases():
+    assert_equal(sc.log_ndtr([-np.inf, 0, 40, np.inf]),
+                 [-np.inf, -np.log(2), 0, 0])
+    assert np.isnan(sc.log_ndtr(np.nan))
+
+
+def test_ndtr():
+    def mpmath_ndtr(x):
+        return mpmath.ncdf(mpmath.mpf(x))
+
+    mpmath_allclose(sc.ndtr, mpmath_ndtr, [Arg(-38, 1e100)], 2000,
+                    4*np.finfo(float).eps, dps=40)
+
+
+def test_ndtr_special_cases():
+    assert_equal(sc.ndtr([-np.inf, -40, 0, np.inf]), [0, 0, 0.5, 1])
+    assert np.isnan(sc.ndtr(np.nan))
+
+
+def test_ndtr_float32_and_parallel():
+    x = np.linspace(-10, 10, 50)
+    expected = sc.ndtr(x)
+    assert sc.ndtr(x.astype(np.float32)).dtype == np.float32
+    assert_allclose(sc.ndtr(x.astype(np.float32)),
+                    sc.ndtr(x.astype(np.float32).astype(np.float64)),
+                    rtol=1e-7)
+    assert_equal(sc.ndtr_parallel(x), expected)
+
+
+def _diff_points(scale):
+    # Pairs spread over the line, pairs in the same tail and nearly
+    # equal pairs, where naive subtraction cancels
+    rng = np.random.RandomState(1234)
+    a = rng.uniform(-scale, scale, 1500)
+    b = np.concatenate([
+        rng.uniform(-scale, scale, 500),
+        a[500:1000] + rng.uniform(0, 3, 500),
+        a[1000:]*(1 + rng.uniform(-1, 1, 500)*10.0**rng.uniform(-15, 0, 500)),
+    ])
+    return a, b
+
+
+def test_erf_diff():
+    def mpmath_erf_diff(a, b):
+        a, b = mpmath.mpf(a), mpmath.mpf(b)
+        if min(a, b) >= 0:
+            return float(mpmath.erfc(a) - mpmath.erfc(b))
+        elif max(a, b) <= 0:
+            return float(mpmath.erfc(-b) - mpmath.erfc(-a))
+        return float(mpmath.erf(b) - mpmath.erf(a))
+
+    a, b = _diff_points(26)
+    with mpmath.workdps(40):
+        expected = np.vectorize(mpmath_erf_diff)(a, b)
+    assert_allclose(sc.erf_diff(a, b), expected, atol=0,
+                    rtol=4*np.finfo(float).eps)
+
+
+def test_ndtr_diff():
+    def mpmath_ndtr_diff(a, b):
+        a, b = mpmath.mpf(a), mpmath.mpf(b)
+        if min(a, b) >= 0:
+            return float(mpmath.ncdf(-a) - mpmath.ncdf(-b))
+        return float(mpmath.ncdf(b) - mpmath.ncdf(a))
+
+    a, b = _diff_points(37)
+    with mpmath.workdps(40):
+        expected = np.vectorize(mpmath_ndtr_diff)(a, b)
+    assert_allclose(sc.ndtr_diff(a, b), expected, atol=0,
+                    rtol=4*np.finfo(float).eps)
+
+
+def test_diff_special_cases():
+    assert_equal(sc.erf_diff([-np.inf, 0, 1, 1], [np.inf, np.inf, 1, 0]),
+                 [2, 1, 0, -sc.erf(1)])
+    assert_equal(sc.ndtr_diff([-np.inf, -np.inf], [np.inf, 0]), [1, 0.5])
+    assert np.isnan(sc.erf_diff(np.nan, 0))
+    assert np.isnan(sc.ndtr_diff(0, np.nan))
+
+
+def _mpmath_wofz(z):
+    z = mpmath.mpc(z)
+    return mpmath.exp(-z**2)*mpmath.erfc(-1j*z)
+
+
+def _complex_grid(a, n):
+    x = np.concatenate((-np.logspace(-6, np.log10(a), n)[::-1], [0],
+                        np.logspace(-6, np.log10(a), n)))
+    x, y = np.meshgrid(x, x)
+    return (x + 1j*y).ravel()
+
+
+def test_wofz():
+    # In the upper half plane w is well conditioned
+    z = _complex_grid(1e4, 40)
+    z = z[z.imag >= 0]
+    with mpmath.workdps(40):
+        expected = np.array([complex(_mpmath_wofz(z0)) for z0 in z])
+    assert_allclose(sc.wofz(z), expected, atol=0,
+                    rtol=32*np.finfo(float).eps)
+
+
+def test_wofz_lower_half_plane():
+    # exp(-z**2) limits the accuracy to about |z|**2 ε
+    z = _complex_grid(5, 30)
+    z = z[z.imag < 0]
+    with mpmath.workdps(40):
+        expected = np.array([complex(_mpmath_wofz(z0)) for z0 in z])
+    assert_allclose(sc.wofz(z), expected, atol=0,
+                    rtol=64*np.finfo(float).eps)
+
+
+def test_wofz_real_axis():
+    x = np.linspace(-30, 30, 201)
+    w = sc.wofz(x + 0j)
+    with mpmath.workdps(40):
+        expected = np.array([complex(_mpmath_wofz(x0)) for x0 in x])
+    # Skip where exp(-x**2) is subnormal
+    normal = expected.real > np.finfo(float).tiny
+    assert_allclose(w.real[normal], expected.real[normal], atol=0,
+                    rtol=2*np.finfo(float).eps)
+    assert_allclose(w.imag, expected.imag, atol=0,
+                    rtol=64*np.finfo(float).eps)
+
+
+def test_erf_complex():
+    z = _complex_grid(5, 30)
+    with mpmath.workdps(40):
+        expected = np.array([complex(mpmath.erf(mpmath.mpc(z0)))
+                             for z0 in z])
+    assert_allclose(sc.erf(z), expected, atol=0,
+                    rtol=64*np.finfo(float).eps)
+
+
+def test_erfc_complex():
+    z = _complex_grid(5, 30)
+    with mpmath.workdps(40):
+        expected = np.array([complex(mpmath.erfc(mpmath.mpc(z0)))
+                             for z0 in z])
+    assert_allclose(sc.erfc(z), expected, atol=0,
+                    rtol=64*np.finfo(float).eps)
+
+
+def test_erf_complex_axes():
+    x = np.linspace(-10, 10, 101)
+    assert_equal(sc.erf(x + 0j), sc.erf(x) + 0j)
+    assert_equal(sc.erfc(x + 0j), sc.erfc(x) + 0j)
+    erf = sc.erf(1j*x)
+    assert_equal(erf.real, 0)
+    with mpmath.workdps(40):
+        expected = np.array([complex(mpmath.erf(1j*mpmath.mpf(x0))).imag
+                             for x0 in x])
+    assert_allclose(erf.imag, expected, atol=0,
+                    rtol=32*np.finfo(float).eps)
+
+
+def test_voigt_profile():
+    def mpmath_voigt_profile(x, sigma, gamma):
+        z = mpmath.mpc(x, gamma)/(sigma*mpmath.sqrt(2))
+        return (_mpmath_wofz(z).real
+                / (sigma*mpmath.sqrt(2*mpmath.pi)))
+
+    mpmath_allclose(sc.voigt_profile, mpmath_voigt_profile,
+                    [Arg(-1e3, 1e3), Arg(1e-3, 1e3), Arg(1e-3, 1e3)],
+                    2000, 32*np.finfo(float).eps, dps=40)
+
+
+def test_voigt_profile_special_cases():
+    x = np.linspace(-5, 5, 21)
+    assert_allclose(sc.voigt_profile(x, 0, 2), 2/(np.pi*(x**2 + 4)),
+                    atol=0, rtol=np.finfo(float).eps)
+    assert_allclose(sc.voigt_profile(x, 2, 0),
+                    np.exp(-x**2/8)/(2*np.sqrt(2*np.pi)),
+                    atol=0, rtol=4*np.finfo(float).eps)
+    assert_equal(sc.voigt_profile([0, 1], 0, 0), [np.inf, 0])
+    assert_equal(sc.voigt_profile([1, 1, np.nan], [-1, 1, 1], [1, -1, 1]),
+                 np.nan)
@@ -96,3 +96,37 @@ def test_erfcinv_inverts_erfc():
     assert_allclose(sc.erfcinv(sc.erfc(x)), x, atol=0, rtol=5e-10)
     x = np.linspace(0, 2)
     assert_allclose(sc.erfc(sc.erfcinv(x)), x, atol=0, rtol=4*_ε)
+
+
+def test_ndtri_special_points():
+    assert np.isnan(sc.ndtri(np.nan))
+    assert np.all(np.isnan([sc.ndtri(-1), sc.ndtri(2)]))
+    assert sc.ndtri(0) == -np.inf
+    assert sc.ndtri(1) == np.inf
+    assert sc.ndtri(0.5) == 0
+
+
+def test_ndtri():
+    # 2p - 1 is exact in mpmath at this precision
+    def mpmath_ndtri(p):
+        return mpmath.sqrt(2)*mpmath.erfinv(2*mpmath.mpf(p) - 1)
+
+    mpmath_allclose(sc.ndtri, mpmath_ndtri, [Arg(0, 1)], 1000, 2*_ε,
+                    dps=350)
+
+
+def test_ndtri_inverts_ndtr():
+    # In the upper tail ndtr rounds to 1 and can't be inverted
+    # accurately
+    x = np.linspace(-37, 0, 200)
+    assert_allclose(sc.ndtri(sc.ndtr(x)), x, atol=0, rtol=1e-14)
+
+
+def test_ndtri_float32_and_parallel():
+    p = np.linspace(0, 1, 50)
+    expected = sc.ndtri(p)
+    assert sc.ndtri(p.astype(np.float32)).dtype == np.float32
+    assert_allclose(sc.ndtri(p.astype(np.float32)),
+                    sc.ndtri(p.astype(np.float32).astype(np.float64)),
+                    rtol=1e-7)
+    assert_allclose(sc.ndtri_parallel(p), expected, atol=0, rtol=0)
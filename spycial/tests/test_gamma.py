@@ -1,9 +1,10 @@
 import numpy as np
-from numpy.testing import assert_equal
+from numpy.testing import assert_equal, assert_allclose
 import mpmath
+import pytest
 
 import spycial as sc
-from spycial.test_utilities import Arg, mpmath_allclose
+from spycial.test_utilities import Arg, ComplexArg, mpmath_allclose
 
 
 def test_gamma():
@@ -20,8 +21,76 @@ def test_gamma():
                     [Arg(-np.inf, 180)], 1000, 1e-14)
 
 
+def _complex_points(a, n):
+    z = ComplexArg(complex(-a, -a), complex(a, a)).values(n)
+    # Avoid the poles
+    return z[(z.imag != 0) | (z.real > 0) | (z.real != np.floor(z.real))]
+
+
+def test_gamma_complex():
+    # Compare the moduli of the errors; the real or imaginary part
+    # alone can be much smaller than the result. The error grows like
+    # the condition number |z*digamma(z)|.
+    for a, rtol in [(10, 1e-14), (150, 5e-13)]:
+        z = _complex_points(a, 2000)
+        expected = np.vectorize(lambda z0: complex(mpmath.gamma(z0)))(z)
+        assert_allclose(sc.gamma(z), expected, atol=0, rtol=rtol)
+
+
+def test_gamma_complex_poles():
+    z = np.array([complex(-3, 0), complex(0, 0)])
+    assert np.all(np.isnan(sc.gamma(z)))
+
+
+def test_rgamma():
+    mpmath_allclose(sc.rgamma, mpmath.rgamma, [Arg(-300, 300)], 1000,
+                    1e-13)
+
+
+def test_rgamma_special_cases():
+    x = np.array([-np.inf, -100.0, -1.0, -0.0, 0.0, 5e-324, np.inf, np.nan])
+    expected = [np.nan, 0.0, 0.0, -0.0, 0.0, 5e-324, 0.0, np.nan]
+    assert_equal(sc.rgamma(x), expected)
+    assert_equal(sc.rgamma(complex(-3, 0)), 0)
+
+
+def test_rgamma_complex():
+    for a, rtol in [(10, 1e-14), (150, 5e-13)]:
+        z = ComplexArg(complex(-a, -a), complex(a, a)).values(2000)
+        expected = np.vectorize(lambda z0: complex(mpmath.rgamma(z0)))(z)
+        assert_allclose(sc.rgamma(z), expected, atol=0, rtol=rtol)
+
+
 def test_gamma_int():
     # These values are hard-coded, so they should be exactly correct
     x = np.arange(1, 11, dtype=np.float64)
     y = [float(mpmath.factorial(x0 - 1)) for x0 in x]
     assert_equal(sc.gamma(x), y)
+
+
+def test_gamma_large_negative():
+    # Arg() doesn't put any points in this range.
+    mpmath_allclose(sc.gamma, mpmath.gamma,
+                    [Arg(-170.5, -20, inclusive_b=False)], 200, 1e-13)
+
+
+def test_gamma_progression():
+    x0 = np.array([1e-3, 0.5, 1.0, 3.7, -7.5, -50.001, -100.3])
+    for h in [1, 3]:
+        x = x0[:, None] + h*np.arange(60)
+        # Gamma is ill-conditioned for large |x|, so the rounding
+        # error in x0 + k*h dominates the tolerance.
+        assert_allclose(sc.gamma_progression(x0, 60, h), sc.gamma(x),
+                        atol=0, rtol=2e-13)
+
+
+def test_gamma_progression_poles():
+    res = sc.gamma_progression(-3.0, 6)
+    assert np.all(np.isnan(res[:4]))
+    assert_equal(res[4:], [1.0, 1.0])
+
+
+def test_gamma_progression_shape():
+    assert sc.gamma_progression(np.ones((2, 3)), 5).shape == (2, 3, 5)
+    with pytest.raises(ValueError):
+        sc.gamma_progression(1.0, 5, h=0.5)
@@ -0,0 +1,71 @@
+import numpy as np
+from numpy.testing import assert_allclose
+import mpmath
+
+import spycial as sc
+from spycial.constants import _ε
+from spycial.gammainv import XMIN
+
+
+def test_gamma_inv_special_cases():
+    assert np.isnan(sc.gamma_inv(np.nan))
+    assert np.isnan(sc.gamma_inv(0.5))
+    assert sc.gamma_inv(np.inf) == np.inf
+
+
+def test_gamma_inv_factorials():
+    x = np.arange(2, 20, dtype=np.float64)
+    assert_allclose(sc.gamma_inv(sc.gamma(x)), x, atol=0, rtol=4*_ε)
+
+
+def test_gamma_inv_inverts_gamma():
+    x = np.linspace(1.5, 170, 500)
+    assert_allclose(sc.gamma_inv(sc.gamma(x)), x, atol=0, rtol=4*_ε)
+
+
+def test_gamma_inv_sqrt_2π():
+    # Regression test: the initial guess used to be 0/0 here.
+    with mpmath.workdps(40):
+        y = mpmath.sqrt(2*mpmath.pi)
+        x = float(mpmath.findroot(lambda t: mpmath.gamma(t) - y, 3))
+    assert_allclose(sc.gamma_inv(np.sqrt(2*np.pi)), x, atol=0, rtol=4*_ε)
+
+
+def test_lgamma_inv_special_cases():
+    assert np.isnan(sc.lgamma_inv(np.nan))
+    assert np.isnan(sc.lgamma_inv(-0.2))
+    assert sc.lgamma_inv(np.inf) == np.inf
+
+
+def test_lgamma_inv():
+    y = np.array([-0.1, 0.0, 0.5, 0.9189385332046727, 1.0, 10.0, 1e3,
+                  1e10, 1e100])
+    with mpmath.workdps(40):
+        x = [
+            float(mpmath.findroot(lambda t: mpmath.loggamma(t) - y0,
+                                  float(sc.lgamma_inv(y0)),
+                                  solver='newton', df=mpmath.digamma))
+            for y0 in y
+        ]
+    assert_allclose(sc.lgamma_inv(y), x, atol=0, rtol=4*_ε)
+
+
+def test_lgamma_inv_inverts_lgamma():
+    x = np.logspace(np.log10(1.5), 300, 500)
+    assert_allclose(sc.lgamma_inv(sc.lgamma(x)), x, atol=0, rtol=4*_ε)
+    # Close to the minimum the inverse is badly conditioned, so check
+    # the other direction. Lgamma has a root at x = 2, so relative
+    # error is meaningless there. The tolerance accounts for the
+    # condition number x*ψ(x) of lgamma.
+    y = np.linspace(-0.12, 10, 500)
+    assert_allclose(sc.lgamma(sc.lgamma_inv(y)), y, atol=4*_ε,
+                    rtol=8*_ε)
+
+
+def test_lgamma_inv_around_log_sqrt_2π():
+    # The Stirling-based initial guess is most delicate where
+    # Γ(x) = √(2π).
+    y = np.linspace(0.8, 1.1, 2000)
+    x = sc.lgamma_inv(y)
+    assert np.all(x > XMIN + 1)
+    assert_allclose(sc.lgamma(x), y, atol=0, rtol=4*_ε)
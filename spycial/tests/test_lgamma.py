@@ -1,4 +1,7 @@
+import math
+
 import numpy as np
+from numpy.testing import assert_allclose, assert_equal
 import mpmath
 
 import spycial as sc
@@ -24,6 +27,15 @@ def test_loggamma_complex():
                      1000, 5e-12)
 
 
+def test_loggamma_complex_small():
+    # The region around the origin that uses the Lanczos
+    # approximation and the reflection formula
+    z = ComplexArg(complex(-8, -8), complex(8, 8)).values(2000)
+    z = z[(z.imag != 0) | (z.real > 0) | (z.real != np.floor(z.real))]
+    expected = np.vectorize(lambda z0: complex(mpmath.loggamma(z0)))(z)
+    assert_allclose(sc.loggamma(z), expected, atol=0, rtol=5e-14)
+
+
 def test_loggamma_recurrence():
     # Test the identity loggamma(z + 1) = log(z) + loggamma(z)
     x = np.array([-99.5, -9.5, -0.5, 0.5, 9.5, 99.5])
@@ -53,3 +65,122 @@ def test_lgamma():
 
     mpmath_allclose(sc.lgamma, mpmath_lgamma,
                     [Arg()], 1000, 5e-14)
+
+
+def test_lgamma_progression():
+    x0 = np.array([1e-3, 0.5, 1.0, 3.7, -7.5, -50.001, -100.3, 1e10])
+    for h in [1, 3, 10**6]:
+        x = x0[:, None] + h*np.arange(60)
+        assert_allclose(sc.lgamma_progression(x0, 60, h), sc.lgamma(x),
+                        atol=1e-13, rtol=1e-13)
+
+
+def test_lgamma_progression_poles():
+    res = sc.lgamma_progression(-3.0, 6)
+    assert_equal(res, [np.inf, np.inf, np.inf, np.inf, 0.0, 0.0])
+
+
+def test_lgamma_sum():
+    rng = np.random.RandomState(1234)
+    x = rng.gamma(2.0, 50.0, size=(4, 10000))
+    expected = [math.fsum(math.lgamma(x0) for x0 in row) for row in x]
+    assert_allclose(sc.lgamma_sum(x), expected, atol=0, rtol=1e-15)
+    assert_allclose(sc.lgamma_sum(x.T, axis=0), expected, atol=0,
+                    rtol=1e-15)
+
+
+def test_lgamma_sum_special_cases():
+    assert_equal(sc.lgamma_sum(np.array([])), 0.0)
+    assert_equal(sc.lgamma_sum(np.array([1.0, 0.0, 2.0])), np.inf)
+    assert np.isnan(sc.lgamma_sum(np.array([1.0, np.nan])))
+
+
+def test_lgamma_diff_sum():
+    rng = np.random.RandomState(1234)
+    x = rng.gamma(2.0, 50.0, size=(4, 10000))
+    a = np.array([0.1, 1.5, 20.0, 1000.0])
+    expected = [
+        math.fsum(math.lgamma(x0 + a0) - math.lgamma(x0) for x0 in row)
+        for row, a0 in zip(x, a)
+    ]
+    assert_allclose(sc.lgamma_diff_sum(x, a), expected, atol=0, rtol=1e-13)
+    assert_allclose(sc.lgamma_diff_sum(x.T, a, axis=0), expected, atol=0,
+                    rtol=1e-13)
+
+
+def _mpmath_lgamma_diff(x, a):
+    x, a = mpmath.mpf(x), mpmath.mpf(a)
+    return mpmath.loggamma(x + a) - mpmath.loggamma(x)
+
+
+def test_lgamma_diff():
+    mpmath_allclose(sc.lgamma_diff, _mpmath_lgamma_diff,
+                    [Arg(0, 1e15, inclusive_a=False), Arg(0, 1e15)],
+                    2000, 1e-13, dps=60)
+
+
+def test_lgamma_diff_small_shift():
+    # Subtracting two values of lgamma loses all the digits here
+    x = np.logspace(1, 15, 50)
+    a = np.logspace(-15, 0, 20)[:, None]
+    a = np.vstack((a, -a))
+    expected = np.vectorize(
+        lambda x0, a0: float(_mpmath_lgamma_diff(x0, a0))
+    )
+    with mpmath.workdps(60):
+        assert_allclose(sc.lgamma_diff(x, a), expected(x, a), atol=0,
+                        rtol=1e-14)
+
+
+def test_lgamma_diff_negative_shift():
+    x = np.logspace(-3, 10, 40)
+    a = -x*np.linspace(0, 0.99, 20)[:, None]
+    expected = np.vectorize(
+        lambda x0, a0: float(_mpmath_lgamma_diff(x0, a0))
+    )
+    with mpmath.workdps(60):
+        # Near the minimum of Gamma the result is small compared to
+        # the terms of the recurrence.
+        assert_allclose(sc.lgamma_diff(x, a), expected(x, a), atol=1e-16,
+                        rtol=2e-13)
+
+
+def test_lgamma_diff_negative_arguments():
+    x = np.array([-2.5, -3.0, 4.0, -0.5])
+    a = np.array([1.0, 2.0, -6.5, -0.25])
+    expected = [0.0]*4
+    with mpmath.workdps(30):
+        for i, (x0, a0) in enumerate(zip(x, a)):
+            if x0 == -3.0:
+                # Ratio of the residues of Gamma at -1 and -3
+                expected[i] = np.log(6.0)
+            else:
+                expected[i] = float(
+                    mpmath.log(abs(mpmath.gamma(x0 + a0)/mpmath.gamma(x0)))
+                )
+    assert_allclose(sc.lgamma_diff(x, a), expected, atol=0, rtol=1e-14)
+
+
+def test_multigammaln():
+    def mpmath_multigammaln(a, d):
+        a = mpmath.mpf(a)
+        terms = [mpmath.loggamma(a - mpmath.mpf(j)/2) for j in range(d)]
+        return d*(d - 1)/4*mpmath.log(mpmath.pi) + mpmath.fsum(terms)
+
+    d = np.array([1, 2, 3, 4, 7, 10, 51, 200, 1000])
+    offset = np.array([1e-12, 0.3, 1.0, 2.5, 10.0, 1e3, 1e8, 1e200])
+    a = 0.5*(d - 1) + offset[:, None]
+    with mpmath.workdps(40):
+        expected = np.vectorize(
+            lambda a0, d0: float(mpmath_multigammaln(a0, int(d0)))
+        )(a, d)
+    assert_allclose(sc.multigammaln(a, d), expected, atol=0, rtol=2e-14)
+
+
+def test_multigammaln_special_cases():
+    assert_equal(sc.multigammaln(2.5, 0), 0.0)
+    assert_equal(sc.multigammaln(2.5, 1), sc.lgamma(2.5))
+    assert np.isnan(sc.multigammaln(1.0, 3))
+    assert np.isnan(sc.multigammaln(2.5, -1))
+    assert np.isnan(sc.multigammaln(np.nan, 2))
+    assert_equal(sc.multigammaln(np.inf, 2), np.inf)
@@ -0,0 +1,70 @@
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
+import mpmath
+
+import spycial as sc
+from spycial.test_utilities import Arg, mpmath_allclose
+
+
+def test_poch():
+    # The error is dominated by exp(t) with t up to ~700
+    mpmath_allclose(sc.poch, mpmath.rf, [Arg(0, 1e3), Arg(0, 1e3)],
+                    2000, 2e-13, dps=40)
+
+
+def test_poch_negative_increment():
+    def mpmath_poch(a, x):
+        # Use the rounded value of a + x; otherwise the error from
+        # rounding it near a pole swamps everything else.
+        b = a + x
+        if b < 0 and b == int(b):
+            return np.inf
+        return mpmath.gammaprod([b], [a])
+
+    mpmath_allclose(sc.poch, mpmath_poch, [Arg(1e-3, 300), Arg(-100, 0)],
+                    2000, 2e-13, dps=40)
+
+
+def test_poch_integer_increment():
+    a = np.array([-3.0, -2.5, 0.0, 0.5, 1.0, 7.25])
+    x = np.arange(1, 8, dtype=np.float64)[:, None]
+    expected = np.array([[float(mpmath.rf(a0, x0)) for a0 in a]
+                         for x0 in x[:, 0]])
+    assert_allclose(sc.poch(a, x), expected, atol=0, rtol=1e-15)
+
+
+def test_poch_no_overflow():
+    # Gamma(a + x) overflows but the ratio doesn't
+    a = np.array([200.0, 500.0, 1e5])
+    x = np.array([5.5, 10.25, 30.5])
+    expected = [float(mpmath.rf(a0, x0)) for a0, x0 in zip(a, x)]
+    assert_allclose(sc.poch(a, x), expected, atol=0, rtol=1e-13)
+
+
+def test_gamma_ratio():
+    def mpmath_gamma_ratio(a, b):
+        try:
+            return mpmath.gammaprod([a], [b])
+        except ValueError:
+            return np.nan
+
+    mpmath_allclose(sc.gamma_ratio, mpmath_gamma_ratio,
+                    [Arg(0, 200), Arg(0, 200)], 2000, 1e-13, dps=40)
+
+
+def test_gamma_ratio_reflection():
+    a = np.array([-20.5, -3.25, -0.5, 0.75, 30.5, 160.25])[:, None]
+    b = a + np.array([-4.5, -0.75, 0.3, 2.0])
+    expected = np.vectorize(
+        lambda a0, b0: float(mpmath.gammaprod([a0], [b0]))
+    )(a, b)
+    assert_allclose(sc.gamma_ratio(a, b), expected, atol=0, rtol=1e-13)
+
+
+def test_gamma_ratio_poles():
+    # Γ(-m)/Γ(-k) is the ratio of the residues (-1)**(m - k) k!/m!
+    assert_allclose(sc.gamma_ratio(-3.0, -1.0), 1.0/6.0, rtol=1e-15)
+    assert_allclose(sc.gamma_ratio(-1.0, -4.0), -24.0, rtol=1e-15)
+    assert_equal(sc.gamma_ratio(2.5, -2.0), 0.0)
+    assert_equal(sc.gamma_ratio(-2.0, 2.5), np.inf)
+    assert np.isnan(sc.gamma_ratio(np.nan, 1.0))
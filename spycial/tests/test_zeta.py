@@ -1,5 +1,5 @@
 import numpy as np
-from numpy.testing import assert_allclose
+from numpy.testing import assert_allclose, assert_equal
 import mpmath
 
 import spycial as sc
@@ -67,3 +67,111 @@ def test_zeta_greater_than_56():
     # decreases to 1, if we are exactly correct to double precision at
     # 56, then we should be exactly correct for all larger numbers.
     assert sc.zeta(56) == np.float64(mpmath.zeta(56))
+
+
+def test_hurwitz_zeta_special_cases():
+    assert sc.hurwitz_zeta(1, 0.5) == np.inf
+    assert np.isnan(sc.hurwitz_zeta(0.5, 0.5))
+    assert sc.hurwitz_zeta(2, 0) == np.inf
+    assert sc.hurwitz_zeta(2, -3) == np.inf
+    assert np.isnan(sc.hurwitz_zeta(2.5, -0.5))
+    assert sc.hurwitz_zeta(2, np.inf) == 0
+    assert sc.hurwitz_zeta(np.inf, 1) == 1
+
+
+def test_hurwitz_zeta_reduces_to_zeta():
+    s = np.linspace(1.5, 60, 50)
+    assert_allclose(sc.hurwitz_zeta(s, 1), sc.zeta(s), atol=0, rtol=4*_ε)
+
+
+def test_hurwitz_zeta():
+    mpmath_allclose(
+        sc.hurwitz_zeta,
+        mpmath.zeta,
+        # Keep a small enough that the results don't become subnormal
+        [Arg(1, 100, inclusive_a=False), Arg(0, 1e3, inclusive_a=False)],
+        200,
+        rtol=4*_ε,
+        # Mpmath loses precision for large s and a.
+        dps=400,
+    )
+
+
+def test_hurwitz_zeta_negative_a():
+    # For odd s there is cancellation between the terms on either
+    # side of zero, so only check even s.
+    s = np.array([2.0, 4.0, 10.0])
+    a = np.array([-0.5, -3.3, -20.7])
+    s, a = np.meshgrid(s, a)
+    with mpmath.workdps(40):
+        expected = np.vectorize(lambda s0, a0: float(mpmath.zeta(s0, a0)))(s, a)
+    assert_allclose(sc.hurwitz_zeta(s, a), expected, atol=0, rtol=1e-13)
+
+
+def mpmath_zeta_array(s):
+    with mpmath.workdps(30):
+        return np.array([complex(mpmath.zeta(s0)) for s0 in s.ravel()])
+
+
+def test_zeta_complex():
+    x = np.linspace(-20, 20, 21)
+    y = np.array([-300, -20, -1, 1e-3, 3, 50, 1000])
+    x, y = np.meshgrid(x, y)
+    s = (x + 1j*y).ravel()
+    expected = mpmath_zeta_array(s)
+    # Scale the tolerance by |s| to account for the rounding error in
+    # the phases of n**-s.
+    atol = 1e-14*np.abs(s)*np.maximum(np.abs(expected), 1)
+    assert np.all(np.abs(sc.zeta(s) - expected) <= atol)
+
+
+def test_zeta_complex_real_axis():
+    s = np.linspace(-30, 30, 101)
+    assert_equal(sc.zeta(s + 0j), sc.zeta(s) + 0j)
+
+
+def test_zeta_complex_special_cases():
+    assert np.isnan(sc.zeta(complex(np.nan, 0)))
+    assert np.isnan(sc.zeta(complex(1, 0)))
+
+
+def test_zeta_critical_line_riemann_siegel():
+    t = np.array([1e4, 12345.678, -1e5, 1e5 + 0.3, 1e6])
+    expected = mpmath_zeta_array(0.5 + 1j*t)
+    # The Riemann-Siegel formula loses accuracy proportional to t
+    # because of the rounding error in the phase t*log(n).
+    atol = 1e-14*np.abs(t)
+    assert np.all(np.abs(sc.zeta(0.5 + 1j*t) - expected) <= atol)
+    assert np.all(np.abs(sc.zeta_critical_line(t) - expected) <= atol)
+
+
+def test_zeta_critical_line_first_zero():
+    t = 14.134725141734693790
+    assert abs(sc.zeta_critical_line(np.array([t]))[0]) < 1e-14
+
+
+def test_zeta_critical_line_equally_spaced():
+    t = np.linspace(1e5, 1e5 + 10, 1001)
+    assert_allclose(
+        sc.zeta_critical_line(t),
+        sc.zeta(0.5 + 1j*t),
+        atol=1e-9,
+        rtol=0,
+    )
+    idx = np.arange(0, 1001, 100)
+    assert_allclose(
+        sc.zeta_critical_line(t)[idx],
+        mpmath_zeta_array(0.5 + 1j*t[idx]),
+        atol=1e-9,
+        rtol=0,
+    )
+
+
+def test_zeta_critical_line_unequally_spaced():
+    t = np.hstack((np.linspace(-100, 100, 50), np.logspace(4, 6, 50)))
+    assert_allclose(
+        sc.zeta_critical_line(t),
+        sc.zeta(0.5 + 1j*t),
+        atol=1e-14,
+        rtol=0,
+    )
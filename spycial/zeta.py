@@ -6,16 +6,30 @@ Boost Software License, Version 1.0. (See accompanying file
 LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
 
 """
-from numba import njit, vectorize
+import numba
+from numba import njit, generated_jit, vectorize, guvectorize
 import numpy as np
 
 from . import settings
 from .evalpoly import _devalpoly
 from .lanczos import _lanczos_g, _lanczos_sum_expg_scaled
 from .gamma import _dgamma
-from .trig import _dsinpi
-from .constants import sqrt_2_π, _2π, _2πe, _log2π_2, _root_ε
-
+from .trig import _dsinpi, _csinpi
+from .lgamma import _cloggamma
+from .riemann_siegel import (
+    RS_THRESHOLD,
+    _siegel_theta,
+    _siegel_remainder,
+    _zeta_critical_line_rs,
+)
+from .constants import (
+    sqrt_2_π, _π, _2π, _2πe, _logπ, _log2π_2, _root_ε, _ε,
+)
+
+
+# Number of points between recomputing the phases in
+# `zeta_critical_line`
+RS_RESEED = 32
 
 # The nth entry is the value of zeta(2n)
 ZETA_EVEN_INTEGERS = np.array([
@@ -176,6 +190,25 @@ Q36 = np.array([
 ])
 
 
+# The (j - 1)th entry is B[2j]/(2j)!, where B[2j] is the (2j)th
+# Bernoulli number. These are the coefficients of the Euler-Maclaurin
+# tail in the Hurwitz zeta function.
+HURWITZ_EM_COEFFS = np.array([
+    0.083333333333333333333,
+    -0.0013888888888888888889,
+    0.000033068783068783068783,
+    -8.2671957671957671958e-7,
+    2.0876756987868098979e-8,
+    -5.2841901386874931848e-10,
+    1.3382536530684678833e-11,
+    -3.3896802963225828668e-13,
+    8.5860620562778445641e-15,
+    -2.174868698558061873e-16,
+    5.5090028283602295152e-18,
+    -1.3954464685812523341e-19
+])
+
+
 @njit('float64(float64)', cache=settings.CACHE)
 def _zeta_between_1_and_2(sc):
     # sc = 1 - s.
@@ -266,7 +299,7 @@ def _zeta_negative_arguments(s):
 
 
 @njit('float64(float64)', cache=settings.CACHE)
-def _zeta(s):
+def _dzeta(s):
     if np.isnan(s):
         return s
     elif s == 1:
@@ -294,15 +327,159 @@ def _zeta(s):
     return _zeta_negative_arguments(s)
 
 
-@vectorize(['float64(float64)'], nopython=True, cache=settings.CACHE)
+@njit('float64(float64, float64)', cache=settings.CACHE)
+def _hurwitz_zeta(s, a):
+    """Hurwitz zeta function for s > 1.
+
+    Sum the first few terms directly until a + N is large, then use
+    the Euler-Maclaurin formula for the tail; see DLMF 25.11.5.
+
+    """
+    if np.isnan(s) or np.isnan(a):
+        return np.nan
+    elif s == 1:
+        return np.inf
+    elif s < 1:
+        return np.nan
+    elif a <= 0:
+        if a == np.floor(a):
+            # Pole
+            return np.inf
+        elif s != np.floor(s) or a == -np.inf:
+            # The terms (a + k)**-s are not real
+            return np.nan
+    elif a == np.inf:
+        return 0.0
+
+    if s == np.inf:
+        if a < 1:
+            return np.inf
+        elif a == 1:
+            return 1.0
+        else:
+            return 0.0
+
+    w = a
+    res = w**-s
+    while w < s + 10.0:
+        w += 1.0
+        term = w**-s
+        res += term
+        if w > 0 and abs(term) < _ε*abs(res):
+            return res
+
+    # We already summed f(w) = w**-s, so only half of it belongs to
+    # the tail.
+    wps = w**-s
+    res += w*wps/(s - 1) - 0.5*wps
+    fac = s
+    wpow = wps/w
+    for j in range(len(HURWITZ_EM_COEFFS)):
+        term = HURWITZ_EM_COEFFS[j]*fac*wpow
+        res += term
+        if abs(term) < _ε*abs(res):
+            break
+        fac *= (s + 2*j + 1)*(s + 2*j + 2)
+        wpow /= w*w
+    return res
+
+
+@njit('complex128(complex128)', cache=settings.CACHE)
+def _czeta_euler_maclaurin(s):
+    """Euler-Maclaurin summation for complex s; see DLMF 25.2.9.
+
+    The cutoff N is chosen so that |s|/(2πN) is small, which makes
+    the cost proportional to |s|.
+
+    """
+    N = np.floor(abs(s)) + 10.0
+    res = 0.0j
+    k = 1.0
+    while k <= N:
+        res += np.exp(-s*np.log(k))
+        k += 1.0
+
+    # As in the Hurwitz zeta function, half of N**-s belongs to the
+    # tail.
+    logN = np.log(N)
+    Nps = np.exp(-s*logN)
+    res += N*Nps/(s - 1) - 0.5*Nps
+    fac = s
+    Npow = Nps/N
+    for j in range(len(HURWITZ_EM_COEFFS)):
+        term = HURWITZ_EM_COEFFS[j]*fac*Npow
+        res += term
+        if abs(term) < _ε*abs(res):
+            break
+        fac *= (s + 2*j + 1)*(s + 2*j + 2)
+        Npow /= N*N
+    return res
+
+
+@njit('complex128(complex128)', cache=settings.CACHE)
+def _clogsinpi(z):
+    """Compute log(sin(πz)) up to a multiple of 2πi.
+
+    For large |Im(z)| sin(πz) overflows, but one of the exponentials
+    in its definition is negligible, so the logarithm can be written
+    down directly.
+
+    """
+    if z.imag > 20:
+        return np.complex(-0.6931471805599453, 0.5*_π) - 1j*_π*z
+    elif z.imag < -20:
+        return np.complex(-0.6931471805599453, -0.5*_π) + 1j*_π*z
+    return np.log(_csinpi(z))
+
+
+@njit('complex128(complex128)', cache=settings.CACHE)
+def _czeta(s):
+    if np.isnan(s):
+        return np.complex(np.nan, np.nan)
+    elif s.imag == 0:
+        return np.complex(_dzeta(s.real), 0.0)
+    elif s.real == 0.5 and abs(s.imag) >= RS_THRESHOLD:
+        return _zeta_critical_line_rs(s.imag)
+    elif s.real < 0:
+        # Reflection formula (DLMF 25.4.2). The factors are combined
+        # in log space because sin(πs/2) and Γ(1 - s) grow and decay
+        # exponentially in |Im(s)|.
+        logfac = (
+            s*np.log(2.0) + (s - 1)*_logπ
+            + _cloggamma(1 - s) + _clogsinpi(0.5*s)
+        )
+        return np.exp(logfac)*_czeta_euler_maclaurin(1 - s)
+    return _czeta_euler_maclaurin(s)
+
+
+@generated_jit(nopython=True, cache=settings.CACHE)
+def _zeta(s):
+    if s == numba.types.float64:
+        return lambda s: _dzeta(s)
+    elif s == numba.types.complex128:
+        return lambda s: _czeta(s)
+
+
+@vectorize(
+    ['float64(float64)', 'complex128(complex128)'],
+    nopython=True,
+    cache=settings.CACHE,
+)
 def zeta(s):
-    """Riemann zeta function.
+    r"""Riemann zeta function.
+
+    For complex arguments with real part less than 0 the reflection
+    formula is used, and on the critical line with :math:`|t| \geq
+    10^4` the Riemann-Siegel formula is used. Otherwise the cost of
+    evaluating at complex `s` grows linearly with :math:`|s|`. To
+    evaluate many points on the critical line use
+    `zeta_critical_line`.
 
     Parameters
     ----------
 
     s: array-like
-        Points on the real line
+        Points on the real line or complex plane
     out: ndarray, optional
         Output array for the values of `zeta` at `s`
 
@@ -311,5 +488,156 @@ def zeta(s):
     ndarray
         Values of `zeta` at `s`
 
+    See Also
+    --------
+    zeta_critical_line: Evaluate zeta on grids on the critical line
+
     """
     return _zeta(s)
+
+
+@guvectorize(
+    ['void(float64[:], complex128[:])'],
+    '(m)->(m)',
+    nopython=True,
+    cache=settings.CACHE,
+)
+def zeta_critical_line(t, out):
+    r"""Riemann zeta function on the critical line.
+
+    Computes :math:`\zeta(1/2 + it)` for a grid of points `t` along
+    the last axis. Points with :math:`|t| \geq 10^4` are evaluated
+    with the Riemann-Siegel formula, sharing the terms
+    :math:`n^{-1/2}` and :math:`\log(n)` of the main sum between all
+    points in the grid. If the grid is equally spaced, then the
+    phases :math:`n^{-it}` are also updated from one point to the next
+    by a rotation instead of being recomputed, which makes this much
+    faster than calling `zeta` at each point.
+
+    Parameters
+    ----------
+    t : array-like
+        Imaginary parts of the points on the critical line; the last
+        axis is the grid
+    out : ndarray, optional
+        Output array for the values of `zeta_critical_line` at `t`
+
+    Returns
+    -------
+    ndarray
+        Values of :math:`\zeta(1/2 + it)`
+
+    See Also
+    --------
+    zeta: Riemann zeta function
+
+    """
+    m = t.shape[0]
+    tmax = 0.0
+    for j in range(m):
+        abst = abs(t[j])
+        if abst >= RS_THRESHOLD and abst < np.inf:
+            tmax = max(tmax, abst)
+        else:
+            out[j] = _czeta(np.complex(0.5, t[j]))
+    if tmax == 0.0:
+        return
+
+    Nmax = np.intc(np.sqrt(tmax/_2π))
+    logn = np.empty(Nmax)
+    rsqrtn = np.empty(Nmax)
+    for n in range(Nmax):
+        logn[n] = np.log(n + 1.0)
+        rsqrtn[n] = 1.0/np.sqrt(n + 1.0)
+
+    uniform = m >= 3 and min(t[0], t[m - 1]) >= RS_THRESHOLD
+    if uniform:
+        h = (t[m - 1] - t[0])/(m - 1)
+        for j in range(m):
+            if abs(t[j] - (t[0] + j*h)) > 4*_ε*abs(t[j]):
+                uniform = False
+                break
+
+    if not uniform:
+        for j in range(m):
+            abst = abs(t[j])
+            if abst < RS_THRESHOLD or abst == np.inf:
+                continue
+            theta = _siegel_theta(abst)
+            N = np.intc(np.sqrt(abst/_2π))
+            S = 0.0
+            for n in range(N):
+                S += rsqrtn[n]*np.cos(theta - abst*logn[n])
+            Z = 2.0*S + _siegel_remainder(abst)
+            res = np.exp(-1j*theta)*Z
+            if t[j] < 0:
+                res = res.conjugate()
+            out[j] = res
+        return
+
+    # Equally spaced grid; rotate the phases exp(-it log(n)) from one
+    # point to the next and periodically recompute them to avoid
+    # accumulating rounding errors.
+    rot = np.empty(Nmax, dtype=np.complex128)
+    phase = np.empty(Nmax, dtype=np.complex128)
+    for n in range(Nmax):
+        rot[n] = np.exp(-1j*h*logn[n])
+    ninit = 0
+    for j in range(m):
+        tj = t[j]
+        N = np.intc(np.sqrt(tj/_2π))
+        if j % RS_RESEED == 0:
+            ninit = 0
+        else:
+            for n in range(ninit):
+                phase[n] *= rot[n]
+        for n in range(ninit, N):
+            phase[n] = np.exp(-1j*tj*logn[n])
+        ninit = max(ninit, N)
+
+        S = 0.0j
+        for n in range(N):
+            S += rsqrtn[n]*phase[n]
+        theta = _siegel_theta(tj)
+        eitheta = np.exp(1j*theta)
+        Z = 2.0*(eitheta*S).real + _siegel_remainder(tj)
+        out[j] = eitheta.conjugate()*Z
+
+
+@vectorize(['float64(float64, float64)'], nopython=True, cache=settings.CACHE)
+def hurwitz_zeta(s, a):
+    r"""Hurwitz zeta function.
+
+    For :math:`s > 1` the Hurwitz zeta function is defined as [1]_
+
+    .. math::
+
+        \zeta(s, a) = \sum_{k = 0}^\infty \frac{1}{(k + a)^s}.
+
+    Negative `a` are only supported when `s` is an integer.
+
+    Parameters
+    ----------
+    s: array-like
+        Points on the real line greater than 1
+    a: array-like
+        Points on the real line
+    out: ndarray, optional
+        Output array for the values of `hurwitz_zeta` at `s` and `a`
+
+    Returns
+    -------
+    ndarray
+        Values of `hurwitz_zeta` at `s` and `a`
+
+    See Also
+    --------
+    zeta: Riemann zeta function, equal to `hurwitz_zeta(s, 1)`
+
+    References
+    ----------
+    .. [1] Digital Library of Mathematical Functions, 25.11.1
+           https://dlmf.nist.gov/25.11#E1
+
+    """
+    return _hurwitz_zeta(s, a)